@@ -8,6 +8,9 @@ from utils.exceptions import ResourceNotFoundError, DatabaseError, ValidationErr
 
 logger = logging.getLogger(__name__)
 
+# Fields bills can be sorted by
+SORT_KEYS = frozenset(('bill_number', 'bill_title', 'sponsor', 'introduced_date', 'status', 'congress'))
+
 @bp.route('/bills/congresses', methods=['GET'])
 def congresses():
     """
@@ -83,7 +86,7 @@ def bills():
         
         # Get sort parameters
         sort_params = get_sort_params(
-            allowed_keys=['bill_number', 'bill_title', 'sponsor', 'introduced_date', 'status', 'congress'],
+            allowed_keys=SORT_KEYS,
             default_key='introduced_date',
             default_direction='desc'
         )
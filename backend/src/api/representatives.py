@@ -7,6 +7,12 @@ from utils.exceptions import ResourceNotFoundError, DatabaseError
 
 logger = logging.getLogger(__name__)
 
+# Fields representatives can be sorted by
+SORT_KEYS = frozenset((
+    'full_name', 'chamber', 'party', 'leadership_role', 'state', 'district',
+    'total_votes', 'missed_votes', 'total_present'
+))
+
 @bp.route('/representatives', methods=['GET'])
 def representatives():
     """
@@ -42,8 +48,7 @@ def representatives():
         
         # Get sort parameters
         sort_params = get_sort_params(
-            allowed_keys=['full_name', 'chamber', 'party', 'leadership_role', 'state', 'district', 
-                          'total_votes', 'missed_votes', 'total_present'],
+            allowed_keys=SORT_KEYS,
             default_key='full_name',
             default_direction='asc'
         )
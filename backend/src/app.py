@@ -21,6 +21,8 @@ def create_app():
     
     # Configure the app
     app.config['DB_CONNECTION_STRING'] = os.environ.get('DATABASE_URL') or "postgresql://localhost/project_tacitus_test"
+    app.config['DB_POOL_MAX'] = int(os.environ.get('DB_POOL_MAX', 10))
+    app.config['DB_POOL_TIMEOUT'] = float(os.environ.get('DB_POOL_TIMEOUT', 30))
     app.config['DEBUG'] = os.environ.get('FLASK_DEBUG', 'True') == 'True'
     
     # Enable CORS with specific configuration
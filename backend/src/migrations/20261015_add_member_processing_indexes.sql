@@ -0,0 +1,8 @@
+-- Indexes supporting member detail/bio batch selection
+-- (members ordered by staleness, members missing detail fields)
+CREATE INDEX IF NOT EXISTS idx_members_last_updated
+ON members (last_updated NULLS FIRST);
+
+CREATE INDEX IF NOT EXISTS idx_members_missing_details
+ON members (bioguide_id)
+WHERE direct_order_name IS NULL;
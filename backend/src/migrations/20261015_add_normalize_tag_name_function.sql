@@ -0,0 +1,6 @@
+-- SQL counterpart of utils.tag_utils.normalize_tag_name, so tag matching can run in queries
+-- against tags.normalized_name (covered by the UNIQUE (type_id, normalized_name) index)
+CREATE OR REPLACE FUNCTION normalize_tag_name(name TEXT)
+RETURNS TEXT AS $$
+    SELECT replace(translate(lower(name), ' ,-', '___'), '&', 'and');
+$$ LANGUAGE sql IMMUTABLE;
@@ -0,0 +1,8 @@
+-- Track a hash of each member's bio text so unchanged bios can skip the update
+ALTER TABLE members
+ADD COLUMN IF NOT EXISTS profile_text_hash BYTEA;
+
+-- Backfill hashes for bios fetched before this column existed
+UPDATE members
+SET profile_text_hash = sha1(convert_to(profile_text, 'UTF8'))
+WHERE profile_text IS NOT NULL AND profile_text_hash IS NULL;
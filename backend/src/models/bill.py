@@ -37,7 +37,7 @@ def get_bills(filters, sort_params, pagination):
     Args:
         filters (dict): Dictionary of filter parameters
         sort_params (dict): Dictionary with sort_key and sort_direction
-        pagination (dict): Dictionary with page and per_page
+        pagination (dict): Dictionary with page, per_page and optional offset
     
     Returns:
         dict: Dictionary with bills data and pagination info
@@ -62,7 +62,7 @@ def get_bills(filters, sort_params, pagination):
         # Extract pagination parameters
         page = pagination.get('page', 1)
         per_page = pagination.get('per_page', 100)
-        offset = (page - 1) * per_page
+        offset = pagination['offset'] if 'offset' in pagination else (page - 1) * per_page
 
         # Extract sort parameters
         sort_key = sort_params.get('sort_key', 'introduced_date')
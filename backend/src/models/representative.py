@@ -1,11 +1,16 @@
 import logging
 import requests
 from utils.database import get_db_cursor, transaction
-from utils.helpers import serialize_dates, build_filter_clause, build_pagination_result
+from utils.helpers import serialize_dates, build_predicate_clause, build_pagination_result
 from utils.exceptions import ResourceNotFoundError, DatabaseError
 
 logger = logging.getLogger(__name__)
 
+# Columns get_representatives may filter on
+FILTER_COLUMNS = frozenset((
+    'current_member', 'full_name', 'chamber', 'party', 'leadership_role', 'state', 'district'
+))
+
 def get_representatives(filters, sort_params, pagination):
     """
     Get representatives with filtering, sorting, and pagination
@@ -13,7 +18,7 @@ def get_representatives(filters, sort_params, pagination):
     Args:
         filters (dict): Dictionary of filter parameters
         sort_params (dict): Dictionary with sort_key and sort_direction
-        pagination (dict): Dictionary with page and per_page
+        pagination (dict): Dictionary with page, per_page and optional offset
     
     Returns:
         dict: Dictionary with representatives data and pagination info
@@ -40,13 +45,10 @@ def get_representatives(filters, sort_params, pagination):
         if filter_dict['state']:
             filter_dict['state'] = f"%{filter_dict['state']}%"
         
-        # Add current_member filter
-        base_filters = {"current_member": True}
-        
         # Extract pagination parameters
         page = pagination.get('page', 1)
         per_page = pagination.get('per_page', 100)
-        offset = (page - 1) * per_page
+        offset = pagination['offset'] if 'offset' in pagination else (page - 1) * per_page
 
         # Extract sort parameters
         sort_key = sort_params.get('sort_key', 'full_name')
@@ -90,39 +92,16 @@ def get_representatives(filters, sort_params, pagination):
                 house_of_reps_count = cur.fetchone()['count']
                 logger.info(f"Found {house_count} members with chamber='House' and {house_of_reps_count} with chamber='House Of Representatives'")
         
-            # Build WHERE clause and parameters
-            where_clause, params = build_filter_clause(base_filters)
-            
-            # Add custom filters
-            custom_clauses = []
-            
-            if filter_dict['full_name']:
-                custom_clauses.append("LOWER(full_name) LIKE LOWER(%s)")
-                params.append(filter_dict['full_name'])
-            
-            if filter_dict['chamber']:
-                custom_clauses.append("chamber = %s")
-                params.append(filter_dict['chamber'])
-            
-            if filter_dict['party']:
-                custom_clauses.append("party = %s")
-                params.append(filter_dict['party'])
-            
-            if filter_dict['leadership_role']:
-                custom_clauses.append("LOWER(leadership_role) LIKE LOWER(%s)")
-                params.append(filter_dict['leadership_role'])
-            
-            if filter_dict['state']:
-                custom_clauses.append("LOWER(state) LIKE LOWER(%s)")
-                params.append(filter_dict['state'])
-            
-            if filter_dict['district']:
-                custom_clauses.append("district = %s")
-                params.append(filter_dict['district'])
-            
-            # Add custom clauses to WHERE clause
-            if custom_clauses:
-                where_clause += " AND " + " AND ".join(custom_clauses)
+            # Build WHERE clause and parameters; empty filters drop out
+            where_clause, params = build_predicate_clause({
+                'current_member': {'eq': True},
+                'full_name': {'like': filter_dict['full_name']},
+                'chamber': {'eq': filter_dict['chamber']},
+                'party': {'eq': filter_dict['party']},
+                'leadership_role': {'like': filter_dict['leadership_role']},
+                'state': {'like': filter_dict['state']},
+                'district': {'eq': filter_dict['district']}
+            }, FILTER_COLUMNS)
 
             # Get total count
             count_query = f"SELECT COUNT(*) FROM members {where_clause}"
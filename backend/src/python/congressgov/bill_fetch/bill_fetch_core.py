@@ -127,7 +127,7 @@ def update_database(cursor, bills: List[Dict[str, Any]]) -> Dict[str, int]:
     
     for bill_data in bills:
         try:
-            # Extract bill data handling both structures
+            # Extract bill data handling both structures; a malformed record only fails itself
             bill = get_bill_data(bill_data.get('bill'))
             if not bill:
                 logger.warning("Empty bill data")
@@ -141,10 +141,12 @@ def update_database(cursor, bills: List[Dict[str, Any]]) -> Dict[str, int]:
             sponsor_id = bill.get('sponsors', [{}])[0].get('bioguideId') if bill.get('sponsors') else None
             introduced_date = bill.get('introducedDate')
             congress = bill.get('congress')
-            action_text = bill.get('latestAction', {}).get('text', '')
-            action_date = bill.get('latestAction', {}).get('actionDate')
+            latest_action = bill.get('latestAction') or {}
+            action_text = latest_action.get('text', '')
+            action_date = latest_action.get('actionDate')
+            # Latest-action phrases repeat across bills; normalize_bill_status is cached per text
             normalized_status = normalize_bill_status(action_text)
-            policy_area = bill.get('policyArea', {}).get('name')
+            policy_area = (bill.get('policyArea') or {}).get('name')
             
             # Check if this is a historical bill
             bill_is_historical = is_historical_bill(congress)
@@ -1,5 +1,6 @@
 # bill_validation.py
 import os
+import json
 import psycopg2
 import logging
 import argparse
@@ -150,7 +151,6 @@ def export_validation_results(results, output_format='text'):
     filename = f"bill_validation_{timestamp}.{output_format}"
     
     if output_format == 'json':
-        import json
         with open(filename, 'w') as f:
             json.dump(results, f, indent=2)
     else:
@@ -1,9 +1,14 @@
 import os
 import json
 import psycopg2
+from psycopg2.pool import SimpleConnectionPool
 import logging
+import queue
+import atexit
 import time
+from logging.handlers import QueueHandler, QueueListener
 from dotenv import load_dotenv
+from functools import lru_cache
 from datetime import datetime
 from typing import Dict, Any, Optional
 from glob import glob
@@ -35,9 +40,13 @@ console_handler = logging.StreamHandler()
 console_handler.setLevel(logging.INFO)
 console_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
 
-# Add handlers to logger
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
+# Hand records to a background listener so file/console writes stay off the fetch loop
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+logger.addHandler(QueueHandler(log_queue))
 
 # Load environment variables
 load_dotenv()
@@ -55,6 +64,9 @@ if not DATABASE_URL:
 # Bioguide endpoint
 BIOGUIDE_ENDPOINT = "https://bioguide.congress.gov/search/bio/{bioguide_id}"
 
+# Connection pool shared by all database helpers (created lazily)
+_pool = None
+
 def setup_driver():
     """
     Set up a headless Chrome browser
@@ -114,7 +126,7 @@ def fetch_member_bio(driver: webdriver.Chrome, bioguide_id: str) -> Dict[str, An
     Fetch biographical information for a specific member using Selenium
     """
     url = BIOGUIDE_ENDPOINT.format(bioguide_id=bioguide_id)
-    logger.info(f"Fetching bio for member {bioguide_id}")
+    logger.info("Fetching bio for member %s", bioguide_id)
     
     try:
         driver.get(url)
@@ -133,17 +145,18 @@ def fetch_member_bio(driver: webdriver.Chrome, bioguide_id: str) -> Dict[str, An
             'fetchDate': datetime.now().isoformat()
         }
         
-        logger.info(f"Successfully fetched bio for {bioguide_id}")
+        logger.info("Successfully fetched bio for %s", bioguide_id)
         return bio_data
             
     except Exception as e:
-        logger.error(f"Error fetching bio for {bioguide_id}: {str(e)}")
+        logger.error("Error fetching bio for %s: %s", bioguide_id, e)
         raise
 
+@lru_cache(maxsize=32)
 def ensure_raw_directory(timestamp: str) -> str:
     """
     Ensure that the timestamped 'raw/bios' directory exists
-    Returns the path to the directory
+    Returns the path to the directory; cached, since every file in a run shares it
     """
     raw_dir = os.path.join(os.path.dirname(__file__), 'raw', timestamp, 'bios')
     os.makedirs(raw_dir, exist_ok=True)
@@ -151,76 +164,80 @@ def ensure_raw_directory(timestamp: str) -> str:
 
 def save_to_json(data: Dict[str, Any], timestamp: str, bioguide_id: str) -> str:
     """
-    Save member bio data to a JSON file in the timestamped directory
+    Append member bio data to the run's NDJSON file in the timestamped directory
     """
     raw_dir = ensure_raw_directory(timestamp)
-    filename = f"member_bio_{bioguide_id}.json"
-    file_path = os.path.join(raw_dir, filename)
+    file_path = os.path.join(raw_dir, 'bios.ndjson')
     
-    with open(file_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    with open(file_path, 'ab') as f:
+        f.write(json.dumps(data, separators=(',', ':')).encode('utf-8') + b'\n')
     
-    logger.info(f"Saved member bio data to {file_path}")
+    logger.info("Saved member bio data for %s to %s", bioguide_id, file_path)
     return file_path
 
+def get_connection_pool() -> SimpleConnectionPool:
+    """
+    Get the shared connection pool, creating it on first use
+    """
+    global _pool
+    if _pool is None:
+        _pool = SimpleConnectionPool(1, 2, DATABASE_URL)
+    return _pool
+
 def update_database_with_bio(bio_data: Dict[str, Any], bioguide_id: str):
     """
     Update the database with biographical information
     """
-    try:
-        conn = psycopg2.connect(DATABASE_URL)
-        cur = conn.cursor()
+    # Extract relevant information from bio data
+    profile_text = bio_data.get('profileText', '')
+    bio_directory = bio_data.get('bioDirectory', '')
+    bio_update_date = datetime.now()
 
-        # Extract relevant information from bio data
-        profile_text = bio_data.get('profileText', '')
-        bio_directory = bio_data.get('bioDirectory', '')
-        bio_update_date = datetime.now()
-
-        # Update the members table with bio information
-        cur.execute("""
-            UPDATE members SET
-                profile_text = %s,
-                bio_directory = %s,
-                bio_update_date = %s
-            WHERE bioguide_id = %s
-        """, (
-            profile_text,
-            bio_directory,
-            bio_update_date,
-            bioguide_id
-        ))
+    conn = None
+    try:
+        conn = get_connection_pool().getconn()
+        # The connection context commits on success and rolls back on error
+        with conn, conn.cursor() as cur:
+            # Update the members table with bio information
+            cur.execute("""
+                UPDATE members SET
+                    profile_text = %s,
+                    bio_directory = %s,
+                    bio_update_date = %s
+                WHERE bioguide_id = %s
+            """, (
+                profile_text,
+                bio_directory,
+                bio_update_date,
+                bioguide_id
+            ))
 
-        conn.commit()
-        logger.info(f"Successfully updated database with bio for member {bioguide_id}")
+        logger.info("Successfully updated database with bio for member %s", bioguide_id)
 
-    except Exception as e:
-        logger.error(f"Error updating database with member bio: {str(e)}")
-        if conn:
-            conn.rollback()
+    except psycopg2.Error as e:
+        logger.error("Error updating database with member bio: %s", e)
     finally:
         if conn:
-            cur.close()
-            conn.close()
+            get_connection_pool().putconn(conn)
 
 def get_all_bioguide_ids() -> list:
     """
     Get all bioguide IDs from the database
     """
     bioguide_ids = []
+    conn = None
     try:
-        conn = psycopg2.connect(DATABASE_URL)
-        cur = conn.cursor()
-        
-        cur.execute("SELECT bioguide_id FROM members")
-        bioguide_ids = [row[0] for row in cur.fetchall()]
-        logger.info(f"Retrieved {len(bioguide_ids)} bioguide IDs from database")
+        conn = get_connection_pool().getconn()
+        with conn, conn.cursor() as cur:
+            cur.execute("SELECT bioguide_id FROM members")
+            bioguide_ids = [row[0] for row in cur.fetchall()]
+        logger.info("Retrieved %s bioguide IDs from database", len(bioguide_ids))
         
-    except Exception as e:
-        logger.error(f"Error fetching bioguide IDs: {str(e)}")
+    except psycopg2.Error as e:
+        logger.error("Error fetching bioguide IDs: %s", e)
     finally:
         if conn:
-            cur.close()
-            conn.close()
+            get_connection_pool().putconn(conn)
     
     return bioguide_ids
 
@@ -230,7 +247,7 @@ def main():
     try:
         # Create timestamp for this run
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        logger.info(f"Using timestamp: {timestamp}")
+        logger.info("Using timestamp: %s", timestamp)
         
         # Set up the browser
         driver = setup_driver()
@@ -243,19 +260,19 @@ def main():
             logger.warning("No bioguide IDs found in database")
             return
         
-        logger.info(f"Found {len(bioguide_ids)} members to fetch bios for")
+        logger.info("Found %s members to fetch bios for", len(bioguide_ids))
         
         # Test with a single member first
         test_id = 'L000174'  # Patrick Leahy
-        logger.info(f"Testing with member {test_id}")
+        logger.info("Testing with member %s", test_id)
         try:
             bio_data = fetch_member_bio(driver, test_id)
             logger.info("Test fetch successful")
-            logger.info(f"Bio data keys: {bio_data.keys()}")
+            logger.info("Bio data keys: %s", bio_data.keys())
             save_to_json(bio_data, timestamp, test_id)
             update_database_with_bio(bio_data, test_id)
         except Exception as e:
-            logger.error(f"Test fetch failed: {str(e)}")
+            logger.error("Test fetch failed: %s", e)
             return
 
         # If test was successful, proceed with all members
@@ -270,16 +287,18 @@ def main():
                 # Add a small delay between requests
                 time.sleep(2)
             except Exception as e:
-                logger.error(f"Error processing member {bioguide_id}: {str(e)}")
+                logger.error("Error processing member %s: %s", bioguide_id, e)
                 continue
 
     except Exception as e:
-        logger.error(f"An unexpected error occurred: {str(e)}")
+        logger.error("An unexpected error occurred: %s", e)
         raise
     finally:
         if driver:
             driver.quit()
             logger.info("Browser closed")
+        if _pool:
+            _pool.closeall()
 
 if __name__ == "__main__":
     main()
@@ -1,13 +1,25 @@
 import os
+import gzip
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import psycopg2
+from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
 import logging
+import concurrent.futures
 from dotenv import load_dotenv
+from functools import lru_cache
 from datetime import datetime, date
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Iterator
 from glob import glob
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -20,8 +32,25 @@ API_KEY = os.getenv('CONGRESSGOV_API_KEY')
 MEMBERS_LIST_ENDPOINT = os.getenv('CONGRESSGOV_MEMBER_LIST_ENDPOINT')
 DATABASE_URL = os.getenv('DATABASE_URL')
 
+# Raw pages are written compact; set PRETTY_JSON=1 to indent them for debugging
+PRETTY_JSON = os.getenv('PRETTY_JSON', '').lower() in ('1', 'true', 'yes')
+
 # Constants
 RECORDS_PER_PAGE = 250
+RAW_COMPRESS_LEVEL = 3  # gzip level for raw pages; low levels are fast and JSON still shrinks several-fold
+INSERT_PAGE_SIZE = 500
+FETCH_WORKERS = 4
+
+# Keep-alive session shared by all page fetches; retries transient failures with backoff
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=FETCH_WORKERS * 2,
+    max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# Connection pool shared by all database helpers (created lazily)
+_pool = None
 
 def fetch_members_page(offset: int = 0) -> Dict[str, Any]:
     """
@@ -35,15 +64,19 @@ def fetch_members_page(offset: int = 0) -> Dict[str, Any]:
         'sort': 'updateDate desc'
     }
     
-    logger.info(f"Fetching members with offset {offset}")
-    response = requests.get(MEMBERS_LIST_ENDPOINT, params=params)
+    logger.info("Fetching members with offset %s", offset)
+    response = SESSION.get(MEMBERS_LIST_ENDPOINT, params=params)
     response.raise_for_status()
+    # Decode the raw bytes with orjson when available; this runs on the fetch worker thread
+    if orjson is not None:
+        return orjson.loads(response.content)
     return response.json()
 
+@lru_cache(maxsize=32)
 def ensure_raw_directory(timestamp: str) -> str:
     """
     Ensure that the timestamped 'raw' directory exists
-    Returns the path to the directory
+    Returns the path to the directory; cached, since every file in a run shares it
     """
     raw_dir = os.path.join(os.path.dirname(__file__), 'raw', timestamp)
     os.makedirs(raw_dir, exist_ok=True)
@@ -51,16 +84,23 @@ def ensure_raw_directory(timestamp: str) -> str:
 
 def save_to_json(data: Dict[str, Any], timestamp: str, offset: int) -> str:
     """
-    Save data to a JSON file in the timestamped directory
+    Save data to a gzip-compressed JSON file in the timestamped directory
     """
     raw_dir = ensure_raw_directory(timestamp)
-    filename = f"members_offset_{offset:04d}.json"
+    filename = f"members_offset_{offset:04d}.json.gz"
     file_path = os.path.join(raw_dir, filename)
     
-    with open(file_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 if PRETTY_JSON else None)
+    elif PRETTY_JSON:
+        payload = json.dumps(data, indent=2).encode('utf-8')
+    else:
+        payload = json.dumps(data, separators=(',', ':')).encode('utf-8')
     
-    logger.info(f"Saved members data to {file_path}")
+    with gzip.open(file_path, 'wb', compresslevel=RAW_COMPRESS_LEVEL) as f:
+        f.write(payload)
+    
+    logger.info("Saved members data to %s", file_path)
     return file_path
 
 def get_latest_data_directory() -> Optional[str]:
@@ -71,34 +111,30 @@ def get_latest_data_directory() -> Optional[str]:
     if not os.path.exists(base_dir):
         return None
     
-    dirs = glob(os.path.join(base_dir, '*'))
-    if not dirs:
-        return None
-    
-    # Get the most recent directory by timestamp
-    latest_dir = max(dirs, key=os.path.getctime)
-    return latest_dir
+    # Get the most recent directory by timestamp in one pass; scandir entries cache their stat
+    with os.scandir(base_dir) as entries:
+        latest = max((e for e in entries if e.is_dir()), key=lambda e: e.stat().st_ctime, default=None)
+    return latest.path if latest else None
 
-def load_latest_data() -> list:
+def load_latest_data() -> Iterator[Dict[str, Any]]:
     """
-    Load all member data from the most recent data directory
+    Yield member data from the most recent data directory, one page file at a time
     """
     latest_dir = get_latest_data_directory()
     if not latest_dir:
         logger.warning("No data directories found")
-        return []
+        return
 
-    all_members = []
-    json_files = sorted(glob(os.path.join(latest_dir, 'members_offset_*.json')))
+    # Older runs hold plain .json pages; newer ones are gzip-compressed
+    json_files = sorted(glob(os.path.join(latest_dir, 'members_offset_*.json*')))
     
     for file_path in json_files:
         logger.info(f"Loading data from {file_path}")
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-            if 'members' in data:
-                all_members.extend(data['members'])
-    
-    return all_members
+        opener = gzip.open if file_path.endswith('.gz') else open
+        with opener(file_path, 'rb') as f:
+            payload = f.read()
+        data = orjson.loads(payload) if orjson is not None else json.loads(payload)
+        yield from data.get('members', [])
 
 def year_to_date(year: Optional[str]) -> Optional[date]:
     """
@@ -111,21 +147,88 @@ def year_to_date(year: Optional[str]) -> Optional[date]:
     except ValueError:
         return None
 
-def update_database(members: list):
+def get_connection_pool() -> ThreadedConnectionPool:
+    """
+    Get the shared connection pool, creating it on first use
+    """
+    global _pool
+    if _pool is None:
+        _pool = ThreadedConnectionPool(1, 8, DATABASE_URL)
+    return _pool
+
+def write_member_batch(cur, member_rows: Dict[str, tuple], term_rows: list):
+    """
+    Upsert one batch of members and their terms
+    """
+    returned = execute_values(cur, """
+        INSERT INTO members (
+            bioguide_id, first_name, last_name, full_name, state, district, party, 
+            chamber, photo_url, last_updated, current_member
+        ) VALUES %s
+        ON CONFLICT (bioguide_id) DO UPDATE SET
+            first_name = EXCLUDED.first_name,
+            last_name = EXCLUDED.last_name,
+            full_name = EXCLUDED.full_name,
+            state = EXCLUDED.state,
+            district = EXCLUDED.district,
+            party = EXCLUDED.party,
+            chamber = EXCLUDED.chamber,
+            photo_url = EXCLUDED.photo_url,
+            last_updated = EXCLUDED.last_updated,
+            current_member = EXCLUDED.current_member
+        WHERE (members.first_name, members.last_name, members.full_name, members.state,
+               members.district, members.party, members.chamber, members.photo_url,
+               members.last_updated, members.current_member)
+          IS DISTINCT FROM
+              (EXCLUDED.first_name, EXCLUDED.last_name, EXCLUDED.full_name, EXCLUDED.state,
+               EXCLUDED.district, EXCLUDED.party, EXCLUDED.chamber, EXCLUDED.photo_url,
+               EXCLUDED.last_updated, EXCLUDED.current_member)
+        RETURNING id, bioguide_id
+    """, list(member_rows.values()), page_size=INSERT_PAGE_SIZE, fetch=True)
+    member_ids = {bioguide_id: member_id for member_id, bioguide_id in returned}
+
+    # Unchanged members are not returned by the upsert, so look their IDs up in one query
+    missing = [bioguide_id for bioguide_id in member_rows if bioguide_id not in member_ids]
+    if missing:
+        cur.execute("SELECT id, bioguide_id FROM members WHERE bioguide_id = ANY(%s)", (missing,))
+        member_ids.update({bioguide_id: member_id for member_id, bioguide_id in cur.fetchall()})
+
+    # Insert member terms
+    execute_values(cur, """
+        INSERT INTO member_terms (
+            member_id, congress, chamber, party, state, start_date, end_date
+        ) VALUES %s
+        ON CONFLICT (member_id, congress, chamber) DO UPDATE SET
+            party = EXCLUDED.party,
+            state = EXCLUDED.state,
+            start_date = EXCLUDED.start_date,
+            end_date = EXCLUDED.end_date
+    """, [(member_ids[row[0]],) + row[1:] for row in term_rows], page_size=INSERT_PAGE_SIZE)
+
+def update_database(members: Iterable[Dict[str, Any]]) -> int:
     """
     Update the database with member information
+    
+    Returns the number of members read
     """
+    member_count = 0
     conn = None
     try:
-        conn = psycopg2.connect(DATABASE_URL)
+        conn = get_connection_pool().getconn()
         cur = conn.cursor()
 
+        member_rows = {}
+        term_rows = []
+        current_year = datetime.now().year
         for member in members:
+            member_count += 1
             bioguide_id = member.get('bioguideId')
-            name_parts = member.get('name', '').split(', ')
-            last_name = name_parts[0] if len(name_parts) > 0 else ''
+            raw_name = member.get('name') or ''
+            name_parts = raw_name.split(', ')
+            last_name = name_parts[0]
             first_name = name_parts[1] if len(name_parts) > 1 else ''
-            full_name = member.get('name', '').replace(', ', ' ') or f"{first_name} {last_name}".strip()
+            # An empty name also leaves first and last empty, so no fallback string is needed
+            full_name = raw_name.replace(', ', ' ')
             state = member.get('state')
             district = member.get('district')
             party = member.get('partyName')
@@ -139,45 +242,15 @@ def update_database(members: list):
             update_date = member.get('updateDate')
             
             # Determine if the member is current based on the end_year of their latest term
-            current_year = datetime.now().year
             current_member = end_year is None or int(end_year) >= current_year
 
-            cur.execute("""
-                INSERT INTO members (
-                    bioguide_id, first_name, last_name, full_name, state, district, party, 
-                    chamber, photo_url, last_updated, current_member
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (bioguide_id) DO UPDATE SET
-                    first_name = EXCLUDED.first_name,
-                    last_name = EXCLUDED.last_name,
-                    full_name = EXCLUDED.full_name,
-                    state = EXCLUDED.state,
-                    district = EXCLUDED.district,
-                    party = EXCLUDED.party,
-                    chamber = EXCLUDED.chamber,
-                    photo_url = EXCLUDED.photo_url,
-                    last_updated = EXCLUDED.last_updated,
-                    current_member = EXCLUDED.current_member
-            """, (
+            member_rows[bioguide_id] = (
                 bioguide_id, first_name, last_name, full_name, state, district, party,
                 chamber, photo_url, update_date, current_member
-            ))
+            )
 
-            # Insert member terms
             for term in terms:
-                cur.execute("""
-                    INSERT INTO member_terms (
-                        member_id, congress, chamber, party, state, start_date, end_date
-                    ) VALUES (
-                        (SELECT id FROM members WHERE bioguide_id = %s),
-                        %s, %s, %s, %s, %s, %s
-                    )
-                    ON CONFLICT (member_id, congress, chamber) DO UPDATE SET
-                        party = EXCLUDED.party,
-                        state = EXCLUDED.state,
-                        start_date = EXCLUDED.start_date,
-                        end_date = EXCLUDED.end_date
-                """, (
+                term_rows.append((
                     bioguide_id,
                     None,  # Congress information is not provided in the current data
                     term.get('chamber'),
@@ -187,6 +260,19 @@ def update_database(members: list):
                     year_to_date(term.get('endYear'))
                 ))
 
+            # Write in batches so only one batch of rows is held at a time
+            if len(member_rows) >= INSERT_PAGE_SIZE:
+                write_member_batch(cur, member_rows, term_rows)
+                member_rows = {}
+                term_rows = []
+
+        if member_rows:
+            write_member_batch(cur, member_rows, term_rows)
+
+        if not member_count:
+            return member_count
+        logger.info(f"Processed {member_count} members")
+
         conn.commit()
         logger.info("Database updated successfully")
     except (Exception, psycopg2.Error) as error:
@@ -196,38 +282,41 @@ def update_database(members: list):
     finally:
         if conn:
             cur.close()
-            conn.close()
+            get_connection_pool().putconn(conn)
+    
+    return member_count
 
 def fetch_all_members(timestamp: str):
     """
-    Fetch all members using pagination
+    Fetch all members using pagination, requesting pages after the first concurrently
     """
-    offset = 0
-    total_count = None
-    
-    while True:
-        try:
-            data = fetch_members_page(offset)
-            save_to_json(data, timestamp, offset)
-            
-            # Get total count from first response
-            if total_count is None and 'pagination' in data:
-                total_count = data['pagination'].get('count')
-                logger.info(f"Total members to fetch: {total_count}")
-            
-            # Check if we need to continue
-            if 'pagination' not in data or 'next' not in data['pagination']:
-                break
-                
-            offset += RECORDS_PER_PAGE
-            
-            # Safety check
-            if offset >= (total_count or float('inf')):
-                break
-                
-        except requests.RequestException as e:
-            logger.error(f"Error fetching members at offset {offset}: {str(e)}")
-            break
+    try:
+        data = fetch_members_page(0)
+        save_to_json(data, timestamp, 0)
+    except requests.RequestException as e:
+        logger.error(f"Error fetching members at offset 0: {str(e)}")
+        return
+        
+    # The first page reports the total, which gives every remaining offset
+    pagination = data.get('pagination', {})
+    total_count = pagination.get('count')
+    logger.info(f"Total members to fetch: {total_count}")
+    if 'next' not in pagination or not total_count:
+        return
+        
+    def fetch_and_save(offset: int):
+        save_to_json(fetch_members_page(offset), timestamp, offset)
+        
+    with concurrent.futures.ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        futures = {
+            executor.submit(fetch_and_save, offset): offset
+            for offset in range(RECORDS_PER_PAGE, total_count, RECORDS_PER_PAGE)
+        }
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                future.result()
+            except requests.RequestException as e:
+                logger.error(f"Error fetching members at offset {futures[future]}: {str(e)}")
 
 def main():
     try:
@@ -242,17 +331,16 @@ def main():
         else:
             logger.info(f"Using existing data from {latest_dir}")
         
-        # Load and process the latest data
-        members = load_latest_data()
-        if members:
-            logger.info(f"Processing {len(members)} members")
-            update_database(members)
-        else:
+        # Load and process the latest data, parsing page files as they are consumed
+        if not update_database(load_latest_data()):
             logger.warning("No member data found to process")
 
     except Exception as e:
         logger.error(f"An unexpected error occurred: {str(e)}")
         raise
+    finally:
+        if _pool:
+            _pool.closeall()
 
 if __name__ == "__main__":
     main()
@@ -1,12 +1,23 @@
 import os
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import psycopg2
+from psycopg2.extras import execute_values
 import logging
+import concurrent.futures
+import queue
+import threading
 from dotenv import load_dotenv
+from functools import lru_cache
 from datetime import datetime
-from typing import Dict, Any, Optional
-from glob import glob
+from typing import Dict, Any, Optional, List
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Set up logging
 logging.basicConfig(
@@ -24,6 +35,22 @@ API_KEY = os.getenv('CONGRESSGOV_API_KEY')
 MEMBER_DETAIL_ENDPOINT = os.getenv('CONGRESSGOV_MEMBER_DETAIL_ENDPOINT', 'https://api.congress.gov/v3/member/{bioguideId}')
 DATABASE_URL = os.getenv('DATABASE_URL')
 
+# Member detail requests in flight at once
+FETCH_WORKERS = 8
+
+# Keep-alive session shared by all detail fetches; retries transient failures with backoff
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
+))
+REQUEST_TIMEOUT = 30  # Seconds
+
+# Members whose details are written to the database together
+DB_BATCH_SIZE = 1000
+ID_FETCH_SIZE = 5000  # Rows per round trip when streaming bioguide IDs
+
 def fetch_member_detail(bioguide_id: str) -> Dict[str, Any]:
     """
     Fetch detailed information for a specific member from the Congress.gov API
@@ -35,22 +62,26 @@ def fetch_member_detail(bioguide_id: str) -> Dict[str, Any]:
         'format': 'json'
     }
     
-    logger.info(f"Fetching details for member {bioguide_id}")
+    logger.info("Fetching details for member %s", bioguide_id)
     try:
-        response = requests.get(url, params=params)
+        response = SESSION.get(url, params=params, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
+        # Decode the raw bytes with orjson when available; this runs on the fetch worker thread
+        if orjson is not None:
+            return orjson.loads(response.content)
         return response.json()
     except requests.exceptions.RequestException as e:
-        if response.status_code == 404:
+        if e.response is not None and e.response.status_code == 404:
             logger.warning(f"Member {bioguide_id} not found in Congress.gov API")
         else:
             logger.error(f"Error fetching member {bioguide_id}: {str(e)}")
         raise
 
+@lru_cache(maxsize=32)
 def ensure_raw_directory(timestamp: str) -> str:
     """
     Ensure that the timestamped 'raw/details' directory exists
-    Returns the path to the directory
+    Returns the path to the directory; cached, since every file in a run shares it
     """
     raw_dir = os.path.join(os.path.dirname(__file__), 'raw', timestamp, 'details')
     os.makedirs(raw_dir, exist_ok=True)
@@ -63,13 +94,34 @@ def save_to_json(data: Dict[str, Any], timestamp: str, bioguide_id: str) -> str:
     raw_dir = ensure_raw_directory(timestamp)
     filename = f"member_detail_{bioguide_id}.json"
     file_path = os.path.join(raw_dir, filename)
+    tmp_path = file_path + '.tmp'
     
-    with open(file_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    # Serialize up front so the file is written in one call, then swap it in so
+    # readers never see a partial file
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode('utf-8')
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, file_path)
     
-    logger.info(f"Saved member detail data to {file_path}")
+    logger.info("Saved member detail data to %s", file_path)
     return file_path
 
+def _drain_saves(save_queue: "queue.Queue") -> None:
+    """
+    Write queued (data, timestamp, bioguide_id) items to disk until a None sentinel arrives
+    """
+    while True:
+        item = save_queue.get()
+        if item is None:
+            break
+        try:
+            save_to_json(*item)
+        except Exception as e:
+            logger.error(f"Error saving member detail for {item[2]}: {str(e)}")
+
 def get_latest_data_directory() -> Optional[str]:
     """
     Get the path to the most recent data directory
@@ -78,127 +130,158 @@ def get_latest_data_directory() -> Optional[str]:
     if not os.path.exists(base_dir):
         return None
     
-    dirs = glob(os.path.join(base_dir, '*'))
-    if not dirs:
-        return None
-    
-    # Get the most recent directory by timestamp
-    latest_dir = max(dirs, key=os.path.getctime)
-    return latest_dir
+    # Get the most recent directory by timestamp in one pass; scandir entries cache their stat
+    with os.scandir(base_dir) as entries:
+        latest = max((e for e in entries if e.is_dir()), key=lambda e: e.stat().st_ctime, default=None)
+    return latest.path if latest else None
 
-def update_database_with_details(member_data: Dict[str, Any]):
+def update_database_with_details(cur, member_data_batch: List[Dict[str, Any]]):
     """
-    Update the database with detailed member information
+    Update the database with detailed information for a batch of members,
+    committing the batch on the cursor's connection
     """
-    if 'member' not in member_data:
-        logger.warning("No member data found in response")
-        return
-
-    member = member_data['member']
-    bioguide_id = member.get('bioguideId')
+    member_updates = {}
+    leadership_rows = {}
+    party_rows = {}
     
-    if not bioguide_id:
-        logger.warning("No bioguide ID found in member data")
-        return
+    for member_data in member_data_batch:
+        if 'member' not in member_data:
+            logger.warning("No member data found in response")
+            continue
 
-    try:
-        conn = psycopg2.connect(DATABASE_URL)
-        cur = conn.cursor()
+        member = member_data['member']
+        bioguide_id = member.get('bioguideId')
+        
+        if not bioguide_id:
+            logger.warning("No bioguide ID found in member data")
+            continue
 
-        # Update the members table with additional details
-        cur.execute("""
-            UPDATE members SET
-                birth_year = %s,
-                direct_order_name = %s,
-                honorific_name = %s,
-                inverted_order_name = %s,
-                update_date = %s
-            WHERE bioguide_id = %s
-        """, (
+        member_updates[bioguide_id] = (
             member.get('birthYear'),
             member.get('directOrderName'),
             member.get('honorificName'),
             member.get('invertedOrderName'),
             member.get('updateDate'),
             bioguide_id
-        ))
+        )
+
+        # Keyed by the conflict target so one statement never updates the same row twice
+        for position in member.get('leadership', []):
+            leadership_rows[(bioguide_id, position.get('congress'))] = (
+                bioguide_id,
+                position.get('congress'),
+                position.get('type')
+            )
+
+        for party in member.get('partyHistory', []):
+            party_rows[(bioguide_id, party.get('startYear'))] = (
+                bioguide_id,
+                party.get('partyName'),
+                party.get('partyAbbreviation'),
+                party.get('startYear')
+            )
+
+    if not member_updates:
+        return
+
+    try:
+        # Update the members table with additional details; RETURNING hands back
+        # the member ids so the child inserts need no further lookups
+        updated = execute_values(cur, """
+            UPDATE members SET
+                birth_year = data.birth_year,
+                direct_order_name = data.direct_order_name,
+                honorific_name = data.honorific_name,
+                inverted_order_name = data.inverted_order_name,
+                update_date = data.update_date
+            FROM (VALUES %s) AS data (
+                birth_year, direct_order_name, honorific_name,
+                inverted_order_name, update_date, bioguide_id
+            )
+            WHERE members.bioguide_id = data.bioguide_id
+            RETURNING members.bioguide_id, members.id
+        """, list(member_updates.values()),
+            template="(%s::integer, %s, %s, %s, %s::timestamptz, %s)", page_size=DB_BATCH_SIZE,
+            fetch=True)
+        member_ids = dict(updated)
 
         # Handle leadership positions
-        leadership = member.get('leadership', [])
-        for position in leadership:
-            cur.execute("""
+        leadership_rows = [
+            (member_ids[row[0]],) + row[1:]
+            for row in leadership_rows.values() if row[0] in member_ids
+        ]
+        if leadership_rows:
+            execute_values(cur, """
                 INSERT INTO member_leadership (
                     member_id, congress, leadership_type
-                ) VALUES (
-                    (SELECT id FROM members WHERE bioguide_id = %s),
-                    %s, %s
-                ) ON CONFLICT (member_id, congress) DO UPDATE SET
+                )
+                VALUES %s
+                ON CONFLICT (member_id, congress) DO UPDATE SET
                     leadership_type = EXCLUDED.leadership_type
-            """, (
-                bioguide_id,
-                position.get('congress'),
-                position.get('type')
-            ))
+            """, leadership_rows,
+                template="(%s, %s::integer, %s)", page_size=DB_BATCH_SIZE)
 
         # Handle party history
-        party_history = member.get('partyHistory', [])
-        for party in party_history:
-            cur.execute("""
+        party_rows = [
+            (member_ids[row[0]],) + row[1:]
+            for row in party_rows.values() if row[0] in member_ids
+        ]
+        if party_rows:
+            execute_values(cur, """
                 INSERT INTO member_party_history (
                     member_id, party_name, party_code, start_year
-                ) VALUES (
-                    (SELECT id FROM members WHERE bioguide_id = %s),
-                    %s, %s, %s
-                ) ON CONFLICT (member_id, start_year) DO UPDATE SET
+                )
+                VALUES %s
+                ON CONFLICT (member_id, start_year) DO UPDATE SET
                     party_name = EXCLUDED.party_name,
                     party_code = EXCLUDED.party_code
-            """, (
-                bioguide_id,
-                party.get('partyName'),
-                party.get('partyAbbreviation'),
-                party.get('startYear')
-            ))
+            """, party_rows,
+                template="(%s, %s, %s, %s::integer)", page_size=DB_BATCH_SIZE)
 
-        conn.commit()
-        logger.info(f"Successfully updated database with details for member {bioguide_id}")
+        cur.connection.commit()
+        logger.info(f"Successfully updated database with details for {len(member_updates)} members")
 
     except Exception as e:
         logger.error(f"Error updating database with member details: {str(e)}")
-        if conn:
-            conn.rollback()
-    finally:
-        if conn:
-            cur.close()
-            conn.close()
+        cur.connection.rollback()
+        # Earlier batches are already committed; record which members need a retry
+        logger.error(f"Rolled back details for {len(member_updates)} members: {', '.join(member_updates)}")
 
-def get_all_bioguide_ids() -> list:
+def get_all_bioguide_ids(cur) -> list:
     """
-    Get all bioguide IDs from the database
+    Get all bioguide IDs from the database, streamed through a server-side cursor
     """
     bioguide_ids = []
     try:
-        conn = psycopg2.connect(DATABASE_URL)
-        cur = conn.cursor()
-        
-        cur.execute("SELECT bioguide_id FROM members")
-        bioguide_ids = [row[0] for row in cur.fetchall()]
+        with cur.connection.cursor(name='bioguide_ids') as id_cur:
+            id_cur.itersize = ID_FETCH_SIZE
+            id_cur.execute("SELECT bioguide_id FROM members")
+            bioguide_ids = [row[0] for row in id_cur]
         
     except Exception as e:
         logger.error(f"Error fetching bioguide IDs: {str(e)}")
-    finally:
-        if conn:
-            cur.close()
-            conn.close()
+        cur.connection.rollback()
     
     return bioguide_ids
 
 def main():
+    conn = None
+    # A single writer thread handles all JSON saves so fetching never waits on disk
+    save_queue = queue.Queue()
+    writer_thread = threading.Thread(target=_drain_saves, args=(save_queue,), daemon=True)
+    writer_thread.start()
     try:
+        # One connection serves the whole run
+        conn = psycopg2.connect(DATABASE_URL)
+        cur = conn.cursor()
+        
         # Create timestamp for this run
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         # Get all bioguide IDs from the database
-        bioguide_ids = get_all_bioguide_ids()
+        bioguide_ids = get_all_bioguide_ids(cur)
+        # Close the read transaction so the connection isn't left idle in a transaction while fetching
+        conn.commit()
         
         if not bioguide_ids:
             logger.warning("No bioguide IDs found in database")
@@ -206,27 +289,49 @@ def main():
         
         logger.info(f"Found {len(bioguide_ids)} members to fetch details for")
         
-        # Fetch and process details for each member
-        for bioguide_id in bioguide_ids:
-            try:
-                member_data = fetch_member_detail(bioguide_id)
-                save_to_json(member_data, timestamp, bioguide_id)
-                update_database_with_details(member_data)
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 404:
-                    # Skip 404 errors but log them at warning level
-                    logger.warning(f"Member {bioguide_id} not found in Congress.gov API")
-                    continue
-                else:
-                    logger.error(f"HTTP error processing member {bioguide_id}: {str(e)}")
+        # Fetch details concurrently; responses are written to the database here in batches
+        pending = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            futures = {
+                executor.submit(fetch_member_detail, bioguide_id): bioguide_id
+                for bioguide_id in bioguide_ids
+            }
+            
+            for future in concurrent.futures.as_completed(futures):
+                bioguide_id = futures[future]
+                try:
+                    member_data = future.result()
+                except requests.exceptions.HTTPError as e:
+                    if e.response.status_code == 404:
+                        # Skip 404 errors but log them at warning level
+                        logger.warning(f"Member {bioguide_id} not found in Congress.gov API")
+                        continue
+                    else:
+                        logger.error(f"HTTP error processing member {bioguide_id}: {str(e)}")
+                        continue
+                except Exception as e:
+                    logger.error(f"Error processing member {bioguide_id}: {str(e)}")
                     continue
-            except Exception as e:
-                logger.error(f"Error processing member {bioguide_id}: {str(e)}")
-                continue
+                
+                save_queue.put((member_data, timestamp, bioguide_id))
+                pending.append(member_data)
+                    
+                if len(pending) >= DB_BATCH_SIZE:
+                    update_database_with_details(cur, pending)
+                    pending = []
+                    
+        if pending:
+            update_database_with_details(cur, pending)
 
     except Exception as e:
         logger.error(f"An unexpected error occurred: {str(e)}")
         raise
+    finally:
+        # Let the writer finish any queued saves before exiting
+        save_queue.put(None)
+        writer_thread.join()
+        if conn:
+            conn.close()
 
 if __name__ == "__main__":
     main()
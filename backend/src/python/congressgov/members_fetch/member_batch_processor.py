@@ -27,18 +27,28 @@ logger = setup_logging(__name__)
 # API configuration
 BASE_API_URL = "https://api.congress.gov/v3"
 MAX_WORKERS = 4  # Maximum number of concurrent workers for parallel processing
+MEMBER_FETCH_SIZE = 100  # Rows per round trip when streaming member lists
 
-def get_current_members() -> List[Tuple[int, str]]:
-    """Get all current members from the database."""
+def get_current_members(limit: int = None) -> List[Tuple[int, str]]:
+    """Get current members from the database, oldest updated first."""
     with get_db_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute("""
+        # Named cursor streams rows from the server in batches instead of buffering the whole result
+        with conn.cursor(name='current_members') as cur:
+            cur.itersize = MEMBER_FETCH_SIZE
+            query = """
                 SELECT id, bioguide_id 
                 FROM members 
                 WHERE current_member = true
                 ORDER BY last_updated ASC NULLS FIRST
-            """)
-            return [(row[0], row[1]) for row in cur.fetchall()]
+            """
+            params = []
+            
+            if limit:
+                query += " LIMIT %s"
+                params.append(limit)
+                
+            cur.execute(query, params)
+            return [(row[0], row[1]) for row in cur]
 
 def get_members_by_chamber(chamber: str, limit: int = None) -> List[Tuple[int, str]]:
     """Get members by chamber (senate or house)."""
@@ -137,6 +147,7 @@ def process_member_batch(members: List[Tuple[int, str]], process_type: str,
         processor = MemberDetailProcessor(api_client)
     elif process_type == 'enrichment':
         processor = MemberEnrichment(api_client)
+        processor.preload_member_info([member_id for member_id, _ in members])
     else:
         # For 'bio' we would need to import and initialize MemberBioProcessor
         # But we'll skip implementing that here
@@ -162,7 +173,7 @@ def process_member_batch(members: List[Tuple[int, str]], process_type: str,
                     if process_type == 'details':
                         future = executor.submit(processor.process_member, bioguide_id)
                     elif process_type == 'enrichment':
-                        future = executor.submit(processor.process_member, bioguide_id)
+                        future = executor.submit(processor.process_member, member_id, bioguide_id)
                     # Add other process types as needed
                     
                     futures[future] = (member_id, bioguide_id)
@@ -191,7 +202,7 @@ def process_member_batch(members: List[Tuple[int, str]], process_type: str,
                     if process_type == 'details':
                         result = processor.process_member(bioguide_id)
                     elif process_type == 'enrichment':
-                        result = processor.process_member(bioguide_id)
+                        result = processor.process_member(member_id, bioguide_id)
                     # Add other process types as needed
                     
                     stats["processed"] += 1
@@ -242,9 +253,7 @@ def main():
             
         else:
             # Get all current members
-            members_to_process = get_current_members()
-            if args.limit and len(members_to_process) > args.limit:
-                members_to_process = members_to_process[:args.limit]
+            members_to_process = get_current_members(args.limit)
             logger.info(f"Found {len(members_to_process)} current members")
         
         if not members_to_process:
@@ -5,14 +5,20 @@ using Selenium for web scraping.
 """
 
 import os
+import io
+import re
+import csv
+import html
+import hashlib
+import stat
 import argparse
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
 # Import utilities
 from congressgov.utils.logging_config import setup_logging
 from congressgov.utils.database import get_db_connection, with_db_transaction
-from congressgov.utils.file_storage import ensure_directory, save_json, cleanup_old_files
+from congressgov.utils.file_storage import ensure_directory, append_jsonl, cleanup_old_files
 
 # Web scraping libraries
 from selenium import webdriver
@@ -29,7 +35,71 @@ logger = setup_logging(__name__)
 # Configuration
 BIOGUIDE_ENDPOINT = "https://bioguide.congress.gov/search/bio/{bioguide_id}"
 RAW_DATA_RETENTION_DAYS = 30
+BIO_RAW_FILENAME = "bios.ndjson"  # One record per member, appended per run
+BIO_FLUSH_SIZE = 5000  # Pending bio updates written to the database per COPY batch
 WAIT_TIME = 5  # Seconds to wait for page loading
+# Fast path for the known biography container; BeautifulSoup is the fallback
+BIO_RE = re.compile(
+    r'<div[^>]*c-tabs-container__page--active.*?u-inline-paragraphs(?=[\s"])[^"]*"[^>]*>(.*?)</div>',
+    re.DOTALL
+)
+# Markup inside the container that the regex can't treat like get_text() does
+# (a nested div ends the lazy match early; script, style and comments are skipped by bs4)
+BIO_UNSAFE_RE = re.compile(r'<(?:div|script|style|!--)', re.IGNORECASE)
+TAG_RE = re.compile(r'<[^>]+>')
+CHROMEDRIVER_PATH = os.getenv('CHROMEDRIVER_PATH')
+# Per-user cache; a shared temp dir would let other users plant the path we execute
+CHROMEDRIVER_CACHE_DIR = os.path.join(
+    os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'congressgov'
+)
+CHROMEDRIVER_CACHE_FILE = os.path.join(CHROMEDRIVER_CACHE_DIR, 'chromedriver_path')
+CHROMEDRIVER_CACHE_TTL = int(os.getenv('CHROMEDRIVER_CACHE_TTL', 24 * 60 * 60))  # Seconds
+
+def get_chromedriver_path() -> str:
+    """
+    Resolve the chromedriver binary, avoiding a webdriver-manager network check
+    when a recent install is already cached on disk.
+    """
+    if CHROMEDRIVER_PATH:
+        return CHROMEDRIVER_PATH
+    
+    try:
+        st = os.stat(CHROMEDRIVER_CACHE_FILE)
+        # Only trust a cache file we own that nobody else can write
+        trusted = st.st_uid == os.getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+        if trusted and time.time() - st.st_mtime < CHROMEDRIVER_CACHE_TTL:
+            with open(CHROMEDRIVER_CACHE_FILE, 'r') as f:
+                cached_path = f.read().strip()
+            if cached_path and os.path.exists(cached_path):
+                logger.debug(f"Using cached chromedriver at {cached_path}")
+                return cached_path
+    except OSError:
+        pass
+    
+    driver_path = ChromeDriverManager().install()
+    try:
+        os.makedirs(CHROMEDRIVER_CACHE_DIR, mode=0o700, exist_ok=True)
+        fd = os.open(CHROMEDRIVER_CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write(driver_path)
+    except OSError as e:
+        logger.warning(f"Could not cache chromedriver path: {str(e)}")
+    
+    return driver_path
+
+def extract_bio_fast(html_content: str) -> Optional[str]:
+    """
+    Extract the biography text with a regex, or return None to defer to BeautifulSoup.
+    
+    Produces the same text as get_text(strip=True) on the container: every text node
+    is unescaped and stripped, and the non-empty ones are joined with no separator.
+    Bio text is hashed to detect changes, so the two paths must agree exactly.
+    """
+    match = BIO_RE.search(html_content)
+    if not match or BIO_UNSAFE_RE.search(match.group(1)):
+        return None
+    pieces = (html.unescape(piece).strip() for piece in TAG_RE.split(match.group(1)))
+    return ''.join(piece for piece in pieces if piece)
 
 class MemberBioProcessor:
     """Handles fetching and processing biographical information for members."""
@@ -38,26 +108,35 @@ class MemberBioProcessor:
         """Initialize the processor."""
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.raw_dir = ensure_directory(os.path.dirname(__file__), 'raw', 'bios', self.timestamp)
+        self.pending_bios: List[Dict[str, Any]] = []
         self.driver = self.setup_driver()
         
     def setup_driver(self) -> webdriver.Chrome:
         """Set up a headless Chrome browser for scraping."""
         chrome_options = Options()
-        chrome_options.add_argument("--headless")
+        chrome_options.page_load_strategy = 'eager'
+        chrome_options.add_argument("--headless=new")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-infobars")
-        chrome_options.add_argument("--disable-notifications")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-sync")
+        chrome_options.add_argument("--disable-default-apps")
+        chrome_options.add_argument("--disable-features=Translate,MediaRouter,OptimizationHints,BackForwardCache,InterestFeedContentSuggestions")
+        chrome_options.add_argument("--disable-renderer-backgrounding")
+        chrome_options.add_argument("--metrics-recording-only")
+        chrome_options.add_argument("--mute-audio")
         chrome_options.add_argument("user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36")
         
-        service = Service(ChromeDriverManager().install())
+        service = Service(get_chromedriver_path())
         return webdriver.Chrome(service=service, options=chrome_options)
     
     def extract_bio_text(self, html_content: str) -> str:
         """Extract biography text from HTML content."""
+        bio_text = extract_bio_fast(html_content)
+        if bio_text:
+            return bio_text
+        
         soup = BeautifulSoup(html_content, 'html.parser')
         
         # Try to find the biography section
@@ -119,69 +198,113 @@ class MemberBioProcessor:
             raise
     
     def save_bio_data(self, data: Dict[str, Any], bioguide_id: str) -> str:
-        """Save bio data to a JSON file."""
-        dir_path = ensure_directory(self.raw_dir, bioguide_id)
-        filename = f"bio.json"
+        """Append bio data to the run's NDJSON file."""
+        return append_jsonl(data, self.raw_dir, BIO_RAW_FILENAME)
+    
+    def queue_bio_update(self, bio_data: Dict[str, Any]) -> bool:
+        """Queue a member bio for the next batched database update."""
+        if not bio_data.get('bioguideId'):
+            logger.warning("No bioguide ID found in bio data")
+            return False
+            
+        self.pending_bios.append(bio_data)
         
-        return save_json(data, dir_path, filename)
+        if len(self.pending_bios) >= BIO_FLUSH_SIZE:
+            self.flush_bio_updates()
+            
+        return True
     
     @with_db_transaction
-    def update_member_bio(cursor, self, bio_data: Dict[str, Any]) -> bool:
-        """Update member bio in the database."""
+    def update_member_bios(cursor, self, rows: List[Tuple[str, str, str, str, str]]) -> List[str]:
+        """
+        Update member bios in the database via COPY into a staging table.
+        bio_update_date is always advanced so --all/--missing runs rotate through
+        every member; the profile text and last_updated only change with the hash.
+        
+        Returns:
+            Bioguide IDs of the members whose bio text actually changed
+        """
         # The decorator injects 'cursor' as the first parameter, shifting 'self' to second position
+        cursor.execute("""
+            CREATE TEMP TABLE staging_bios (
+                bioguide_id TEXT,
+                profile_text TEXT,
+                bio_directory TEXT,
+                bio_update_date TIMESTAMP WITH TIME ZONE,
+                profile_text_hash BYTEA
+            ) ON COMMIT DROP
+        """)
         
-        bioguide_id = bio_data.get('bioguideId')
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
+        cursor.copy_expert("COPY staging_bios FROM STDIN WITH CSV", buffer)
         
-        if not bioguide_id:
-            logger.warning("No bioguide ID found in bio data")
-            return False
-            
-        # Extract relevant information from bio data
-        profile_text = bio_data.get('profileText', '')
-        bio_directory = bio_data.get('bioDirectory', '')
-        bio_update_date = datetime.now()
-        
-        # Update the members table with bio information
+        # 'old' is the pre-update row, so the RETURNING flag reflects the stored hash
         cursor.execute("""
-            UPDATE members SET
-                profile_text = %s,
-                bio_directory = %s,
-                bio_update_date = %s,
-                last_updated = CURRENT_TIMESTAMP
-            WHERE bioguide_id = %s
-            RETURNING id
-        """, (
-            profile_text,
-            bio_directory,
-            bio_update_date,
-            bioguide_id
-        ))
+            UPDATE members m SET
+                profile_text = CASE WHEN old.profile_text_hash IS DISTINCT FROM s.profile_text_hash
+                                    THEN s.profile_text ELSE m.profile_text END,
+                profile_text_hash = s.profile_text_hash,
+                bio_directory = s.bio_directory,
+                bio_update_date = s.bio_update_date,
+                last_updated = CASE WHEN old.profile_text_hash IS DISTINCT FROM s.profile_text_hash
+                                    THEN CURRENT_TIMESTAMP ELSE m.last_updated END
+            FROM staging_bios s
+            JOIN members old ON old.bioguide_id = s.bioguide_id
+            WHERE m.bioguide_id = s.bioguide_id
+            RETURNING m.bioguide_id, old.profile_text_hash IS DISTINCT FROM s.profile_text_hash
+        """)
         
-        result = cursor.fetchone()
-        if not result:
-            logger.warning(f"No member record found for {bioguide_id}")
-            return False
+        return [bioguide_id for bioguide_id, changed in cursor.fetchall() if changed]
+    
+    def flush_bio_updates(self) -> int:
+        """Write all queued bios to the database and save raw data for changed bios."""
+        if not self.pending_bios:
+            return 0
             
-        return True
+        bios, self.pending_bios = self.pending_bios, []
+        rows = []
+        for bio_data in bios:
+            profile_text = bio_data.get('profileText', '')
+            rows.append((
+                bio_data['bioguideId'],
+                profile_text,
+                bio_data.get('bioDirectory', ''),
+                bio_data.get('fetchDate') or datetime.now().isoformat(),
+                '\\x' + hashlib.sha1(profile_text.encode('utf-8')).hexdigest()
+            ))
+            
+        try:
+            changed = set(self.update_member_bios(rows=rows))
+        except Exception:
+            # Keep the batch queued so a later flush (or close) can retry or save it
+            self.pending_bios = bios + self.pending_bios
+            raise
+        
+        # Only keep raw copies of bios that actually changed
+        for bio_data in bios:
+            if bio_data['bioguideId'] in changed:
+                self.save_bio_data(bio_data, bio_data['bioguideId'])
+        
+        logger.info(f"Updated {len(changed)} member bios, {len(bios) - len(changed)} unchanged or not found")
+        return len(changed)
     
     def process_member(self, bioguide_id: str) -> Dict[str, Any]:
         """Process a single member, fetching and updating bio information."""
         results = {
             "bioguide_id": bioguide_id,
             "status": "success",
-            "bio_updated": False
+            "bio_queued": False
         }
         
         try:
             # Fetch bio data
             bio_data = self.fetch_member_bio(bioguide_id)
             
-            # Save bio data
-            file_path = self.save_bio_data(bio_data, bioguide_id)
-            logger.info(f"Saved bio data to {file_path}")
-            
-            # Update database
-            results["bio_updated"] = self.update_member_bio(bio_data=bio_data)
+            # Queue database update (written in batches by flush_bio_updates,
+            # which also saves the raw data for bios that changed)
+            results["bio_queued"] = self.queue_bio_update(bio_data)
             
             logger.info(f"Successfully processed bio for member {bioguide_id}")
             
@@ -194,6 +317,16 @@ class MemberBioProcessor:
     
     def close(self):
         """Clean up resources."""
+        if self.pending_bios:
+            try:
+                self.flush_bio_updates()
+            except Exception as e:
+                logger.error(f"Error flushing pending bio updates: {str(e)}", exc_info=True)
+                # Last chance: keep the scraped bios on disk rather than losing them
+                for bio_data in self.pending_bios:
+                    file_path = self.save_bio_data(bio_data, bio_data['bioguideId'])
+                logger.warning(f"Saved {len(self.pending_bios)} unwritten bios to {file_path}")
+                self.pending_bios = []
         if self.driver:
             self.driver.quit()
             logger.info("Browser closed")
@@ -213,16 +346,13 @@ def get_members_for_processing(recent_only: bool = True, days: int = 7, limit: i
                     LIMIT %s
                 """, (cutoff_date, limit))
             else:
-                # Get members with missing bios or oldest updated
+                # Get members with missing bios first, then oldest updated.
+                # A single ordered scan keeps LIMIT applied to the whole result.
                 cur.execute("""
                     SELECT bioguide_id 
                     FROM members 
-                    WHERE profile_text IS NULL
-                       OR bio_directory IS NULL
-                    UNION
-                    SELECT bioguide_id 
-                    FROM members 
-                    ORDER BY bio_update_date ASC NULLS FIRST
+                    ORDER BY (profile_text IS NULL OR bio_directory IS NULL) DESC,
+                             bio_update_date ASC NULLS FIRST
                     LIMIT %s
                 """, (limit,))
             
@@ -276,6 +406,9 @@ def main():
                 logger.error(f"Error processing member {bioguide_id}: {str(e)}", exc_info=True)
                 error_count += 1
         
+        # Write any queued bio updates
+        processor.flush_bio_updates()
+        
         # Clean up old files
         cleanup_old_files(os.path.join(os.path.dirname(__file__), 'raw', 'bios'), 
                          pattern='*', days=RAW_DATA_RETENTION_DAYS)
@@ -7,13 +7,15 @@ Handles member details, leadership positions, party history, and related data.
 import os
 import json
 import argparse
+import concurrent.futures
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple
+from psycopg2.extras import execute_values
 
 # Import utilities
 from congressgov.utils.logging_config import setup_logging
 from congressgov.utils.api import APIClient
-from congressgov.utils.database import get_db_connection, with_db_transaction
+from congressgov.utils.database import get_db_connection, with_db_transaction, POOL_MAX_CONN
 from congressgov.utils.file_storage import ensure_directory, save_json, cleanup_old_files
 from congressgov.utils.member_utils import (
     get_leadership_title, year_to_date, parse_party_name
@@ -27,6 +29,7 @@ BASE_API_URL = "https://api.congress.gov/v3"
 MEMBER_DETAIL_ENDPOINT = "member/{bioguideId}"
 SYNC_STATUS_TABLE = "api_sync_status"
 RAW_DATA_RETENTION_DAYS = 30
+MAX_WORKERS = 8  # Concurrent members; keep below the database pool size (DB_POOL_MAX_CONN)
 
 class MemberDetailProcessor:
     """Class for processing member details."""
@@ -130,19 +133,20 @@ class MemberDetailProcessor:
             elif isinstance(member['leadership'], list):
                 leadership_items = member['leadership']
                 
-            for position in leadership_items:
-                cursor.execute("""
+            # Keyed by congress so a repeated position keeps the last value, as sequential upserts did
+            leadership_rows = {
+                position.get('congress'): (member_id, position.get('congress'), position.get('type'))
+                for position in leadership_items
+            }
+            
+            if leadership_rows:
+                execute_values(cursor, """
                     INSERT INTO member_leadership (
                         member_id, congress, leadership_type
-                    ) VALUES (
-                        %s, %s, %s
-                    ) ON CONFLICT (member_id, congress) DO UPDATE SET
+                    ) VALUES %s
+                    ON CONFLICT (member_id, congress) DO UPDATE SET
                         leadership_type = EXCLUDED.leadership_type
-                """, (
-                    member_id,
-                    position.get('congress'),
-                    position.get('type')
-                ))
+                """, list(leadership_rows.values()))
         
         # Handle party history
         if 'partyHistory' in member:
@@ -152,25 +156,29 @@ class MemberDetailProcessor:
             elif isinstance(member['partyHistory'], list):
                 party_history_items = member['partyHistory']
                 
+            # Keyed by start year: one upsert statement cannot touch the same row twice
+            party_rows = {}
             for party in party_history_items:
                 party_name, party_code = parse_party_name(party.get('partyName', ''))
                 start_year = party.get('startYear')
                 
                 if start_year:
-                    cursor.execute("""
-                        INSERT INTO member_party_history (
-                            member_id, party_name, party_code, start_year
-                        ) VALUES (
-                            %s, %s, %s, %s
-                        ) ON CONFLICT (member_id, start_year) DO UPDATE SET
-                            party_name = EXCLUDED.party_name,
-                            party_code = EXCLUDED.party_code
-                    """, (
+                    party_rows[start_year] = (
                         member_id,
                         party_name,
                         party_code or party.get('partyAbbreviation'),
                         start_year
-                    ))
+                    )
+                    
+            if party_rows:
+                execute_values(cursor, """
+                    INSERT INTO member_party_history (
+                        member_id, party_name, party_code, start_year
+                    ) VALUES %s
+                    ON CONFLICT (member_id, start_year) DO UPDATE SET
+                        party_name = EXCLUDED.party_name,
+                        party_code = EXCLUDED.party_code
+                """, list(party_rows.values()))
         
         return True
     
@@ -214,16 +222,13 @@ def get_members_for_processing(recent_only: bool = True, days: int = 7, limit: i
                     LIMIT %s
                 """, (cutoff_date, limit))
             else:
-                # Get members with missing details or oldest updated
+                # Get members with missing details first, then oldest updated.
+                # A single ordered scan keeps LIMIT applied to the whole result.
                 cur.execute("""
                     SELECT bioguide_id 
                     FROM members 
-                    WHERE direct_order_name IS NULL
-                       OR birth_year IS NULL
-                    UNION
-                    SELECT bioguide_id 
-                    FROM members 
-                    ORDER BY last_updated ASC NULLS FIRST
+                    ORDER BY (direct_order_name IS NULL OR birth_year IS NULL) DESC,
+                             last_updated ASC NULLS FIRST
                     LIMIT %s
                 """, (limit,))
             
@@ -253,6 +258,7 @@ def main():
     parser.add_argument('--days', type=int, default=7, help='For recent mode, how many days back to consider')
     parser.add_argument('--limit', type=int, default=100, help='Maximum number of members to process')
     parser.add_argument('--missing', action='store_true', help='Focus on members with missing details')
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS, help='Number of members to process concurrently')
     args = parser.parse_args()
     
     try:
@@ -281,19 +287,29 @@ def main():
         processed_count = 0
         error_count = 0
         
-        for bioguide_id in members_to_process:
-            try:
-                result = processor.process_member(bioguide_id)
-                results.append(result)
-                
-                if result['status'] == 'success':
-                    processed_count += 1
-                else:
-                    error_count += 1
+        # Members are independent, so process them concurrently; a failing member is
+        # counted as an error rather than failing the whole run
+        workers = max(1, min(args.workers, POOL_MAX_CONN, len(members_to_process)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(processor.process_member, bioguide_id): bioguide_id
+                for bioguide_id in members_to_process
+            }
+            
+            for future in concurrent.futures.as_completed(futures):
+                bioguide_id = futures[future]
+                try:
+                    result = future.result()
+                    results.append(result)
                     
-            except Exception as e:
-                logger.error(f"Error processing member {bioguide_id}: {str(e)}", exc_info=True)
-                error_count += 1
+                    if result['status'] == 'success':
+                        processed_count += 1
+                    else:
+                        error_count += 1
+                        
+                except Exception as e:
+                    logger.error(f"Error processing member {bioguide_id}: {str(e)}", exc_info=True)
+                    error_count += 1
         
         # Clean up old files
         cleanup_old_files(os.path.join(os.path.dirname(__file__), 'raw', 'details'), 
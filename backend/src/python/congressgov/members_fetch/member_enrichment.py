@@ -5,15 +5,23 @@ Only processes bills that already exist in the database.
 """
 
 import os
+import io
+import atexit
+import csv
 import json
 import argparse
+import concurrent.futures
+from itertools import islice
+from functools import lru_cache
+from operator import itemgetter
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Tuple, Set
+from typing import Dict, Any, List, Optional, Tuple, Set, Iterable, Iterator
+from psycopg2.extras import execute_values
 
 # Import utilities
 from congressgov.utils.logging_config import setup_logging
-from congressgov.utils.api import APIClient, RetryStrategy
-from congressgov.utils.database import get_db_connection, with_db_transaction
+from congressgov.utils.api import APIClient
+from congressgov.utils.database import get_db_connection, with_db_transaction, POOL_MAX_CONN
 from congressgov.utils.file_storage import ensure_directory, save_json, cleanup_old_files
 
 # Set up logging
@@ -29,6 +37,35 @@ SYNC_STATUS_SUCCESS = 'success'
 SYNC_STATUS_FAILED = 'failed'
 SYNC_STATUS_IN_PROGRESS = 'in_progress'
 RAW_DATA_RETENTION_DAYS = 30
+INSERT_BATCH_SIZE = 1000  # Items resolved and inserted per statement
+COPY_THRESHOLD = 5000  # Cosponsorships per member above which rows are bulk loaded with COPY
+IN_PROGRESS_THRESHOLD = 20  # Minimum members in a run before writing an in-progress status
+SYNC_CHECKPOINT_INTERVAL = 50  # Members between progress checkpoints on long runs
+MAX_WORKERS = 8  # Concurrent members; keep below the database pool size (DB_POOL_MAX_CONN)
+
+@lru_cache(maxsize=8)
+def _format_from_date(from_date: datetime) -> str:
+    """Format a from_date for the API; cached since one cutoff is shared by every member in a run."""
+    return from_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+_bill_key = itemgetter('type', 'number')
+
+def _bill_candidates(items: Iterable[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], str]]:
+    """Pair each item with its bill number, dropping items without a type or number."""
+    candidates = []
+    for item in items:
+        try:
+            bill_type, number = _bill_key(item)
+        except KeyError:
+            continue
+        candidates.append((item, f"{bill_type}{number}"))
+    return candidates
+
+def _chunked(items: Iterable, size: int) -> Iterator[List]:
+    """Yield successive lists of at most size items from any iterable."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
 
 class MemberEnrichment:
     """Handles enriching member data with sponsored and cosponsored legislation."""
@@ -38,18 +75,59 @@ class MemberEnrichment:
         self.api_client = api_client
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.raw_dir = ensure_directory(os.path.dirname(__file__), 'raw', self.timestamp)
+        # bill_number -> id for bills already resolved this run; only known bills are cached
+        self.bill_ids: Dict[str, int] = {}
+        # member id -> cosponsor columns (bioguide_id, full_name, party, state, chamber, district)
+        self.member_info: Dict[int, Optional[Tuple]] = {}
+        # bioguide_id -> raw data directory already created this run
+        self._member_dirs: Dict[str, str] = {}
         
-        # Cache of bill IDs from database
-        self.existing_bills = self._get_existing_bills()
-        logger.info(f"Loaded {len(self.existing_bills)} existing bills from database")
-        
-    def _get_existing_bills(self) -> Dict[str, int]:
-        """Get dictionary of existing bill numbers mapped to their IDs."""
+    def _get_existing_bills(self, cursor, bill_numbers: Set[str]) -> Dict[str, int]:
+        """Get the subset of the given bill numbers that exist in the database, mapped to their IDs."""
+        # Bills resolved for earlier members are served from the run-level cache
+        found = {
+            bill_number: bill_id for bill_number in bill_numbers
+            if (bill_id := self.bill_ids.get(bill_number)) is not None
+        }
+        missing = [bill_number for bill_number in bill_numbers if bill_number not in found]
+        if not missing:
+            return found
+            
+        cursor.execute("""
+            SELECT bill_number, id 
+            FROM bills 
+            WHERE bill_number = ANY(%s)
+        """, (missing,))
+        resolved = dict(cursor.fetchall())
+        self.bill_ids.update(resolved)
+        found.update(resolved)
+        return found
+                
+    def preload_member_info(self, member_ids: List[int]):
+        """Load cosponsor info for all members of a run in one query."""
+        missing = [member_id for member_id in member_ids if member_id not in self.member_info]
+        if not missing:
+            return
+            
         with get_db_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute("SELECT id, bill_number FROM bills")
-                return {row[1]: row[0] for row in cur.fetchall()}
-                
+                cur.execute("""
+                    SELECT id, bioguide_id, full_name, party, state, chamber, district
+                    FROM members WHERE id = ANY(%s)
+                """, (missing,))
+                for member_id, *info in cur.fetchall():
+                    self.member_info[member_id] = tuple(info)
+        
+    def _get_member_info(self, cursor, member_id: int) -> Optional[Tuple]:
+        """Get the member columns copied into bill_cosponsors, cached per member."""
+        if member_id not in self.member_info:
+            cursor.execute("""
+                SELECT bioguide_id, full_name, party, state, chamber, district
+                FROM members WHERE id = %s
+            """, (member_id,))
+            self.member_info[member_id] = cursor.fetchone()
+        return self.member_info[member_id]
+        
     def fetch_sponsored_legislation(self, bioguide_id: str, from_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Fetch sponsored legislation for a member."""
         endpoint = SPONSORED_ENDPOINT.format(bioguideId=bioguide_id)
@@ -58,10 +136,10 @@ class MemberEnrichment:
         }
         
         if from_date:
-            params['fromDateTime'] = from_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+            params['fromDateTime'] = _format_from_date(from_date)
             
         logger.info(f"Fetching sponsored legislation for member {bioguide_id}")
-        return self.api_client.get_paginated(endpoint, params, 'sponsoredLegislation')
+        return self.api_client.get_paginated(endpoint, params, 'sponsoredLegislation', max_pages=None)
         
     def fetch_cosponsored_legislation(self, bioguide_id: str, from_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Fetch cosponsored legislation for a member."""
@@ -71,107 +149,152 @@ class MemberEnrichment:
         }
         
         if from_date:
-            params['fromDateTime'] = from_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+            params['fromDateTime'] = _format_from_date(from_date)
             
         logger.info(f"Fetching cosponsored legislation for member {bioguide_id}")
-        return self.api_client.get_paginated(endpoint, params, 'cosponsoredLegislation')
+        return self.api_client.get_paginated(endpoint, params, 'cosponsoredLegislation', max_pages=None)
         
     def save_legislation_data(self, data: List[Dict[str, Any]], bioguide_id: str, data_type: str) -> str:
         """Save legislation data to a JSON file."""
-        dir_path = ensure_directory(self.raw_dir, bioguide_id)
+        # Both data types for a member share a directory; create it only once
+        dir_path = self._member_dirs.get(bioguide_id)
+        if dir_path is None:
+            dir_path = self._member_dirs[bioguide_id] = ensure_directory(self.raw_dir, bioguide_id)
         filename = f"{data_type}_{bioguide_id}.json"
         
         return save_json({data_type: data}, dir_path, filename)
         
-    @with_db_transaction
-    def update_sponsored_legislation(self, cursor, member_id: int, data: List[Dict[str, Any]]) -> Dict[str, int]:
-        """Update sponsored legislation relationships for a member."""
-        stats = {"processed": 0, "associated": 0, "skipped": 0}
+    def update_sponsored_legislation(self, cursor, member_id: int, data: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """Update sponsored legislation relationships for a member using the caller's cursor."""
+        processed = candidate_count = associated = 0
         
-        for item in data:
-            stats["processed"] += 1
+        for chunk in _chunked(data, INSERT_BATCH_SIZE):
+            processed += len(chunk)
             
             # Skip amendments for now as they require different handling
-            if 'amendmentNumber' in item:
-                continue
-                
-            # Create the bill number
-            bill_type = item.get('type', '')
-            bill_number = f"{bill_type}{item.get('number', '')}"
-            
-            # Skip if bill not in database
-            if bill_number not in self.existing_bills:
-                logger.debug(f"Skipping bill {bill_number} - not in database")
-                stats["skipped"] += 1
-                continue
-                
-            bill_id = self.existing_bills[bill_number]
-            introduced_date = item.get('introducedDate')
+            candidates = _bill_candidates(item for item in chunk if 'amendmentNumber' not in item)
             
-            # Insert sponsored legislation relationship
-            cursor.execute("""
-                INSERT INTO sponsored_legislation (
-                    member_id, bill_id, introduced_date
-                ) VALUES (%s, %s, %s)
-                ON CONFLICT (member_id, bill_id) DO NOTHING
-            """, (
-                member_id,
-                bill_id,
-                introduced_date
-            ))
+            # Sponsored bills are rarely shared between members, so rather than resolving ids
+            # first, join against bills in the insert itself: only existing bills are associated
+            rows = [(member_id, bill_number, item.get('introducedDate')) for item, bill_number in candidates]
             
-            stats["associated"] += 1
+            if rows:
+                matched = execute_values(cursor, """
+                    WITH incoming (member_id, bill_number, introduced_date) AS (VALUES %s),
+                    matched AS (
+                        SELECT i.member_id, b.id AS bill_id, i.introduced_date::date AS introduced_date
+                        FROM incoming i
+                        JOIN bills b ON b.bill_number = i.bill_number
+                    ),
+                    inserted AS (
+                        INSERT INTO sponsored_legislation (
+                            member_id, bill_id, introduced_date
+                        )
+                        SELECT member_id, bill_id, introduced_date FROM matched
+                        ON CONFLICT (member_id, bill_id) DO NOTHING
+                    )
+                    SELECT count(*) FROM matched
+                """, rows, page_size=INSERT_BATCH_SIZE, fetch=True)
+                associated += sum(count for count, in matched)
+                
+            candidate_count += len(candidates)
             
-        return stats
+        # Amendments are excluded from both counts, as they are never candidates
+        return {"processed": processed, "associated": associated, "skipped": candidate_count - associated}
         
-    @with_db_transaction
-    def update_cosponsored_legislation(self, cursor, member_id: int, data: List[Dict[str, Any]]) -> Dict[str, int]:
-        """Update cosponsored legislation relationships for a member."""
-        stats = {"processed": 0, "associated": 0, "skipped": 0}
+    def update_cosponsored_legislation(self, cursor, member_id: int, data: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """Update cosponsored legislation relationships for a member using the caller's cursor."""
+        processed = associated = 0
         
-        for item in data:
-            stats["processed"] += 1
+        # Get member info for cosponsor records once for the whole batch
+        member_info = self._get_member_info(cursor, member_id)
+        
+        # Fallback date for cosponsorships without one
+        today = datetime.now().strftime('%Y-%m-%d')
+        
+        pending_rows = []
+        staged = False
+        
+        for chunk in _chunked(data, INSERT_BATCH_SIZE):
+            processed += len(chunk)
             
-            # Create the bill number
-            bill_type = item.get('type', '')
-            bill_number = f"{bill_type}{item.get('number', '')}"
+            cosponsored_rows = []
+            # Keyed by bill number: one upsert statement cannot touch the same row twice
+            cosponsor_rows = {}
             
-            # Skip if bill not in database
-            if bill_number not in self.existing_bills:
-                logger.debug(f"Skipping bill {bill_number} - not in database")
-                stats["skipped"] += 1
-                continue
+            candidates = _bill_candidates(chunk)
+            existing_bills = self._get_existing_bills(cursor, {bill_number for _, bill_number in candidates})
+            
+            for item, bill_number in candidates:
+                # Skip if bill not in database
+                bill_id = existing_bills.get(bill_number)
+                if bill_id is None:
+                    logger.debug(f"Skipping bill {bill_number} - not in database")
+                    continue
+                    
+                cosponsored_date = item.get('cosponsorDate') or today
                 
-            bill_id = self.existing_bills[bill_number]
-            cosponsored_date = item.get('cosponsorDate') or datetime.now().strftime('%Y-%m-%d')
+                cosponsored_rows.append((member_id, bill_id, cosponsored_date, bill_number))
+                
+                if member_info:
+                    cosponsor_rows[bill_number] = (bill_number, *member_info, cosponsored_date)
             
-            # Insert cosponsored legislation relationship
+            # Large histories switch to COPY through a staging table once past the threshold
+            pending_rows.extend(cosponsored_rows)
+            if staged or len(pending_rows) > COPY_THRESHOLD:
+                if not staged:
+                    cursor.execute("""
+                        CREATE TEMP TABLE staging_cosponsored (
+                            member_id INTEGER,
+                            bill_id INTEGER,
+                            cosponsored_date DATE,
+                            bill_number TEXT
+                        ) ON COMMIT DROP
+                    """)
+                    staged = True
+                self._copy_cosponsored_rows(cursor, pending_rows)
+                pending_rows = []
+                
+            if cosponsor_rows and not staged:
+                # Update bill_cosponsors table; staged rows are merged once at the end
+                execute_values(cursor, """
+                    INSERT INTO bill_cosponsors (
+                        bill_number, cosponsor_id, cosponsor_name,
+                        cosponsor_party, cosponsor_state, cosponsor_chamber,
+                        cosponsor_district, cosponsor_date
+                    ) VALUES %s
+                    ON CONFLICT (bill_number, cosponsor_id) DO UPDATE SET
+                        cosponsor_name = EXCLUDED.cosponsor_name,
+                        cosponsor_party = EXCLUDED.cosponsor_party,
+                        cosponsor_state = EXCLUDED.cosponsor_state,
+                        cosponsor_chamber = EXCLUDED.cosponsor_chamber,
+                        cosponsor_district = EXCLUDED.cosponsor_district,
+                        cosponsor_date = EXCLUDED.cosponsor_date
+                """, list(cosponsor_rows.values()), template="(%s, %s, %s, %s, %s, %s, %s, %s)", page_size=INSERT_BATCH_SIZE)
+                
+            associated += len(cosponsored_rows)
+            
+        if staged:
             cursor.execute("""
                 INSERT INTO cosponsored_legislation (
                     member_id, bill_id, cosponsored_date
-                ) VALUES (%s, %s, %s)
+                )
+                SELECT member_id, bill_id, cosponsored_date FROM staging_cosponsored
                 ON CONFLICT (member_id, bill_id) DO NOTHING
-            """, (
-                member_id,
-                bill_id,
-                cosponsored_date
-            ))
-            
-            # Get member info for cosponsor record
-            cursor.execute("""
-                SELECT bioguide_id, full_name, party, state, chamber, district
-                FROM members WHERE id = %s
-            """, (member_id,))
-            member_info = cursor.fetchone()
+            """)
             
             if member_info:
-                # Update bill_cosponsors table
+                # One upsert cannot touch the same row twice, so keep one row per bill
                 cursor.execute("""
                     INSERT INTO bill_cosponsors (
                         bill_number, cosponsor_id, cosponsor_name,
                         cosponsor_party, cosponsor_state, cosponsor_chamber,
                         cosponsor_district, cosponsor_date
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                    )
+                    SELECT DISTINCT ON (bill_number)
+                        bill_number, %s, %s, %s, %s, %s, %s, cosponsored_date
+                    FROM staging_cosponsored
+                    ORDER BY bill_number, cosponsored_date DESC
                     ON CONFLICT (bill_number, cosponsor_id) DO UPDATE SET
                         cosponsor_name = EXCLUDED.cosponsor_name,
                         cosponsor_party = EXCLUDED.cosponsor_party,
@@ -179,66 +302,78 @@ class MemberEnrichment:
                         cosponsor_chamber = EXCLUDED.cosponsor_chamber,
                         cosponsor_district = EXCLUDED.cosponsor_district,
                         cosponsor_date = EXCLUDED.cosponsor_date
-                """, (
-                    bill_number,
-                    member_info[0],  # bioguide_id
-                    member_info[1],  # full_name
-                    member_info[2],  # party
-                    member_info[3],  # state
-                    member_info[4],  # chamber
-                    member_info[5],  # district
-                    cosponsored_date
-                ))
+                """, member_info)
+        elif pending_rows:
+            execute_values(cursor, """
+                INSERT INTO cosponsored_legislation (
+                    member_id, bill_id, cosponsored_date
+                ) VALUES %s
+                ON CONFLICT (member_id, bill_id) DO NOTHING
+            """, [row[:3] for row in pending_rows], page_size=INSERT_BATCH_SIZE)
             
-            stats["associated"] += 1
+        return {"processed": processed, "associated": associated, "skipped": processed - associated}
+    
+    @staticmethod
+    def _copy_cosponsored_rows(cursor, rows: List[Tuple[int, int, str, str]]):
+        """Bulk load cosponsorship rows into the staging table with COPY."""
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
+        cursor.copy_expert("COPY staging_cosponsored FROM STDIN WITH CSV", buffer)
+        
+    @with_db_transaction
+    def store_legislation(cursor, self, member_id: int, sponsored_data: List[Dict[str, Any]],
+                          cosponsored_data: List[Dict[str, Any]]) -> Dict[str, Dict[str, int]]:
+        """
+        Write a member's sponsored and cosponsored relationships and mark the member
+        updated, all in one transaction so last_updated only moves if the data landed.
+        """
+        # The decorator injects 'cursor' as the first parameter, shifting 'self' to second position
+        results = {}
+        if sponsored_data:
+            results["sponsored"] = self.update_sponsored_legislation(cursor, member_id, sponsored_data)
+        if cosponsored_data:
+            results["cosponsored"] = self.update_cosponsored_legislation(cursor, member_id, cosponsored_data)
             
-        return stats
+        cursor.execute("""
+            UPDATE members 
+            SET last_updated = CURRENT_TIMESTAMP 
+            WHERE id = %s
+        """, (member_id,))
+        return results
         
-    def process_member(self, bioguide_id: str, from_date: Optional[datetime] = None) -> Dict[str, Any]:
-        """Process a single member, enriching with sponsored and cosponsored legislation."""
+    def process_member(self, member_id: int, bioguide_id: str, from_date: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Process a single member, enriching with sponsored and cosponsored legislation.
+        The caller is responsible for resolving member_id (see get_member_ids).
+        """
         results = {
             "bioguide_id": bioguide_id,
+            "member_id": member_id,
             "status": "success",
             "sponsored": {"processed": 0, "associated": 0, "skipped": 0},
             "cosponsored": {"processed": 0, "associated": 0, "skipped": 0}
         }
         
         try:
-            # Get member ID
-            with get_db_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute("SELECT id FROM members WHERE bioguide_id = %s", (bioguide_id,))
-                    result = cur.fetchone()
-                    if not result:
-                        logger.warning(f"Member {bioguide_id} not found in database")
-                        results["status"] = "failed"
-                        results["error"] = "Member not found in database"
-                        return results
-                    member_id = result[0]
-                    
-            # Fetch and process sponsored legislation
-            sponsored_data = self.fetch_sponsored_legislation(bioguide_id, from_date)
+            # Fetch sponsored and cosponsored legislation concurrently
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                sponsored_future = executor.submit(self.fetch_sponsored_legislation, bioguide_id, from_date)
+                cosponsored_future = executor.submit(self.fetch_cosponsored_legislation, bioguide_id, from_date)
+                sponsored_data = sponsored_future.result()
+                cosponsored_data = cosponsored_future.result()
+                
+            # Save raw data before taking a database connection
             if sponsored_data:
                 self.save_legislation_data(sponsored_data, bioguide_id, 'sponsored')
-                results["sponsored"] = self.update_sponsored_legislation(member_id=member_id, data=sponsored_data)
-                logger.info(f"Processed {len(sponsored_data)} sponsored bills for {bioguide_id}")
-                
-            # Fetch and process cosponsored legislation
-            cosponsored_data = self.fetch_cosponsored_legislation(bioguide_id, from_date)
             if cosponsored_data:
                 self.save_legislation_data(cosponsored_data, bioguide_id, 'cosponsored')
-                results["cosponsored"] = self.update_cosponsored_legislation(member_id=member_id, data=cosponsored_data)
-                logger.info(f"Processed {len(cosponsored_data)} cosponsored bills for {bioguide_id}")
                 
-            # Update member's last_updated timestamp
-            with get_db_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute("""
-                        UPDATE members 
-                        SET last_updated = CURRENT_TIMESTAMP 
-                        WHERE id = %s
-                    """, (member_id,))
-                conn.commit()
+            results.update(self.store_legislation(
+                member_id=member_id, sponsored_data=sponsored_data, cosponsored_data=cosponsored_data
+            ))
+            logger.info(f"Processed {len(sponsored_data)} sponsored and {len(cosponsored_data)} "
+                        f"cosponsored bills for {bioguide_id}")
                 
         except Exception as e:
             logger.error(f"Error processing member {bioguide_id}: {str(e)}", exc_info=True)
@@ -273,22 +408,59 @@ def get_members_for_processing(recent_only: bool = True, days: int = 7, limit: i
             
             return [row[0] for row in cur.fetchall()]
 
-def update_sync_status(status: str, processed: int = 0, errors: int = 0, error: str = None):
-    """Update sync status in the database."""
+def get_member_ids(bioguide_ids: List[str]) -> Dict[str, int]:
+    """Resolve database IDs for a list of bioguide IDs in a single query."""
+    if not bioguide_ids:
+        return {}
+        
     with get_db_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(f"""
+            cur.execute("""
+                SELECT bioguide_id, id 
+                FROM members 
+                WHERE bioguide_id = ANY(%s)
+            """, (list(bioguide_ids),))
+            return dict(cur.fetchall())
+
+# Latest sync status not yet written to the database
+_pending_sync_status = None
+
+def update_sync_status(status: str, processed: int = 0, errors: int = 0, error: str = None, flush: bool = True):
+    """Record sync status for both legislation endpoints, writing it now unless flush is False."""
+    global _pending_sync_status
+    _pending_sync_status = (status, processed, errors, error)
+    
+    if flush:
+        flush_sync_status()
+
+def flush_sync_status():
+    """Write the pending sync status for both legislation endpoints in a single statement."""
+    global _pending_sync_status
+    if _pending_sync_status is None:
+        return
+        
+    status, processed, _, error = _pending_sync_status
+    rows = [(endpoint, processed, status, error) for endpoint in (SPONSORED_ENDPOINT, COSPONSORED_ENDPOINT)]
+    
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            execute_values(cur, f"""
                 INSERT INTO {SYNC_STATUS_TABLE} (
                     endpoint, last_sync_timestamp, last_successful_offset,
                     status, last_error
-                ) VALUES (%s, CURRENT_TIMESTAMP, %s, %s, %s)
+                ) VALUES %s
                 ON CONFLICT (endpoint) DO UPDATE SET
                     last_sync_timestamp = CURRENT_TIMESTAMP,
                     last_successful_offset = EXCLUDED.last_successful_offset,
                     status = EXCLUDED.status,
                     last_error = EXCLUDED.last_error
-            """, (SPONSORED_ENDPOINT, processed, status, error))
+            """, rows, template="(%s, CURRENT_TIMESTAMP, %s, %s, %s)")
             conn.commit()
+            
+    _pending_sync_status = None
+
+# Write any deferred checkpoint if the run is interrupted
+atexit.register(flush_sync_status)
 
 def main():
     parser = argparse.ArgumentParser(description='Enrich member data with sponsored and cosponsored legislation')
@@ -296,7 +468,7 @@ def main():
     parser.add_argument('--all', action='store_true', help='Process all current members instead of just recent ones')
     parser.add_argument('--days', type=int, default=7, help='For recent mode, how many days back to consider')
     parser.add_argument('--limit', type=int, default=100, help='Maximum number of members to process')
-    parser.add_argument('--refresh', action='store_true', help='Refresh bill cache before processing')
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS, help='Number of members to process concurrently')
     args = parser.parse_args()
     
     try:
@@ -306,9 +478,6 @@ def main():
         # Initialize processor
         processor = MemberEnrichment(api_client)
         
-        # Update status to in-progress
-        update_sync_status(SYNC_STATUS_IN_PROGRESS)
-        
         # Determine which members to process
         if args.member:
             # Process single specified member
@@ -320,30 +489,66 @@ def main():
             members_to_process = get_members_for_processing(recent_only, args.days, args.limit)
             logger.info(f"Processing {len(members_to_process)} members")
         
+        # Only mark the run in progress when it is long enough for the marker to be useful
+        track_progress = len(members_to_process) > IN_PROGRESS_THRESHOLD
+        if track_progress:
+            update_sync_status(SYNC_STATUS_IN_PROGRESS)
+        
+        # Resolve member IDs and cosponsor info up front in single queries
+        member_ids = get_member_ids(members_to_process)
+        processor.preload_member_info(list(member_ids.values()))
+        
         # Process each member
         results = []
         processed_count = 0
         error_count = 0
         
+        # For incremental processing, determine from_date once for the whole run
+        from_date = None
+        if not args.all and not args.member:
+            # Look back N days for recent changes
+            from_date = datetime.now() - timedelta(days=args.days)
+        
+        pending = []
         for bioguide_id in members_to_process:
-            try:
-                # For incremental processing, determine from_date
-                from_date = None
-                if not args.all and not args.member:
-                    # Look back N days for recent changes
-                    from_date = datetime.now() - timedelta(days=args.days)
-                
-                result = processor.process_member(bioguide_id, from_date)
-                results.append(result)
-                
-                if result['status'] == 'success':
-                    processed_count += 1
-                else:
+            member_id = member_ids.get(bioguide_id)
+            if member_id is None:
+                logger.warning(f"Member {bioguide_id} not found in database")
+                error_count += 1
+                continue
+            pending.append((member_id, bioguide_id))
+        
+        # Members are independent, so process them concurrently
+        # Each worker holds at most one pooled connection, so never exceed the pool size
+        workers = max(1, min(args.workers, POOL_MAX_CONN, len(pending)))
+        if args.workers > POOL_MAX_CONN:
+            logger.warning(f"Limiting workers to {POOL_MAX_CONN} (DB_POOL_MAX_CONN)")
+            
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(processor.process_member, member_id, bioguide_id, from_date): (member_id, bioguide_id)
+                for member_id, bioguide_id in pending
+            }
+            
+            for future in concurrent.futures.as_completed(futures):
+                member_id, bioguide_id = futures[future]
+                try:
+                    result = future.result()
+                    results.append(result)
+                    
+                    if result['status'] == 'success':
+                        processed_count += 1
+                    else:
+                        error_count += 1
+                        
+                except Exception as e:
+                    logger.error(f"Error processing member {bioguide_id}: {str(e)}", exc_info=True)
                     error_count += 1
                     
-            except Exception as e:
-                logger.error(f"Error processing member {bioguide_id}: {str(e)}", exc_info=True)
-                error_count += 1
+                # Checkpoint progress in memory; it is written at the end of the run or on exit
+                done = processed_count + error_count
+                if track_progress and done % SYNC_CHECKPOINT_INTERVAL == 0:
+                    update_sync_status(SYNC_STATUS_IN_PROGRESS, processed_count, error_count, flush=False)
         
         # Clean up old files
         cleanup_old_files(os.path.join(os.path.dirname(__file__), 'raw'), 
@@ -6,14 +6,18 @@ Retrieves members from Congress.gov API and stores them in the database.
 
 import os
 import json
+import queue
 import argparse
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Set
+import threading
+from datetime import datetime, timedelta, date, timezone
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Set, Iterable, Iterator, Tuple
+from psycopg2.extras import execute_values
 
 # Import utilities
 from congressgov.utils.logging_config import setup_logging
 from congressgov.utils.api import APIClient
-from congressgov.utils.database import get_db_connection, with_db_transaction
+from congressgov.utils.database import get_db_connection, with_db_transaction, copy_rows
 from congressgov.utils.file_storage import ensure_directory, save_json, cleanup_old_files
 from congressgov.utils.member_utils import (
     parse_member_name, format_full_name, normalize_state_code, 
@@ -29,6 +33,55 @@ MEMBERS_LIST_ENDPOINT = "member"
 SYNC_STATUS_TABLE = "api_sync_status"
 DEFAULT_LIMIT = 250
 RAW_DATA_RETENTION_DAYS = 30
+INSERT_PAGE_SIZE = 500  # Rows per multi-row INSERT statement
+COPY_THRESHOLD = INSERT_PAGE_SIZE  # Rows above which upserts are bulk loaded with COPY through a staging table
+# Full pipeline batches (PIPELINE_BATCH_SIZE > COPY_THRESHOLD) take the COPY path;
+# small incremental syncs stay on multi-row INSERTs
+PIPELINE_BATCH_SIZE = 1000  # Members written per transaction while later pages are still being fetched
+PIPELINE_DEPTH = 4  # Batches buffered between the fetch thread and the database writer
+
+MEMBER_COLUMNS = (
+    "bioguide_id, first_name, last_name, full_name, "
+    "state, district, party, chamber, photo_url, current_member"
+)
+MEMBER_UPDATE_SET = """
+    first_name = EXCLUDED.first_name,
+    last_name = EXCLUDED.last_name,
+    full_name = EXCLUDED.full_name,
+    state = EXCLUDED.state,
+    district = EXCLUDED.district,
+    party = EXCLUDED.party,
+    chamber = EXCLUDED.chamber,
+    photo_url = EXCLUDED.photo_url,
+    current_member = EXCLUDED.current_member,
+    last_updated = CURRENT_TIMESTAMP
+"""
+# Rows whose tracked columns are unchanged skip the full update; _upsert_members then only
+# advances their last_updated
+MEMBER_CHANGED = """
+    WHERE (members.first_name, members.last_name, members.full_name, members.state,
+           members.district, members.party, members.chamber, members.photo_url,
+           members.current_member)
+      IS DISTINCT FROM
+          (EXCLUDED.first_name, EXCLUDED.last_name, EXCLUDED.full_name, EXCLUDED.state,
+           EXCLUDED.district, EXCLUDED.party, EXCLUDED.chamber, EXCLUDED.photo_url,
+           EXCLUDED.current_member)
+"""
+TERM_COLUMNS = "member_id, congress, chamber, party, state, district, start_date, end_date"
+TERM_UPDATE_SET = """
+    party = EXCLUDED.party,
+    state = EXCLUDED.state,
+    district = EXCLUDED.district,
+    start_date = EXCLUDED.start_date,
+    end_date = EXCLUDED.end_date
+"""
+TERM_CHANGED = """
+    WHERE (member_terms.party, member_terms.state, member_terms.district,
+           member_terms.start_date, member_terms.end_date)
+      IS DISTINCT FROM
+          (EXCLUDED.party, EXCLUDED.state, EXCLUDED.district,
+           EXCLUDED.start_date, EXCLUDED.end_date)
+"""
 
 def get_last_sync_timestamp() -> Optional[datetime]:
     """Get the last successful sync timestamp from the database."""
@@ -61,16 +114,119 @@ def update_sync_status(status: str, offset: int = 0, error: str = None):
             """, (MEMBERS_LIST_ENDPOINT, offset, status, error))
             conn.commit()
 
-def save_members_to_json(members_data: Dict[str, Any], timestamp: str = None) -> str:
-    """Save members data to a JSON file."""
+def save_members_to_json(members_data: Dict[str, Any], timestamp: str = None, part: int = None) -> str:
+    """Save members data to a JSON file, numbered by part when a run is written in batches."""
     if timestamp is None:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     raw_dir = ensure_directory(os.path.dirname(__file__), 'raw', timestamp)
-    filename = f"members_{timestamp}.json"
+    filename = f"members_{timestamp}.json" if part is None else f"members_{timestamp}_{part:04d}.json"
     
     return save_json(members_data, raw_dir, filename)
 
+def _upsert_members(cursor, rows: List[tuple]) -> Dict[str, int]:
+    """Upsert member rows and return a mapping of bioguide ID to member ID."""
+    if len(rows) > COPY_THRESHOLD:
+        cursor.execute("""
+            CREATE TEMP TABLE members_stage (
+                bioguide_id TEXT,
+                first_name TEXT,
+                last_name TEXT,
+                full_name TEXT,
+                state TEXT,
+                district INTEGER,
+                party TEXT,
+                chamber TEXT,
+                photo_url TEXT,
+                current_member BOOLEAN
+            ) ON COMMIT DROP
+        """)
+        copy_rows(cursor, 'members_stage', rows)
+        cursor.execute(f"""
+            INSERT INTO members ({MEMBER_COLUMNS}, last_updated)
+            SELECT {MEMBER_COLUMNS}, CURRENT_TIMESTAMP FROM members_stage
+            ON CONFLICT (bioguide_id) DO UPDATE SET {MEMBER_UPDATE_SET} {MEMBER_CHANGED}
+            RETURNING id, bioguide_id
+        """)
+        returned = cursor.fetchall()
+    else:
+        returned = execute_values(cursor, f"""
+            INSERT INTO members ({MEMBER_COLUMNS}, last_updated)
+            VALUES %s
+            ON CONFLICT (bioguide_id) DO UPDATE SET {MEMBER_UPDATE_SET} {MEMBER_CHANGED}
+            RETURNING id, bioguide_id
+        """, rows,
+            template="(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)",
+            page_size=INSERT_PAGE_SIZE, fetch=True)
+            
+    member_ids = {bioguide_id: member_id for member_id, bioguide_id in returned}
+    
+    # Rows skipped as unchanged return nothing. They only reached the upsert because the
+    # API's updateDate is newer than last_updated, so advance last_updated (and get their
+    # IDs) or every later incremental sync would re-process them
+    missing = [row[0] for row in rows if row[0] not in member_ids]
+    if missing:
+        cursor.execute("""
+            UPDATE members SET last_updated = CURRENT_TIMESTAMP
+            WHERE bioguide_id = ANY(%s)
+            RETURNING id, bioguide_id
+        """, (missing,))
+        member_ids.update({bioguide_id: member_id for member_id, bioguide_id in cursor.fetchall()})
+        
+    return member_ids
+
+def _upsert_terms(cursor, rows: List[tuple]):
+    """Upsert member term rows."""
+    if len(rows) > COPY_THRESHOLD:
+        cursor.execute("""
+            CREATE TEMP TABLE member_terms_stage (
+                member_id INTEGER,
+                congress INTEGER,
+                chamber TEXT,
+                party TEXT,
+                state TEXT,
+                district INTEGER,
+                start_date DATE,
+                end_date DATE
+            ) ON COMMIT DROP
+        """)
+        copy_rows(cursor, 'member_terms_stage', rows)
+        cursor.execute(f"""
+            INSERT INTO member_terms ({TERM_COLUMNS})
+            SELECT {TERM_COLUMNS} FROM member_terms_stage
+            ON CONFLICT (member_id, congress, chamber) DO UPDATE SET {TERM_UPDATE_SET} {TERM_CHANGED}
+        """)
+    else:
+        execute_values(cursor, f"""
+            INSERT INTO member_terms ({TERM_COLUMNS})
+            VALUES %s
+            ON CONFLICT (member_id, congress, chamber) DO UPDATE SET {TERM_UPDATE_SET} {TERM_CHANGED}
+        """, rows, page_size=INSERT_PAGE_SIZE)
+
+# Term years repeat across thousands of members, so parse each distinct value once
+# (parse_party_name is cached in member_utils)
+_year_to_date = lru_cache(maxsize=512)(year_to_date)
+
+@lru_cache(maxsize=512)
+def _term_start(start_year) -> Tuple[Optional[int], Optional[date]]:
+    """Return the congress number and start date for a term's start year."""
+    # Try to determine congress for the term
+    congress = None
+    if start_year:
+        try:
+            # Rough calculation: 
+            # 1st Congress started in 1789, add 1 every two years
+            congress = ((int(start_year) - 1789) // 2) + 1
+        except ValueError:
+            pass
+    return congress, _year_to_date(start_year)
+
+def _parse_update_date(value: str) -> datetime:
+    """Parse an API updateDate such as 2024-01-31T12:00:00Z into an aware UTC datetime."""
+    if value.endswith('Z'):
+        return datetime.fromisoformat(value[:-1]).replace(tzinfo=timezone.utc)
+    return datetime.fromisoformat(value)
+
 @with_db_transaction
 def update_database(cursor, members: List[Dict[str, Any]]) -> Dict[str, int]:
     """
@@ -85,6 +241,13 @@ def update_database(cursor, members: List[Dict[str, Any]]) -> Dict[str, int]:
     """
     stats = {"inserted": 0, "updated": 0, "skipped": 0, "error": 0}
     current_year = datetime.now().year
+    member_rows = {}
+    member_terms = {}
+    
+    # Look up existing members for the whole batch in one query
+    bioguide_ids = [member['bioguideId'] for member in members if member.get('bioguideId')]
+    cursor.execute("SELECT bioguide_id, last_updated FROM members WHERE bioguide_id = ANY(%s)", (bioguide_ids,))
+    existing = dict(cursor.fetchall())
     
     for member in members:
         try:
@@ -130,15 +293,14 @@ def update_database(cursor, members: List[Dict[str, Any]]) -> Dict[str, int]:
             update_date = member.get('updateDate')
             
             # Check if member already exists
-            cursor.execute("SELECT id, last_updated FROM members WHERE bioguide_id = %s", (bioguide_id,))
-            existing_member = cursor.fetchone()
+            existing_member = bioguide_id in existing
             
             # For incremental processing: if member exists and hasn't been modified since our data,
             # we can skip it
-            if existing_member and member.get('updateDate'):
+            if existing_member and update_date:
                 try:
-                    member_update_date = datetime.fromisoformat(member.get('updateDate').replace('Z', '+00:00'))
-                    db_update_date = existing_member[1]
+                    member_update_date = _parse_update_date(update_date)
+                    db_update_date = existing[bioguide_id]
                     
                     if db_update_date and db_update_date >= member_update_date:
                         logger.debug(f"Skipping member {bioguide_id} - no updates")
@@ -148,75 +310,27 @@ def update_database(cursor, members: List[Dict[str, Any]]) -> Dict[str, int]:
                     # If date parsing fails, proceed with update
                     pass
             
-            # Insert or update member
-            cursor.execute("""
-                INSERT INTO members (
-                    bioguide_id, first_name, last_name, full_name, 
-                    state, district, party, chamber, photo_url, 
-                    current_member, last_updated
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
-                ON CONFLICT (bioguide_id) DO UPDATE SET
-                    first_name = EXCLUDED.first_name,
-                    last_name = EXCLUDED.last_name,
-                    full_name = EXCLUDED.full_name,
-                    state = EXCLUDED.state,
-                    district = EXCLUDED.district,
-                    party = EXCLUDED.party,
-                    chamber = EXCLUDED.chamber,
-                    photo_url = EXCLUDED.photo_url,
-                    current_member = EXCLUDED.current_member,
-                    last_updated = CURRENT_TIMESTAMP
-                RETURNING id
-            """, (
+            # Collect the member row; later duplicates replace earlier ones as sequential upserts would
+            member_rows[bioguide_id] = (
                 bioguide_id, first_name, last_name, full_name,
                 state, district, party_name, chamber, photo_url,
                 current_member
-            ))
-            
-            member_id = cursor.fetchone()[0]
+            )
             
-            # Insert member terms
+            # Collect member terms
+            term_rows = []
             for term in terms:
-                start_year = term.get('startYear')
-                end_year = term.get('endYear')
-                term_chamber = term.get('chamber', chamber)
-                term_state = term.get('state', state)
-                term_district = term.get('district', district)
-                
-                # Try to determine congress for the term
-                congress = None
-                if start_year:
-                    try:
-                        # Rough calculation: 
-                        # 1st Congress started in 1789, add 1 every two years
-                        start_year_int = int(start_year)
-                        congress = ((start_year_int - 1789) // 2) + 1
-                    except ValueError:
-                        pass
-                
-                cursor.execute("""
-                    INSERT INTO member_terms (
-                        member_id, congress, chamber, party, state, district,
-                        start_date, end_date
-                    ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s
-                    )
-                    ON CONFLICT (member_id, congress, chamber) DO UPDATE SET
-                        party = EXCLUDED.party,
-                        state = EXCLUDED.state,
-                        district = EXCLUDED.district,
-                        start_date = EXCLUDED.start_date,
-                        end_date = EXCLUDED.end_date
-                """, (
-                    member_id,
+                congress, start_date = _term_start(term.get('startYear'))
+                term_rows.append((
                     congress,
-                    term_chamber,
+                    term.get('chamber', chamber),
                     party_name,
-                    term_state,
-                    term_district,
-                    year_to_date(start_year),
-                    year_to_date(end_year)
+                    term.get('state', state),
+                    term.get('district', district),
+                    start_date,
+                    _year_to_date(term.get('endYear'))
                 ))
+            member_terms[bioguide_id] = term_rows
             
             # Record type of operation for stats
             if existing_member:
@@ -228,26 +342,43 @@ def update_database(cursor, members: List[Dict[str, Any]]) -> Dict[str, int]:
             logger.error(f"Error processing member {member.get('bioguideId', 'unknown')}: {str(e)}")
             stats["error"] += 1
     
+    if not member_rows:
+        return stats
+        
+    # Upsert all members, returning IDs for the terms
+    member_ids = _upsert_members(cursor, list(member_rows.values()))
+    
+    term_rows = {}
+    for bioguide_id, terms in member_terms.items():
+        member_id = member_ids[bioguide_id]
+        for term in terms:
+            # Key by the conflict target so one statement never updates the same row twice;
+            # a NULL congress never conflicts, so those rows are all kept
+            key = (member_id, term[0], term[1]) if term[0] is not None else len(term_rows)
+            term_rows[key] = (member_id,) + term
+    
+    if term_rows:
+        _upsert_terms(cursor, list(term_rows.values()))
+    
     return stats
 
-def fetch_members(api_client: APIClient, from_date: Optional[datetime] = None, 
-                 to_date: Optional[datetime] = None, limit: int = DEFAULT_LIMIT) -> Dict[str, Any]:
+def iter_member_batches(api_client: APIClient, from_date: Optional[datetime] = None,
+                        to_date: Optional[datetime] = None,
+                        batch_size: int = PIPELINE_BATCH_SIZE) -> Iterator[List[Dict[str, Any]]]:
     """
-    Fetch members from Congress.gov API.
+    Fetch members from Congress.gov API, yielding them in batches as pages arrive.
+    Pages after the first are requested concurrently.
     
     Args:
         api_client: API client
         from_date: Start date filter
         to_date: End date filter
-        limit: Maximum members per page
+        batch_size: Members per yielded batch
         
-    Returns:
-        Dictionary with fetched members data
+    Yields:
+        Lists of member data dictionaries
     """
-    params = {
-        'limit': limit,
-        'sort': 'updateDate desc'
-    }
+    params = {'sort': 'updateDate desc'}
     
     # Add date filtering if provided
     if from_date:
@@ -255,10 +386,52 @@ def fetch_members(api_client: APIClient, from_date: Optional[datetime] = None,
     if to_date:
         params['toUpdateDate'] = to_date.strftime("%Y-%m-%dT23:59:59Z")
     
-    # Get all members using pagination
-    members = api_client.get_paginated(MEMBERS_LIST_ENDPOINT, params, 'members')
+    batch = []
+    for member in api_client.iter_paginated_parallel(MEMBERS_LIST_ENDPOINT, params, 'members', DEFAULT_LIMIT):
+        batch.append(member)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def prefetch(items: Iterable, depth: int = PIPELINE_DEPTH) -> Iterator:
+    """
+    Consume an iterable on a background thread, keeping up to depth items ready.
+    
+    Lets the caller's work on one item overlap with producing the next. Exceptions
+    raised by the producer are re-raised in the caller.
+    """
+    buffer = queue.Queue(maxsize=depth)
+    done = object()
+    
+    def produce():
+        try:
+            for item in items:
+                buffer.put((item, None))
+        except Exception as e:
+            buffer.put((done, e))
+        else:
+            buffer.put((done, None))
+            
+    # Daemon thread so an abandoned pipeline never blocks interpreter exit
+    threading.Thread(target=produce, daemon=True).start()
     
-    return {'members': members, 'fetchDate': datetime.now().isoformat()}
+    while True:
+        item, error = buffer.get()
+        if item is done:
+            if error is not None:
+                raise error
+            return
+        yield item
+
+def filter_current_members(members: List[Dict[str, Any]], current_year: int) -> List[Dict[str, Any]]:
+    """Keep members whose latest term has not ended before the current year."""
+    return [
+        member for member in members
+        if (terms := member.get('terms', {}).get('item'))
+        and ((end_year := terms[-1].get('endYear')) is None or int(end_year) >= current_year)
+    ]
 
 def main():
     # Set up argument parser
@@ -298,43 +471,47 @@ def main():
         # Update status to in-progress
         update_sync_status('in_progress')
         
-        # Fetch members
+        # Fetch members on a background thread while earlier batches are written
         logger.info("Fetching members from Congress.gov API")
-        members_data = fetch_members(api_client, from_date, to_date)
-        
-        # Save to JSON file
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        file_path = save_members_to_json(members_data, timestamp)
-        logger.info(f"Members data saved to {file_path}")
-        
-        # Clean up old files
-        cleanup_old_files(os.path.join(os.path.dirname(__file__), 'raw'), 
-                         pattern='*', days=RAW_DATA_RETENTION_DAYS)
+        current_year = datetime.now().year
+        totals = {"inserted": 0, "updated": 0, "skipped": 0, "error": 0}
+        fetched = 0
         
-        # Update database
-        if members_data['members']:
+        batches = prefetch(iter_member_batches(api_client, from_date, to_date))
+        for part, batch in enumerate(batches):
+            fetched += len(batch)
+            
+            # Save the raw batch for auditing
+            file_path = save_members_to_json({'members': batch, 'fetchDate': datetime.now().isoformat()},
+                                             timestamp, part)
+            logger.info(f"Members data saved to {file_path}")
+            
             # Filter for current members if requested
             if args.current_only:
-                current_year = datetime.now().year
-                members = []
-                for member in members_data['members']:
-                    terms = member.get('terms', {}).get('item', [])
-                    if terms:
-                        last_term = terms[-1]
-                        end_year = last_term.get('endYear')
-                        if end_year is None or int(end_year) >= current_year:
-                            members.append(member)
-                logger.info(f"Filtered to {len(members)} current members from {len(members_data['members'])} total")
+                members = filter_current_members(batch, current_year)
+                logger.info(f"Filtered to {len(members)} current members from {len(batch)} in batch")
             else:
-                members = members_data['members']
+                members = batch
+                
+            if not members:
+                continue
                 
             logger.info(f"Updating database with {len(members)} members")
             stats = update_database(members=members)
-            logger.info(f"Database updated: {stats['inserted']} inserted, {stats['updated']} updated, "
-                       f"{stats['skipped']} skipped, {stats['error']} errors")
+            for key, value in stats.items():
+                totals[key] += value
+        
+        if fetched:
+            logger.info(f"Database updated: {totals['inserted']} inserted, {totals['updated']} updated, "
+                       f"{totals['skipped']} skipped, {totals['error']} errors")
         else:
             logger.info("No members to update")
         
+        # Clean up old files
+        cleanup_old_files(os.path.join(os.path.dirname(__file__), 'raw'), 
+                         pattern='*', days=RAW_DATA_RETENTION_DAYS)
+        
         # Update sync status to success
         update_sync_status('success')
         
@@ -3,17 +3,21 @@ Utilities package for Congress.gov data processing scripts.
 Provides shared functionality for API requests, database operations, and data processing.
 """
 
-from .api import APIClient, RetryStrategy
-from .database import get_db_connection, with_db_transaction
-from .file_storage import ensure_directory, save_json, load_json
+from .api import APIClient, RateLimiter
+from .database import (
+    get_db_connection, with_db_transaction, close_db_pool, execute_batch, execute_values_batch,
+    copy_rows, copy_upsert
+)
+from .file_storage import ensure_directory, save_json, load_json, append_jsonl, iter_jsonl
 from .logging_config import setup_logging
 from .tag_utils import normalize_tag_name, get_or_create_policy_area_tag, update_bill_tags
 from .bill_utils import normalize_bill_status, parse_bill_number
 
 __all__ = [
-    'APIClient', 'RetryStrategy',
-    'get_db_connection', 'with_db_transaction',
-    'ensure_directory', 'save_json', 'load_json',
+    'APIClient', 'RateLimiter',
+    'get_db_connection', 'with_db_transaction', 'close_db_pool', 'execute_batch', 'execute_values_batch',
+    'copy_rows', 'copy_upsert',
+    'ensure_directory', 'save_json', 'load_json', 'append_jsonl', 'iter_jsonl',
     'setup_logging',
     'normalize_tag_name', 'get_or_create_policy_area_tag', 'update_bill_tags',
     'normalize_bill_status', 'parse_bill_number'
@@ -5,62 +5,133 @@ API utilities for making requests to external services with error handling and r
 import os
 import time
 import logging
+import threading
+import concurrent.futures
 import requests
-from typing import Dict, Any, Optional, Callable
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, List, Optional, Iterator
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
 # Get API key from environment
 API_KEY = os.getenv('CONGRESSGOV_API_KEY')
 
+# Connection pool size per host; large enough for concurrent fetches sharing one client
+HTTP_POOL_SIZE = 32
+
+# Largest page size Congress.gov accepts for list endpoints
+MAX_PAGE_SIZE = 250
+
+# Default cap on pages per paginated request; pass max_pages=None to follow every page
+DEFAULT_MAX_PAGES = 10
+
+# Pages fetched at once by iter_paginated_parallel; the shared rate limiter still paces them
+PAGE_FETCH_WORKERS = 4
+
+# Identifies this project to the API
+USER_AGENT = 'congressgov/0.1.0'
+
+# Transport-level retries for connection errors and transient server responses
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 1
+HTTP_BACKOFF_JITTER = 0.5  # Random seconds added to each backoff so concurrent workers spread out
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Requests allowed back to back before the configured delay applies
+RATE_LIMIT_BURST = 10
+
+# Below this many remaining requests, slow down to the server's sustainable rate
+RATE_LIMIT_HEADROOM = 100
+
+# Fraction of the server's reported rate to use, leaving margin for clock skew
+RATE_LIMIT_SAFETY = 0.9
+
+# Window of the X-RateLimit-Limit header (api.data.gov limits are per hour)
+RATE_LIMIT_WINDOW = 3600
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
-class RetryStrategy:
-    """Implements exponential backoff and retry logic for API requests."""
+class RateLimiter:
+    """Thread-safe token bucket shared by all requests made through one client."""
     
-    def __init__(self, max_retries: int = 3, base_delay: int = 1):
-        self.max_retries = max_retries
-        self.base_delay = base_delay
-
-    def execute(self, func: Callable, *args, **kwargs) -> Any:
+    def __init__(self, rate: float, burst: int = RATE_LIMIT_BURST):
         """
-        Executes function with retry logic and exponential backoff
-        
         Args:
-            func: The function to execute
-            *args: Positional arguments to pass to the function
-            **kwargs: Keyword arguments to pass to the function
+            rate: Sustained requests per second (0 disables limiting)
+            burst: Maximum number of requests allowed back to back
+        """
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a request may be made."""
+        if self.rate <= 0:
+            return
             
-        Returns:
-            The result of the function call
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve a token even if it is not available yet so waiting callers queue up in order
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
             
-        Raises:
-            The last exception encountered if all retries fail
-        """
-        last_error = None
-        
-        for attempt in range(self.max_retries):
-            try:
-                return func(*args, **kwargs)
-            except requests.RequestException as e:
-                last_error = e
-                if attempt == self.max_retries - 1:
-                    # Last attempt failed, re-raise the exception
-                    logger.error(f"All {self.max_retries} retry attempts failed")
-                    raise
-                
-                # Calculate delay with exponential backoff
-                delay = self.base_delay * (2 ** attempt)
-                logger.warning(f"Attempt {attempt + 1} failed: {str(e)}. Retrying in {delay} seconds...")
-                time.sleep(delay)
+        if wait:
+            time.sleep(wait)
+    
+    def pause(self, seconds: float):
+        """Hold back every caller for at least the given number of seconds."""
+        if self.rate <= 0:
+            return
+            
+        with self._lock:
+            # A token deficit makes acquire() wait until the bucket refills past zero
+            self._tokens = min(self._tokens, -seconds * self.rate)
+    
+    def update_from_headers(self, headers: Dict[str, str]):
+        """Adjust the rate from X-RateLimit-* and Retry-After response headers."""
+        retry_after = headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            logger.warning(f"Server asked to retry after {retry_after}s, pausing requests")
+            self.pause(int(retry_after))
         
-        # We should never reach here, but just in case
-        if last_error:
-            raise last_error
-        raise Exception("Retry strategy failed for unknown reason")
+        remaining = headers.get('X-RateLimit-Remaining')
+        limit = headers.get('X-RateLimit-Limit')
+        if not (remaining and remaining.isdigit()):
+            return
+            
+        if int(remaining) > RATE_LIMIT_HEADROOM:
+            rate = self.base_rate
+        else:
+            reset = headers.get('X-RateLimit-Reset')
+            if reset and reset.isdigit() and int(reset) > time.time():
+                # Spread what is left over the time until the window resets
+                # (never drop to zero, which would disable limiting altogether)
+                rate = RATE_LIMIT_SAFETY * max(1, int(remaining)) / (int(reset) - time.time())
+            elif limit and limit.isdigit():
+                rate = RATE_LIMIT_SAFETY * int(limit) / RATE_LIMIT_WINDOW
+            else:
+                rate = self.base_rate
+            if self.base_rate > 0:
+                rate = min(rate, self.base_rate)
+            
+        if rate != self.rate:
+            logger.debug("Adjusting request rate to %.2f/s (%s requests remaining)", rate, remaining)
+            with self._lock:
+                self.rate = rate
 
 class APIClient:
     """Client for making requests to Congress.gov API with error handling and retry logic."""
@@ -72,7 +143,7 @@ class APIClient:
         Args:
             base_url: Base URL for API requests
             api_key: API key (defaults to environment variable if not provided)
-            delay: Delay between requests in seconds
+            delay: Sustained delay between requests in seconds; short bursts may go faster
             timeout: Timeout for requests in seconds
         """
         self.base_url = base_url
@@ -80,7 +151,26 @@ class APIClient:
         self.delay = delay
         self.timeout = timeout
         self.session = requests.Session()
-        self.retry_strategy = RetryStrategy()
+        # Reuse keep-alive connections across requests and pages, and retry transient
+        # failures inside urllib3 without re-entering the request path
+        retry = Retry(
+            total=HTTP_MAX_RETRIES,
+            backoff_factor=HTTP_BACKOFF_FACTOR,
+            backoff_jitter=HTTP_BACKOFF_JITTER,
+            status_forcelist=HTTP_RETRY_STATUSES,
+            respect_retry_after_header=True,
+            allowed_methods=frozenset(['GET']),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'Connection': 'keep-alive',
+            'Accept-Encoding': 'gzip, deflate',
+            'User-Agent': USER_AGENT
+        })
+        self.rate_limiter = RateLimiter(1 / delay if delay > 0 else 0)
         
         if not self.api_key:
             logger.warning("No API key provided. Requests may fail if authentication is required.")
@@ -107,19 +197,26 @@ class APIClient:
         if 'format' not in all_params:
             all_params['format'] = 'json'
         
-        logger.info(f"Making GET request to {url}")
+        logger.info("Making GET request to %s", url)
         
-        def make_request():
-            response = self.session.get(url, params=all_params, timeout=self.timeout)
-            response.raise_for_status()
-            # Add delay to avoid rate limiting
-            time.sleep(self.delay)
-            return response.json()
+        self.rate_limiter.acquire()
+        response = self.session.get(url, params=all_params, timeout=self.timeout)
+        self.rate_limiter.update_from_headers(response.headers)
+        response.raise_for_status()
         
-        return self.retry_strategy.execute(make_request)
+        encoding = response.headers.get('Content-Encoding')
+        compressed_size = response.headers.get('Content-Length')
+        if encoding and compressed_size and compressed_size.isdigit() and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received %s bytes (%s), %d decoded", compressed_size, encoding, len(response.content))
+            
+        # Parse the raw bytes directly; orjson skips the intermediate text decode
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
     
     def get_paginated(self, endpoint: str, params: Optional[Dict[str, Any]] = None, 
-                    items_key: str = None, limit: int = 250) -> list:
+                    items_key: str = None, limit: int = MAX_PAGE_SIZE,
+                    max_pages: Optional[int] = DEFAULT_MAX_PAGES) -> list:
         """
         Fetch all pages of results using pagination
         
@@ -127,61 +224,153 @@ class APIClient:
             endpoint: API endpoint path
             params: Query parameters
             items_key: Key in the response that contains the items array
-            limit: Number of items per page
+            limit: Number of items per page (capped at MAX_PAGE_SIZE)
+            max_pages: Maximum number of pages to fetch, or None for no limit
             
         Returns:
             List of all items across all pages
         """
-        all_items = []
+        all_items = list(self.iter_paginated(endpoint, params, items_key, limit, max_pages))
+        logger.info(f"Completed paginated request, fetched {len(all_items)} items total")
+        return all_items
+    
+    def iter_paginated(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                       items_key: str = None, limit: int = MAX_PAGE_SIZE,
+                       max_pages: Optional[int] = DEFAULT_MAX_PAGES) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over results page by page, yielding items as each page arrives
+        
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            items_key: Key in the response that contains the items array
+            limit: Number of items per page (capped at MAX_PAGE_SIZE)
+            max_pages: Maximum number of pages to fetch, or None to follow pagination to the end
+            
+        Yields:
+            Items from each page in order
+        """
+        limit = min(limit, MAX_PAGE_SIZE)
         current_params = params.copy() if params else {}
         current_params['limit'] = limit
         current_params['offset'] = current_params.get('offset', 0)
-        
-        # For safety, limit to 10 pages maximum
-        max_pages = 10
         current_page = 0
         
         logger.info(f"Starting paginated request to {endpoint} with params: {current_params}")
         
-        while current_page < max_pages:
+        while max_pages is None or current_page < max_pages:
             current_page += 1
-            logger.info(f"Fetching page {current_page} with offset {current_params['offset']}")
+            logger.info("Fetching page %d with offset %s", current_page, current_params['offset'])
             
             try:
                 response = self.get(endpoint, current_params)
-                
-                # Extract items from response
-                if items_key and items_key in response:
-                    page_items = response[items_key]
-                    if isinstance(page_items, list):
-                        logger.info(f"Found {len(page_items)} items in {items_key}")
-                        all_items.extend(page_items)
-                    else:
-                        logger.warning(f"Expected list for {items_key}, got {type(page_items)}")
-                else:
-                    # If no items_key specified, use the first list found in the response
-                    found_items = False
-                    for key, value in response.items():
-                        if isinstance(value, list) and key != 'pagination':
-                            logger.info(f"Found {len(value)} items in {key}")
-                            all_items.extend(value)
-                            found_items = True
-                            break
-                    
-                    if not found_items:
-                        logger.warning(f"No items found in response: {list(response.keys())}")
-                
-                # Check if we need to fetch the next page
-                if 'pagination' not in response or 'next' not in response['pagination']:
-                    logger.info("No more pages to fetch")
-                    break
-                    
-                # Update offset for next page
-                current_params['offset'] += limit
-                
             except Exception as e:
                 logger.error(f"Error fetching page {current_page}: {str(e)}")
                 break
+                
+            page_items = self._extract_items(response, items_key)
+            page_size = len(page_items)
+            yield from page_items
+            
+            # Check if we need to fetch the next page
+            if 'pagination' not in response or 'next' not in response['pagination']:
+                logger.info("No more pages to fetch")
+                break
+                
+            # An empty page with a next link would otherwise loop forever without a page cap
+            if page_size == 0:
+                logger.warning(f"Empty page {current_page} still reports more results; stopping")
+                break
+                
+            # Update offset for next page
+            current_params['offset'] += limit
+    
+    def iter_paginated_parallel(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                                items_key: str = None, limit: int = MAX_PAGE_SIZE,
+                                max_pages: Optional[int] = DEFAULT_MAX_PAGES,
+                                workers: int = PAGE_FETCH_WORKERS) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over results, requesting pages after the first concurrently
         
-        logger.info(f"Completed paginated request, fetched {len(all_items)} items total")
-        return all_items
+        The first page reports the total count, which gives every remaining offset up front.
+        Items are yielded in page order, as with iter_paginated, as soon as each page
+        and all pages before it have arrived.
+        
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            items_key: Key in the response that contains the items array
+            limit: Number of items per page (capped at MAX_PAGE_SIZE)
+            max_pages: Maximum number of pages to fetch, or None for no limit
+            workers: Number of pages to request at once
+            
+        Yields:
+            Items from each page in order
+        """
+        limit = min(limit, MAX_PAGE_SIZE)
+        base_params = params.copy() if params else {}
+        base_params['limit'] = limit
+        start = base_params.setdefault('offset', 0)
+        
+        logger.info(f"Starting parallel paginated request to {endpoint} with params: {base_params}")
+        
+        try:
+            response = self.get(endpoint, dict(base_params))
+        except Exception as e:
+            logger.error(f"Error fetching page 1: {str(e)}")
+            return
+            
+        first_items = self._extract_items(response, items_key)
+        fetched = len(first_items)
+        yield from first_items
+        
+        pagination = response.get('pagination') or {}
+        total = pagination.get('count')
+        
+        if 'next' in pagination and total and first_items:
+            offsets = range(start + limit, total, limit)
+            if max_pages is not None:
+                offsets = offsets[:max(max_pages - 1, 0)]
+                
+            def fetch_page(offset: int) -> List[Any]:
+                return self._extract_items(self.get(endpoint, dict(base_params, offset=offset)), items_key)
+                
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, workers))
+            futures = [executor.submit(fetch_page, offset) for offset in offsets]
+            try:
+                for page_number, future in enumerate(futures, start=2):
+                    try:
+                        page_items = future.result()
+                    except Exception as e:
+                        # Keep the pages before the failure, as the sequential path does
+                        logger.error(f"Error fetching page {page_number}: {str(e)}")
+                        break
+                    fetched += len(page_items)
+                    yield from page_items
+            finally:
+                # Also runs if the consumer stops early; drop pages not yet requested
+                for pending in futures:
+                    pending.cancel()
+                executor.shutdown(wait=True)
+                        
+        logger.info(f"Completed parallel paginated request, fetched {fetched} items total")
+    
+    @staticmethod
+    def _extract_items(response: Dict[str, Any], items_key: Optional[str]) -> List[Any]:
+        """Return the items list from a page, or the first list in it when no key is given."""
+        if items_key and items_key in response:
+            page_items = response[items_key]
+            if isinstance(page_items, list):
+                logger.info("Found %d items in %s", len(page_items), items_key)
+                return page_items
+            logger.warning(f"Expected list for {items_key}, got {type(page_items)}")
+            return []
+            
+        # If no items_key specified, use the first list found in the response
+        for key, value in response.items():
+            if isinstance(value, list) and key != 'pagination':
+                logger.info("Found %d items in %s", len(value), key)
+                return value
+                
+        logger.warning(f"No items found in response: {list(response.keys())}")
+        return []
@@ -3,11 +3,44 @@ Bill-specific utilities for processing bill data.
 """
 
 import re
+from functools import lru_cache
 from typing import Tuple, Optional
 
+# Bill type letters followed by the bill's number (e.g. 'HR1234')
+BILL_NUMBER_RE = re.compile(r'^([a-zA-Z]+)(\d+)$')
+
+# Status rules checked in priority order against lowercased action text.
+# Each rule is (any_of, all_of, status): it matches when the text contains at least
+# one of any_of and every term in all_of.
+_STATUS_RULES = (
+    # Direct matches first
+    (('became public law', 'became law'), (), 'Became Law'),
+    (('enacted', 'approved by president'), (), 'Enacted'),
+    (('passed',), ('house',), 'Passed House'),
+    (('passed',), ('senate',), 'Passed Senate'),
+    
+    # Calendar placements indicate progress beyond committee
+    (('placed on',), ('calendar', 'senate'), 'Reported'),  # Senate calendar placement typically follows committee reporting
+    (('placed on',), ('union calendar',), 'Reported'),  # House Union Calendar is for reported bills
+    
+    # Committee actions
+    (('reported', 'ordered to be reported'), (), 'Reported'),
+    (('referred to', 'committee'), (), 'In Committee'),
+    (('held at the desk',), (), 'In Committee'),  # Bills held at the desk are awaiting committee referral
+    
+    # Introduction status
+    (('introduced', 'introduction'), (), 'Introduced'),
+    
+    # Motion outcomes often indicate passage
+    (('motion to reconsider laid on the table agreed to',), ('house',), 'Passed House'),
+    (('motion to reconsider laid on the table agreed to',), ('senate',), 'Passed Senate'),
+)
+
+@lru_cache(maxsize=8192)
 def normalize_bill_status(action_text: str) -> Optional[str]:
     """
-    Map action text to a normalized status value.
+    Map action text to a normalized status value. Results are cached, since the
+    same action phrases recur across bills and sync runs.
     
     Args:
         action_text: Text of the latest action
@@ -20,48 +53,16 @@ def normalize_bill_status(action_text: str) -> Optional[str]:
         
     action_text = action_text.lower()
     
-    # Direct matches first
-    if any(term in action_text for term in ['became public law', 'became law']):
-        return 'Became Law'
-    elif any(term in action_text for term in ['enacted', 'approved by president']):
-        return 'Enacted'
-    elif 'passed' in action_text:
-        if 'house' in action_text:
-            return 'Passed House'
-        elif 'senate' in action_text:
-            return 'Passed Senate'
-    
-    # Calendar placements indicate progress beyond committee
-    if 'placed on' in action_text and 'calendar' in action_text:
-        if 'senate' in action_text:
-            return 'Reported'  # Senate calendar placement typically follows committee reporting
-        elif 'union calendar' in action_text:
-            return 'Reported'  # House Union Calendar is for reported bills
-        
-    # Committee actions
-    if any(term in action_text for term in ['reported', 'ordered to be reported']):
-        return 'Reported'
-    elif any(term in action_text for term in ['referred to', 'committee']):
-        return 'In Committee'
-    elif 'held at the desk' in action_text:
-        return 'In Committee'  # Bills held at the desk are awaiting committee referral
-        
-    # Introduction status
-    if any(term in action_text for term in ['introduced', 'introduction']):
-        return 'Introduced'
-    
-    # Motion outcomes often indicate passage
-    if 'motion to reconsider laid on the table agreed to' in action_text:
-        if 'house' in action_text:
-            return 'Passed House'
-        elif 'senate' in action_text:
-            return 'Passed Senate'
+    for any_of, all_of, status in _STATUS_RULES:
+        if any(term in action_text for term in any_of) and all(term in action_text for term in all_of):
+            return status
     
     return None
 
+@lru_cache(maxsize=8192)
 def parse_bill_number(bill_number: str) -> Tuple[str, str]:
     """
-    Parse a bill number into its components.
+    Parse a bill number into its components. Results are cached per bill number.
     
     Args:
         bill_number: Full bill number (e.g., 'HR1234', 'S42', 'SJRES33')
@@ -70,7 +71,7 @@ def parse_bill_number(bill_number: str) -> Tuple[str, str]:
         Tuple of (bill_type, bill_number)
     """
     # Use regex to separate letters from numbers
-    match = re.match(r'^([a-zA-Z]+)(\d+)$', bill_number)
+    match = BILL_NUMBER_RE.match(bill_number)
     if match:
         return match.group(1).lower(), match.group(2)
     
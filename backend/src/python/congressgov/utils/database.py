@@ -3,12 +3,16 @@ Database utilities for connecting to PostgreSQL and handling transactions.
 """
 
 import os
+import io
 import logging
-from typing import Callable, Any
+import threading
+from typing import Callable, Any, Iterable, Optional, Sequence
+from itertools import islice
 from contextlib import contextmanager
 from functools import wraps
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_batch as _execute_batch, execute_values as _execute_values
+from psycopg2.pool import ThreadedConnectionPool
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -17,33 +21,73 @@ load_dotenv()
 # Get database URL from environment
 DATABASE_URL = os.getenv('DATABASE_URL')
 
+# Connection pool sizing
+POOL_MIN_CONN = int(os.getenv('DB_POOL_MIN_CONN', '2'))
+POOL_MAX_CONN = int(os.getenv('DB_POOL_MAX_CONN', '16'))
+
+# Rows buffered in memory per COPY round when bulk loading
+COPY_BUFFER_ROWS = 10000
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_connection_pool() -> ThreadedConnectionPool:
+    """Get the process-wide connection pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadedConnectionPool(POOL_MIN_CONN, POOL_MAX_CONN, dsn=DATABASE_URL)
+                logger.debug(f"Created database connection pool ({POOL_MIN_CONN}-{POOL_MAX_CONN} connections)")
+    return _pool
+
+def close_db_pool():
+    """Close all pooled connections."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
+            logger.debug("Database connection pool closed")
+
 @contextmanager
 def get_db_connection(dict_cursor: bool = False):
     """
     Context manager for database connections.
     
+    Connections are borrowed from a shared pool and returned on exit. Any
+    uncommitted work is rolled back before the connection goes back to the pool.
+    
     Args:
         dict_cursor: If True, use RealDictCursor to return results as dictionaries
         
     Yields:
         Database connection
     """
+    pool = get_connection_pool()
     conn = None
-    cursor_factory = RealDictCursor if dict_cursor else None
+    broken = False
     
     try:
-        conn = psycopg2.connect(DATABASE_URL, cursor_factory=cursor_factory)
+        conn = pool.getconn()
+        conn.cursor_factory = RealDictCursor if dict_cursor else None
         yield conn
     except psycopg2.Error as e:
         logger.error(f"Database connection error: {e}")
+        broken = isinstance(e, (psycopg2.OperationalError, psycopg2.InterfaceError))
         raise
     finally:
         if conn:
-            conn.close()
-            logger.debug("Database connection closed")
+            if not conn.closed and not broken:
+                try:
+                    conn.rollback()
+                except psycopg2.Error:
+                    broken = True
+            pool.putconn(conn, close=broken or bool(conn.closed))
+            logger.debug("Database connection returned to pool")
 
 @contextmanager
 def get_db_cursor(dict_cursor: bool = False):
@@ -114,21 +158,130 @@ def execute_query(query: str, params: tuple = None, fetchone: bool = False, dict
             return cursor.fetchone()
         return cursor.fetchall()
 
-def execute_batch(query: str, param_sets: list) -> int:
+def execute_batch(query: str, param_sets: list, page_size: int = 100) -> int:
     """
     Execute a batch query with multiple parameter sets.
     
+    Sends one statement per parameter set, grouped into round trips. Prefer
+    execute_values_batch for INSERT/UPSERT; use this for UPDATE/DELETE statements
+    that cannot be written against a VALUES list.
+    
     Args:
         query: SQL query
         param_sets: List of parameter tuples
+        page_size: Statements sent to the server per round trip
         
     Returns:
-        Number of rows affected
+        Number of rows affected by the last page
     """
     if not param_sets:
         return 0
         
     with get_db_cursor() as cursor:
-        from psycopg2.extras import execute_batch
-        execute_batch(cursor, query, param_sets)
-        return cursor.rowcount
\ No newline at end of file
+        _execute_batch(cursor, query, param_sets, page_size=page_size)
+        return cursor.rowcount
+
+def execute_values_batch(query: str, rows: list, template: str = None, page_size: int = 1000) -> int:
+    """
+    Execute an INSERT with many rows as multi-row statements.
+    
+    The query must contain a single %s where the VALUES list goes, e.g.
+    "INSERT INTO t (a, b) VALUES %s ON CONFLICT (a) DO UPDATE SET b = EXCLUDED.b".
+    Each page of rows is sent as one statement, which is much faster than
+    execute_batch for inserts and upserts.
+    
+    Args:
+        query: SQL query with a VALUES %s placeholder
+        rows: List of row tuples
+        template: Optional row template, e.g. "(%s, %s::integer)"
+        page_size: Rows per statement
+        
+    Returns:
+        Number of rows affected across all pages
+    """
+    if not rows:
+        return 0
+        
+    affected = 0
+    with get_db_cursor() as cursor:
+        for start in range(0, len(rows), page_size):
+            _execute_values(cursor, query, rows[start:start + page_size], template=template, page_size=page_size)
+            affected += cursor.rowcount
+    return affected
+
+def _copy_value(value) -> str:
+    """Format a value for COPY text format, writing None as NULL."""
+    if value is None:
+        return '\\N'
+    return (str(value).replace('\\', '\\\\').replace('\t', '\\t')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+def copy_rows(cursor, table: str, rows: Iterable[tuple], columns: Optional[Sequence[str]] = None,
+              buffer_rows: int = COPY_BUFFER_ROWS) -> int:
+    """
+    Bulk load rows into a table with COPY using the caller's cursor.
+    
+    Rows are consumed from the iterable buffer_rows at a time, so a generator
+    can be loaded without materializing it.
+    
+    Args:
+        cursor: Database cursor
+        table: Target table
+        rows: Iterable of row tuples
+        columns: Column names matching the row layout (defaults to all columns in order)
+        buffer_rows: Rows written per COPY
+        
+    Returns:
+        Number of rows loaded
+    """
+    target = f"{table} ({', '.join(columns)})" if columns else table
+    rows = iter(rows)
+    loaded = 0
+    
+    while True:
+        chunk = list(islice(rows, buffer_rows))
+        if not chunk:
+            break
+        buffer = io.StringIO()
+        buffer.writelines('\t'.join(map(_copy_value, row)) + '\n' for row in chunk)
+        buffer.seek(0)
+        cursor.copy_expert(f"COPY {target} FROM STDIN", buffer)
+        loaded += len(chunk)
+        
+    return loaded
+
+def copy_upsert(table: str, columns: Sequence[str], key_columns: Sequence[str], rows: Iterable[tuple]) -> int:
+    """
+    Upsert rows by COPYing them into a temporary staging table and merging.
+    
+    Rows must be unique on key_columns; a single INSERT ... ON CONFLICT cannot
+    update the same row twice.
+    
+    Args:
+        table: Target table
+        columns: Column names matching the row layout
+        key_columns: Columns of the target's unique constraint
+        rows: Iterable of row tuples
+        
+    Returns:
+        Number of rows inserted or updated
+    """
+    column_list = ', '.join(columns)
+    update_columns = [column for column in columns if column not in key_columns]
+    if update_columns:
+        conflict_action = "DO UPDATE SET " + ', '.join(f"{column} = EXCLUDED.{column}" for column in update_columns)
+    else:
+        conflict_action = "DO NOTHING"
+    stage = f"{table}_stage"
+    
+    with get_db_cursor() as cursor:
+        # Staging copies only the column types, without the target's constraints or defaults
+        cursor.execute(f"CREATE TEMP TABLE {stage} ON COMMIT DROP AS SELECT {column_list} FROM {table} WITH NO DATA")
+        if not copy_rows(cursor, stage, rows, columns):
+            return 0
+        cursor.execute(f"""
+            INSERT INTO {table} ({column_list})
+            SELECT {column_list} FROM {stage}
+            ON CONFLICT ({', '.join(key_columns)}) {conflict_action}
+        """)
+        return cursor.rowcount
@@ -4,15 +4,68 @@ File storage utilities for saving and loading data files.
 
 import os
 import json
+import time
+import fnmatch
 import logging
 import shutil
-from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
-from pathlib import Path
+import threading
+import concurrent.futures
+from typing import Dict, Any, Optional, Iterator
+from datetime import datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Raw snapshots are written compact; set PRETTY_JSON=1 to indent them for debugging
+PRETTY_JSON = os.getenv('PRETTY_JSON', '').lower() in ('1', 'true', 'yes')
+
+def _dumps_indented(data: Any) -> bytes:
+    """Serialize data to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+def _dumps_compact(data: Any) -> bytes:
+    """Serialize data to compact JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+def _loads(raw: bytes) -> Any:
+    """Deserialize JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _write_atomic(file_path: str, payload: bytes):
+    """
+    Write payload in one call to a temporary file and move it over file_path, so
+    readers never see a partially written file. No fsync: raw data can be re-fetched.
+    """
+    tmp_path = f"{file_path}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+# Parallelism for removing raw data directories
+CLEANUP_WORKERS = 8
+
+# Name format of timestamped run directories (see ensure_directory callers)
+RUN_DIR_FORMAT = '%Y%m%d_%H%M%S'
+
+# Serializes appends so concurrent workers never interleave partial lines
+_append_lock = threading.Lock()
+
 def ensure_directory(*paths) -> str:
     """
     Ensure that the specified directory path exists.
@@ -27,7 +80,8 @@ def ensure_directory(*paths) -> str:
     os.makedirs(dir_path, exist_ok=True)
     return dir_path
 
-def save_json(data: Dict[str, Any], directory: str, filename: str, create_backup: bool = False) -> str:
+def save_json(data: Dict[str, Any], directory: str, filename: str, create_backup: bool = False,
+              indent: Optional[bool] = None) -> str:
     """
     Save data to a JSON file.
     
@@ -36,6 +90,7 @@ def save_json(data: Dict[str, Any], directory: str, filename: str, create_backup
         directory: Directory to save to
         filename: Filename
         create_backup: If True and file exists, create a backup
+        indent: Pretty-print the output (defaults to the PRETTY_JSON environment setting)
         
     Returns:
         Path to the saved file
@@ -55,14 +110,55 @@ def save_json(data: Dict[str, Any], directory: str, filename: str, create_backup
     
     # Save data
     try:
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        if indent is None:
+            indent = PRETTY_JSON
+        _write_atomic(file_path, _dumps_indented(data) if indent else _dumps_compact(data))
         logger.info(f"Saved data to {file_path}")
         return file_path
     except Exception as e:
         logger.error(f"Failed to save data: {str(e)}")
         raise
 
+def append_jsonl(data: Dict[str, Any], directory: str, filename: str) -> str:
+    """
+    Append a record to a newline-delimited JSON file.
+    
+    Args:
+        data: Record to append
+        directory: Directory containing the file
+        filename: Filename
+        
+    Returns:
+        Path to the file
+    """
+    file_path = os.path.join(directory, filename)
+    line = _dumps_compact(data) + b'\n'
+    
+    try:
+        with _append_lock:
+            with open(file_path, 'ab') as f:
+                f.write(line)
+        logger.debug(f"Appended record to {file_path}")
+        return file_path
+    except Exception as e:
+        logger.error(f"Failed to append data: {str(e)}")
+        raise
+
+def iter_jsonl(file_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the records of a newline-delimited JSON file.
+    
+    Args:
+        file_path: Path to the file
+        
+    Yields:
+        Decoded records, one per non-empty line
+    """
+    with open(file_path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield _loads(line)
+
 def load_json(file_path: str) -> Optional[Dict[str, Any]]:
     """
     Load data from a JSON file.
@@ -78,8 +174,8 @@ def load_json(file_path: str) -> Optional[Dict[str, Any]]:
         return None
         
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            data = _loads(f.read())
         logger.info(f"Loaded data from {file_path}")
         return data
     except Exception as e:
@@ -90,6 +186,10 @@ def cleanup_old_files(directory: str, pattern: str = '*', days: int = 30):
     """
     Remove files older than the specified number of days.
     
+    Walks the tree with os.scandir, using the stat data cached on each directory
+    entry, cleans top-level subdirectories in parallel and removes subdirectories
+    left empty by the cleanup.
+    
     Args:
         directory: Directory to clean up
         pattern: File pattern to match
@@ -99,22 +199,56 @@ def cleanup_old_files(directory: str, pattern: str = '*', days: int = 30):
         logger.warning(f"Directory not found: {directory}")
         return
     
-    cutoff_date = datetime.now() - timedelta(days=days)
+    cutoff = time.time() - days * 86400
+    with concurrent.futures.ThreadPoolExecutor(max_workers=CLEANUP_WORKERS) as executor:
+        _cleanup_tree(directory, pattern, cutoff, executor)
+
+def _run_timestamp(name: str) -> Optional[float]:
+    """Parse a run directory name (YYYYMMDD_HHMMSS) into a POSIX timestamp."""
+    try:
+        return time.mktime(time.strptime(name, RUN_DIR_FORMAT))
+    except ValueError:
+        return None
+
+def _cleanup_tree(directory: str, pattern: str, cutoff: float,
+                  executor: Optional[concurrent.futures.Executor] = None) -> bool:
+    """Remove matching files older than cutoff under directory. Returns True if directory is now empty."""
+    empty = True
+    subdirs = []
     
-    for path in Path(directory).glob(pattern):
-        if path.is_file():
+    with os.scandir(directory) as entries:
+        for entry in entries:
             try:
-                # Get file modification time
-                mtime = datetime.fromtimestamp(path.stat().st_mtime)
-                if mtime < cutoff_date:
-                    os.remove(path)
-                    logger.info(f"Removed old file: {path}")
-            except Exception as e:
-                logger.warning(f"Error processing file {path}: {str(e)}")
-        elif path.is_dir():
-            try:
-                # For directories, check if they're empty after processing their contents
-                shutil.rmtree(path)
-                logger.info(f"Removed old directory: {path}")
-            except Exception as e:
-                logger.warning(f"Error removing directory {path}: {str(e)}")
\ No newline at end of file
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif fnmatch.fnmatch(entry.name, pattern) and entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                    os.remove(entry.path)
+                    logger.info(f"Removed old file: {entry.path}")
+                else:
+                    empty = False
+            except OSError as e:
+                empty = False
+                logger.warning(f"Error processing {entry.path}: {str(e)}")
+    
+    mapper = executor.map if executor else map
+    for removed in mapper(lambda path: _cleanup_subdir(path, pattern, cutoff), subdirs):
+        empty = empty and removed
+    
+    return empty
+
+def _cleanup_subdir(path: str, pattern: str, cutoff: float) -> bool:
+    """Clean up a subdirectory and remove it if nothing is left. Returns True if it was removed."""
+    try:
+        run_time = _run_timestamp(os.path.basename(path))
+        if pattern == '*' and run_time is not None and run_time < cutoff:
+            # A run directory named before the cutoff only holds expired files; drop it whole
+            shutil.rmtree(path)
+        elif _cleanup_tree(path, pattern, cutoff):
+            os.rmdir(path)
+        else:
+            return False
+        logger.info(f"Removed old directory: {path}")
+        return True
+    except OSError as e:
+        logger.warning(f"Error removing directory {path}: {str(e)}")
+        return False
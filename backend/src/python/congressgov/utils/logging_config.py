@@ -3,9 +3,23 @@ Centralized logging configuration.
 """
 
 import os
+import atexit
+import queue
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 
+# Listeners writing queued records to log files, keyed by logger name
+_file_listeners = {}
+
+def _stop_file_listeners():
+    """Flush and stop all file listeners."""
+    for listener in _file_listeners.values():
+        listener.stop()
+    _file_listeners.clear()
+
+atexit.register(_stop_file_listeners)
+
 def setup_logging(
     logger_name: str,
     log_level: int = logging.INFO,
@@ -35,6 +49,8 @@ def setup_logging(
     # Remove existing handlers
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
+    if logger_name in _file_listeners:
+        _file_listeners.pop(logger_name).stop()
     
     # Create formatters
     formatter = logging.Formatter(log_format)
@@ -59,7 +75,16 @@ def setup_logging(
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        
+        # Records are queued and written by a listener thread so callers never wait on disk
+        log_queue = queue.Queue(-1)
+        listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        _file_listeners[logger_name] = listener
+        
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(log_level)
+        logger.addHandler(queue_handler)
         
         logger.info(f"Logging to {log_file}")
     
@@ -4,12 +4,64 @@ Member-related utilities for processing Congress.gov data.
 
 import re
 import logging
+from functools import lru_cache
 from datetime import datetime, date
 from typing import Dict, Any, Tuple, Optional, List
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# State name to code mapping
+_STATE_MAP = {
+    "alabama": "AL", "alaska": "AK", "arizona": "AZ", "arkansas": "AR", 
+    "california": "CA", "colorado": "CO", "connecticut": "CT", "delaware": "DE",
+    "florida": "FL", "georgia": "GA", "hawaii": "HI", "idaho": "ID", 
+    "illinois": "IL", "indiana": "IN", "iowa": "IA", "kansas": "KS",
+    "kentucky": "KY", "louisiana": "LA", "maine": "ME", "maryland": "MD", 
+    "massachusetts": "MA", "michigan": "MI", "minnesota": "MN", "mississippi": "MS",
+    "missouri": "MO", "montana": "MT", "nebraska": "NE", "nevada": "NV", 
+    "new hampshire": "NH", "new jersey": "NJ", "new mexico": "NM", "new york": "NY",
+    "north carolina": "NC", "north dakota": "ND", "ohio": "OH", "oklahoma": "OK", 
+    "oregon": "OR", "pennsylvania": "PA", "rhode island": "RI", "south carolina": "SC",
+    "south dakota": "SD", "tennessee": "TN", "texas": "TX", "utah": "UT", 
+    "vermont": "VT", "virginia": "VA", "washington": "WA", "west virginia": "WV",
+    "wisconsin": "WI", "wyoming": "WY", "district of columbia": "DC",
+    "american samoa": "AS", "guam": "GU", "northern mariana islands": "MP",
+    "puerto rico": "PR", "virgin islands": "VI"
+}
+
+# Map common variations to standard values
+_PARTY_MAP = {
+    "republican": ("Republican", "R"),
+    "r": ("Republican", "R"),
+    "gop": ("Republican", "R"),
+    
+    "democrat": ("Democrat", "D"),
+    "democratic": ("Democrat", "D"),
+    "d": ("Democrat", "D"),
+    
+    "independent": ("Independent", "I"),
+    "i": ("Independent", "I"),
+    
+    "libertarian": ("Libertarian", "L"),
+    "l": ("Libertarian", "L"),
+    
+    "green": ("Green", "G"),
+    "g": ("Green", "G")
+}
+
+# Standard leadership titles
+_TITLE_MAP = {
+    "speaker": "Speaker of the House",
+    "majority leader": "Majority Leader",
+    "minority leader": "Minority Leader",
+    "majority whip": "Majority Whip",
+    "minority whip": "Minority Whip",
+    "president pro tempore": "President Pro Tempore",
+    "conference chair": "Conference Chair",
+    "policy committee chair": "Policy Committee Chair"
+}
+
 def parse_member_name(name: str) -> Dict[str, str]:
     """
     Parse a member name into components.
@@ -23,24 +75,14 @@ def parse_member_name(name: str) -> Dict[str, str]:
     if not name:
         return {"last_name": "", "first_name": "", "middle_name": ""}
     
-    # Handle name format: "Last, First Middle"
-    parts = name.split(', ', 1)
-    last_name = parts[0].strip() if parts else ""
-    
-    first_name = ""
-    middle_name = ""
-    
-    if len(parts) > 1:
-        first_parts = parts[1].split(' ', 1)
-        first_name = first_parts[0].strip() if first_parts else ""
-        
-        if len(first_parts) > 1:
-            middle_name = first_parts[1].strip()
+    # Handle name format: "Last, First Middle"; missing parts come back empty
+    last_name, _, rest = name.partition(', ')
+    first_name, _, middle_name = rest.partition(' ')
     
     return {
-        "last_name": last_name,
-        "first_name": first_name,
-        "middle_name": middle_name
+        "last_name": last_name.strip(),
+        "first_name": first_name.strip(),
+        "middle_name": middle_name.strip()
     }
 
 def format_full_name(first_name: str, middle_name: str, last_name: str, suffix: str = None) -> str:
@@ -74,26 +116,15 @@ def format_display_name(member_data: Dict[str, Any]) -> str:
     Returns:
         Formatted display name
     """
-    if 'full_name' in member_data and member_data['full_name']:
-        return member_data['full_name']
+    full_name = member_data.get('full_name')
+    if full_name:
+        return full_name
     
-    if 'short_title' in member_data and member_data['short_title']:
-        title = member_data['short_title']
-    elif 'chamber' in member_data:
+    title = member_data.get('short_title')
+    if not title and 'chamber' in member_data:
         title = "Sen." if member_data['chamber'].lower() == 'senate' else "Rep."
-    else:
-        title = ""
-    
-    name_parts = []
-    if title:
-        name_parts.append(title)
-    
-    if 'first_name' in member_data and member_data['first_name']:
-        name_parts.append(member_data['first_name'])
-    
-    if 'last_name' in member_data and member_data['last_name']:
-        name_parts.append(member_data['last_name'])
     
+    name_parts = [part for part in (title, member_data.get('first_name'), member_data.get('last_name')) if part]
     if not name_parts:
         return "Unknown Member"
     
@@ -112,33 +143,14 @@ def normalize_state_code(state: str) -> str:
     if not state:
         return ""
     
-    # State name to code mapping
-    state_map = {
-        "alabama": "AL", "alaska": "AK", "arizona": "AZ", "arkansas": "AR", 
-        "california": "CA", "colorado": "CO", "connecticut": "CT", "delaware": "DE",
-        "florida": "FL", "georgia": "GA", "hawaii": "HI", "idaho": "ID", 
-        "illinois": "IL", "indiana": "IN", "iowa": "IA", "kansas": "KS",
-        "kentucky": "KY", "louisiana": "LA", "maine": "ME", "maryland": "MD", 
-        "massachusetts": "MA", "michigan": "MI", "minnesota": "MN", "mississippi": "MS",
-        "missouri": "MO", "montana": "MT", "nebraska": "NE", "nevada": "NV", 
-        "new hampshire": "NH", "new jersey": "NJ", "new mexico": "NM", "new york": "NY",
-        "north carolina": "NC", "north dakota": "ND", "ohio": "OH", "oklahoma": "OK", 
-        "oregon": "OR", "pennsylvania": "PA", "rhode island": "RI", "south carolina": "SC",
-        "south dakota": "SD", "tennessee": "TN", "texas": "TX", "utah": "UT", 
-        "vermont": "VT", "virginia": "VA", "washington": "WA", "west virginia": "WV",
-        "wisconsin": "WI", "wyoming": "WY", "district of columbia": "DC",
-        "american samoa": "AS", "guam": "GU", "northern mariana islands": "MP",
-        "puerto rico": "PR", "virgin islands": "VI"
-    }
-    
     # If already a 2-letter code
     if len(state) == 2:
         return state.upper()
     
     # Try lookup by name
     state_key = state.lower().strip()
-    if state_key in state_map:
-        return state_map[state_key]
+    if state_key in _STATE_MAP:
+        return _STATE_MAP[state_key]
     
     # Return original if unknown
     logger.warning(f"Unknown state: {state}")
@@ -171,6 +183,7 @@ def get_district_display(state: str, district: Optional[int], chamber: str) -> s
     else:
         return f"{state_code}-{district}"
 
+@lru_cache(maxsize=256)
 def parse_party_name(party: str) -> Tuple[str, str]:
     """
     Parse party name into standardized name and code.
@@ -186,31 +199,11 @@ def parse_party_name(party: str) -> Tuple[str, str]:
     
     party_lower = party.lower().strip()
     
-    # Map common variations to standard values
-    party_map = {
-        "republican": ("Republican", "R"),
-        "r": ("Republican", "R"),
-        "gop": ("Republican", "R"),
-        
-        "democrat": ("Democrat", "D"),
-        "democratic": ("Democrat", "D"),
-        "d": ("Democrat", "D"),
-        
-        "independent": ("Independent", "I"),
-        "i": ("Independent", "I"),
-        
-        "libertarian": ("Libertarian", "L"),
-        "l": ("Libertarian", "L"),
-        
-        "green": ("Green", "G"),
-        "g": ("Green", "G")
-    }
-    
-    if party_lower in party_map:
-        return party_map[party_lower]
+    if party_lower in _PARTY_MAP:
+        return _PARTY_MAP[party_lower]
     
     # Check for partial matches
-    for key, value in party_map.items():
+    for key, value in _PARTY_MAP.items():
         if key in party_lower:
             return value
     
@@ -224,28 +217,23 @@ def get_current_congress() -> int:
     Returns:
         Current Congress number
     """
-    # First Congress: March 4, 1789
-    # Each Congress is 2 years
-    # 117th Congress: January 3, 2021 - January 3, 2023
-    
-    today = date.today()
-    
-    # Base calculation on 117th Congress in 2021-2022
-    current_year = today.year
-    congress_offset = (current_year - 2021) // 2
+    return _congress_for(date.today())
+
+@lru_cache(maxsize=4)
+def _congress_for(today: date) -> int:
+    """
+    Get the Congress number in session on a given date; cached per day.
     
-    # Check if we're in first or second year of Congress
-    if current_year % 2 == 1:
-        # Odd year, definitely new Congress
-        return 117 + congress_offset
-    else:
-        # Even year
-        if today.month > 1 or (today.month == 1 and today.day >= 3):
-            # After January 3rd, still same Congress
-            return 117 + congress_offset
-        else:
-            # Before January 3rd, previous Congress
-            return 117 + congress_offset - 1
+    Args:
+        today: Date to look up
+        
+    Returns:
+        Congress number
+    """
+    # Each Congress is 2 years, starting January 3rd of odd years
+    # 117th Congress: January 3, 2021 - January 3, 2023
+    before_start = today < date(today.year, 1, 3)
+    return 117 + (today.year - 2021 - before_start) // 2
 
 def year_to_date(year: Optional[str]) -> Optional[date]:
     """
@@ -264,6 +252,7 @@ def year_to_date(year: Optional[str]) -> Optional[date]:
     except ValueError:
         return None
 
+@lru_cache(maxsize=256)
 def get_leadership_title(position: str) -> str:
     """
     Format a leadership position into a display title.
@@ -277,25 +266,13 @@ def get_leadership_title(position: str) -> str:
     if not position:
         return ""
     
-    # Standard leadership titles
-    title_map = {
-        "speaker": "Speaker of the House",
-        "majority leader": "Majority Leader",
-        "minority leader": "Minority Leader",
-        "majority whip": "Majority Whip",
-        "minority whip": "Minority Whip",
-        "president pro tempore": "President Pro Tempore",
-        "conference chair": "Conference Chair",
-        "policy committee chair": "Policy Committee Chair"
-    }
-    
     position_lower = position.lower().strip()
     
-    if position_lower in title_map:
-        return title_map[position_lower]
+    if position_lower in _TITLE_MAP:
+        return _TITLE_MAP[position_lower]
     
     # Check for partial matches
-    for key, value in title_map.items():
+    for key, value in _TITLE_MAP.items():
         if key in position_lower:
             return value
     
@@ -3,11 +3,15 @@ Tag-related utilities for bill categorization.
 """
 
 import logging
+from functools import lru_cache
 from typing import Optional
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Single-character substitutions applied in one pass by normalization
+_TAG_TRANS = str.maketrans({' ': '_', ',': '_', '-': '_'})
+
 def normalize_tag_name(name: str) -> Optional[str]:
     """
     Convert a tag name to its normalized form.
@@ -20,7 +24,12 @@ def normalize_tag_name(name: str) -> Optional[str]:
     """
     if not name:
         return None
-    return name.lower().replace(' ', '_').replace(',', '_').replace('&', 'and').replace('-', '_')
+    return _normalize_nonempty(name)
+
+@lru_cache(maxsize=4096)
+def _normalize_nonempty(name: str) -> str:
+    """Normalize a non-empty tag name; cached, as the same policy areas recur across bills."""
+    return name.lower().translate(_TAG_TRANS).replace('&', 'and')
 
 def get_or_create_policy_area_tag(cur, policy_area_name: str) -> Optional[int]:
     """
@@ -36,38 +45,57 @@ def get_or_create_policy_area_tag(cur, policy_area_name: str) -> Optional[int]:
     if not policy_area_name:
         return None
 
-    # First, get the Policy Area tag type ID
-    cur.execute("SELECT id FROM tag_types WHERE name = 'Policy Area'")
-    result = cur.fetchone()
-    if not result:
-        logger.error("Policy Area tag type not found")
-        return None
-    
-    type_id = result[0]
     normalized_name = normalize_tag_name(policy_area_name)
 
-    # Try to find existing tag
+    # Resolve the Policy Area type, find the tag and create it if missing in one round trip.
+    # The insert only runs when no tag exists, so lookups of existing tags don't consume ids.
     cur.execute("""
-        SELECT id FROM tags 
-        WHERE type_id = %s AND normalized_name = %s
-    """, (type_id, normalized_name))
-    result = cur.fetchone()
-    
-    if result:
-        return result[0]
-
-    # Create new tag if it doesn't exist
-    cur.execute("""
-        INSERT INTO tags (type_id, name, normalized_name, description)
-        VALUES (%s, %s, %s, %s)
-        RETURNING id
+        WITH policy_area AS (
+            SELECT id FROM tag_types WHERE name = 'Policy Area'
+        ),
+        existing AS (
+            SELECT t.id FROM tags t
+            JOIN policy_area pa ON t.type_id = pa.id
+            WHERE t.normalized_name = %s
+        ),
+        created AS (
+            INSERT INTO tags (type_id, name, normalized_name, description)
+            SELECT pa.id, %s, %s, %s
+            FROM policy_area pa
+            WHERE NOT EXISTS (SELECT 1 FROM existing)
+            ON CONFLICT (type_id, normalized_name) DO NOTHING
+            RETURNING id
+        )
+        SELECT id FROM existing
+        UNION ALL
+        SELECT id FROM created
     """, (
-        type_id,
+        normalized_name,
         policy_area_name,
         normalized_name,
         f'Bills related to {policy_area_name}'
     ))
-    return cur.fetchone()[0]
+    result = cur.fetchone()
+    if result:
+        return result[0]
+    
+    # Nothing returned: either the type is missing, or a concurrent transaction inserted
+    # the same tag (ON CONFLICT DO NOTHING returns no row and the CTE snapshot can't see
+    # it). A new statement gets a fresh snapshot, so look both up again.
+    cur.execute("""
+        SELECT tt.id, t.id
+        FROM tag_types tt
+        LEFT JOIN tags t ON t.type_id = tt.id AND t.normalized_name = %s
+        WHERE tt.name = 'Policy Area'
+    """, (normalized_name,))
+    result = cur.fetchone()
+    if not result:
+        logger.error("Policy Area tag type not found")
+        return None
+    if result[1] is None:
+        raise RuntimeError(f"Policy Area tag '{policy_area_name}' was created concurrently "
+                           "but is not visible to this transaction")
+    return result[1]
 
 def update_bill_tags(cur, bill_id: int, tag_id: int) -> None:
     """
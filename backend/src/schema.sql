@@ -1,6 +1,7 @@
 -- Add new columns to members table for member bios
 ALTER TABLE members
 ADD COLUMN IF NOT EXISTS profile_text TEXT,
+ADD COLUMN IF NOT EXISTS profile_text_hash BYTEA,
 ADD COLUMN IF NOT EXISTS bio_directory TEXT,
 ADD COLUMN IF NOT EXISTS bio_update_date TIMESTAMP WITH TIME ZONE;
 
@@ -257,6 +258,15 @@ CREATE INDEX IF NOT EXISTS idx_tags_type_id ON tags(type_id);
 CREATE INDEX IF NOT EXISTS idx_tags_parent_id ON tags(parent_id);
 CREATE INDEX IF NOT EXISTS idx_bill_tags_tag_id ON bill_tags(tag_id);
 
+-- Indexes supporting member detail/bio batch selection
+-- (members ordered by staleness, members missing detail fields)
+CREATE INDEX IF NOT EXISTS idx_members_last_updated
+ON members (last_updated NULLS FIRST);
+
+CREATE INDEX IF NOT EXISTS idx_members_missing_details
+ON members (bioguide_id)
+WHERE direct_order_name IS NULL;
+
 -- Create API sync status tracking table
 CREATE TABLE IF NOT EXISTS api_sync_status (
     endpoint VARCHAR(100) PRIMARY KEY,
@@ -278,6 +288,12 @@ BEGIN
 END;
 $$ language 'plpgsql';
 
+-- SQL counterpart of utils.tag_utils.normalize_tag_name
+CREATE OR REPLACE FUNCTION normalize_tag_name(name TEXT)
+RETURNS TEXT AS $$
+    SELECT replace(translate(lower(name), ' ,-', '___'), '&', 'and');
+$$ LANGUAGE sql IMMUTABLE;
+
 -- Add triggers to update the updated_at column
 DROP TRIGGER IF EXISTS update_tag_types_updated_at ON tag_types;
 CREATE TRIGGER update_tag_types_updated_at
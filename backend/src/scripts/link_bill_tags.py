@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
+from difflib import get_close_matches
 
 # Database connection string
 DB_CONNECTION_STRING = "postgresql://localhost/project_tacitus_test"
 
+# Minimum similarity (0-1) for linking a tag to a Policy Area whose name doesn't match exactly
+FUZZY_MATCH_CUTOFF = 0.85
+
 def main():
     print("Starting bill tag linking process...")
     conn = psycopg2.connect(DB_CONNECTION_STRING)
@@ -20,43 +24,55 @@ def main():
         type_id = policy_area_type['id']
         print(f"Found Policy Area tag type (ID: {type_id})")
 
-        # Get all Policy Area tags
+        # Match each bill's tags array against the Policy Area tags by normalized name (so casing
+        # and punctuation differences still match) and link them in one statement; existing
+        # links are skipped by the primary key. normalize_tag_name is defined in schema.sql
+        cur.execute("""
+            INSERT INTO bill_tags (bill_id, tag_id)
+            SELECT b.id, t.id
+            FROM bills b
+            CROSS JOIN LATERAL unnest(b.tags) AS raw(tag)
+            JOIN tags t ON t.type_id = %s AND t.normalized_name = normalize_tag_name(trim(raw.tag))
+            WHERE b.tags IS NOT NULL
+            ON CONFLICT (bill_id, tag_id) DO NOTHING
+        """, (type_id,))
+        total_links = cur.rowcount
+
+        # Fall back to fuzzy matching for the remaining tags (e.g. near-duplicate spellings),
+        # deciding once per distinct tag rather than per bill
         cur.execute("""
-            SELECT id, name 
-            FROM tags 
-            WHERE type_id = %s
+            SELECT DISTINCT trim(raw.tag) AS tag, normalize_tag_name(trim(raw.tag)) AS normalized_name
+            FROM bills b
+            CROSS JOIN LATERAL unnest(b.tags) AS raw(tag)
+            WHERE NOT EXISTS (
+                SELECT 1 FROM tags t
+                WHERE t.type_id = %s AND t.normalized_name = normalize_tag_name(trim(raw.tag))
+            )
         """, (type_id,))
-        policy_area_tags = {row['name']: row['id'] for row in cur.fetchall()}
-        print(f"Found {len(policy_area_tags)} Policy Area tags")
+        unmatched_tags = cur.fetchall()
 
-        # Get all bills with their tags
-        cur.execute("SELECT id, bill_number, tags FROM bills WHERE tags IS NOT NULL")
-        bills = cur.fetchall()
-        print(f"Found {len(bills)} bills with tags")
+        cur.execute("SELECT id, normalized_name FROM tags WHERE type_id = %s", (type_id,))
+        policy_area_tags = {row['normalized_name']: row['id'] for row in cur.fetchall()}
 
-        total_links = 0
-        for bill in bills:
-            if not bill['tags']:
-                continue
+        fuzzy_matches = []
+        for row in unmatched_tags:
+            match = get_close_matches(row['normalized_name'], policy_area_tags, n=1, cutoff=FUZZY_MATCH_CUTOFF)
+            if match:
+                fuzzy_matches.append((row['tag'], policy_area_tags[match[0]]))
+                print(f"Matched tag '{row['tag']}' to Policy Area '{match[0]}'")
 
-            # For each tag in the bill's tags array
-            for tag in bill['tags']:
-                tag = tag.strip()  # Remove any leading/trailing whitespace
-                if tag in policy_area_tags:
-                    # Check if relationship already exists
-                    cur.execute("""
-                        SELECT 1 FROM bill_tags 
-                        WHERE bill_id = %s AND tag_id = %s
-                    """, (bill['id'], policy_area_tags[tag]))
-                    
-                    if not cur.fetchone():
-                        # Create new relationship
-                        cur.execute("""
-                            INSERT INTO bill_tags (bill_id, tag_id)
-                            VALUES (%s, %s)
-                        """, (bill['id'], policy_area_tags[tag]))
-                        total_links += 1
-                        print(f"Linked bill {bill['bill_number']} to tag '{tag}'")
+        if fuzzy_matches:
+            created = execute_values(cur, """
+                INSERT INTO bill_tags (bill_id, tag_id)
+                SELECT DISTINCT b.id, m.tag_id
+                FROM (VALUES %s) AS m (tag, tag_id)
+                JOIN bills b ON EXISTS (
+                    SELECT 1 FROM unnest(b.tags) AS raw(tag) WHERE trim(raw.tag) = m.tag
+                )
+                ON CONFLICT (bill_id, tag_id) DO NOTHING
+                RETURNING bill_id
+            """, fuzzy_matches, template="(%s, %s::integer)", page_size=1000, fetch=True)
+            total_links += len(created)
 
         # Commit all changes
         conn.commit()
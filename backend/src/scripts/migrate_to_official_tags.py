@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 import os
+from functools import lru_cache
 
 # Database connection string
 DB_CONNECTION_STRING = "postgresql://localhost/project_tacitus_test"
@@ -41,14 +42,17 @@ OFFICIAL_POLICY_AREAS = [
     'Water Resources Development'
 ]
 
+# Single-character substitutions applied in one pass by normalization
+_TAG_TRANS = str.maketrans({' ': '_', ',': '_', '-': '_'})
+
+@lru_cache(maxsize=4096)
 def normalize_name(name):
     """Convert a name to its normalized form (lowercase, underscores for spaces and special chars)"""
-    return name.lower().replace(' ', '_').replace(',', '_').replace('&', 'and').replace('-', '_')
+    return name.lower().translate(_TAG_TRANS).replace('&', 'and')
 
 def main():
-    import sys
-    sys.stdout.reconfigure(line_buffering=True)
-    print("Starting tag migration process...", flush=True)
+    print("Starting tag migration process...")
+    # Flush before connecting so progress shows up even if the connection hangs
     print(f"Connecting to database: {DB_CONNECTION_STRING}", flush=True)
     try:
         conn = psycopg2.connect(DB_CONNECTION_STRING)
@@ -76,19 +80,19 @@ def main():
 
         # Insert all official policy areas
         print("\nInserting official policy areas...")
-        for area in OFFICIAL_POLICY_AREAS:
-            normalized_name = normalize_name(area)
-            cur.execute("""
-                INSERT INTO tags (type_id, name, normalized_name, description)
-                VALUES (%s, %s, %s, %s)
-                ON CONFLICT (type_id, normalized_name) 
-                DO UPDATE SET 
-                    name = EXCLUDED.name,
-                    description = EXCLUDED.description
-                RETURNING id, name;
-            """, (type_id, area, normalized_name, f'Bills related to {area}'))
-            tag = cur.fetchone()
-            print(f"Processed tag: {tag['name']} (ID: {tag['id']})", flush=True)
+        processed_tags = execute_values(cur, """
+            INSERT INTO tags (type_id, name, normalized_name, description)
+            VALUES %s
+            ON CONFLICT (type_id, normalized_name) 
+            DO UPDATE SET 
+                name = EXCLUDED.name,
+                description = EXCLUDED.description
+            RETURNING id, name
+        """, [
+            (type_id, area, normalize_name(area), f'Bills related to {area}')
+            for area in OFFICIAL_POLICY_AREAS
+        ], fetch=True)
+        print('\n'.join(f"Processed tag: {tag['name']} (ID: {tag['id']})" for tag in processed_tags))
 
         # Update bill_tags relationships for each mapping
         print("\nUpdating bill_tags relationships...")
@@ -117,12 +121,12 @@ def main():
                     RETURNING bill_id
                 """, (new_tag['id'], old_tag['id']))
                 updated_rows = cur.fetchall()
-                print(f"Migrated {len(updated_rows)} bills from '{old_tag['name']}' to '{new_tag['name']}'", flush=True)
+                print(f"Migrated {len(updated_rows)} bills from '{old_tag['name']}' to '{new_tag['name']}'")
 
                 # Delete old tag if it's different from the new one
                 if old_normalized_name != new_normalized_name:
                     cur.execute("DELETE FROM tags WHERE id = %s", (old_tag['id'],))
-                    print(f"Deleted old tag: {old_tag['name']}", flush=True)
+                    print(f"Deleted old tag: {old_tag['name']}")
 
         # Clean up any remaining non-official Policy Area tags
         cur.execute("""
@@ -133,13 +137,12 @@ def main():
         """, (type_id, tuple(normalize_name(area) for area in OFFICIAL_POLICY_AREAS)))
         deleted_tags = cur.fetchall()
         if deleted_tags:
-            print("\nCleaned up non-official tags:", flush=True)
-            for tag in deleted_tags:
-                print(f"- {tag['name']}", flush=True)
+            print("\nCleaned up non-official tags:")
+            print('\n'.join(f"- {tag['name']}" for tag in deleted_tags))
 
         # Commit all changes
         conn.commit()
-        print("\nMigration completed successfully!", flush=True)
+        print("\nMigration completed successfully!")
 
     except Exception as e:
         conn.rollback()
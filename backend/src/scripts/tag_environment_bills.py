@@ -12,99 +12,50 @@ def main():
     cur = conn.cursor(cursor_factory=RealDictCursor)
 
     try:
-        # Get the Environment tag ID
+        # Get the Environment and Healthcare tag IDs in one query
         cur.execute("""
-            SELECT id 
+            SELECT id, normalized_name 
             FROM tags 
-            WHERE normalized_name = 'environment' 
+            WHERE normalized_name IN ('environment', 'healthcare') 
             AND type_id = (SELECT id FROM tag_types WHERE name = 'Policy Area')
         """)
-        environment_tag = cur.fetchone()
+        tag_ids = {row['normalized_name']: row['id'] for row in cur.fetchall()}
         
-        if not environment_tag:
+        if 'environment' not in tag_ids:
             print("Error: Environment tag not found in the database")
             return
-            
-        environment_tag_id = environment_tag['id']
-        print(f"Found Environment tag with ID: {environment_tag_id}")
-
-        # Find bills with environment-related tags
-        cur.execute("""
-            SELECT id, bill_number, tags 
-            FROM bills 
-            WHERE tags && ARRAY['Public Lands and Natural Resources', 'Environmental Protection']
-        """)
-        env_bills = cur.fetchall()
-        
-        print(f"Found {len(env_bills)} bills with environment-related tags")
-
-        # Add Environment tag to these bills
-        for bill in env_bills:
-            # Check if the bill already has this tag
-            cur.execute("""
-                SELECT 1 
-                FROM bill_tags 
-                WHERE bill_id = %s AND tag_id = %s
-            """, (bill['id'], environment_tag_id))
-            
-            if not cur.fetchone():
-                # Add the tag if it doesn't exist
-                cur.execute("""
-                    INSERT INTO bill_tags (bill_id, tag_id)
-                    VALUES (%s, %s)
-                """, (bill['id'], environment_tag_id))
-                print(f"Added Environment tag to bill {bill['bill_number']}")
-            else:
-                print(f"Bill {bill['bill_number']} already has Environment tag")
-
-        # Get the Healthcare tag ID
-        cur.execute("""
-            SELECT id 
-            FROM tags 
-            WHERE normalized_name = 'healthcare' 
-            AND type_id = (SELECT id FROM tag_types WHERE name = 'Policy Area')
-        """)
-        healthcare_tag = cur.fetchone()
-        
-        if not healthcare_tag:
+        if 'healthcare' not in tag_ids:
             print("Error: Healthcare tag not found in the database")
             return
             
-        healthcare_tag_id = healthcare_tag['id']
+        environment_tag_id = tag_ids['environment']
+        healthcare_tag_id = tag_ids['healthcare']
+        print(f"Found Environment tag with ID: {environment_tag_id}")
         print(f"Found Healthcare tag with ID: {healthcare_tag_id}")
 
-        # Find bills with health-related tags (case insensitive)
+        # Tag bills with environment-related tags; bills that already have it are skipped by the primary key
+        cur.execute("""
+            INSERT INTO bill_tags (bill_id, tag_id)
+            SELECT b.id, %s
+            FROM bills b
+            WHERE b.tags && ARRAY['Public Lands and Natural Resources', 'Environmental Protection']
+            ON CONFLICT (bill_id, tag_id) DO NOTHING
+        """, (environment_tag_id,))
+        print(f"Added Environment tag to {cur.rowcount} bills")
+
+        # Tag bills with health-related tags (case insensitive)
         cur.execute("""
-            SELECT id, bill_number, tags 
-            FROM bills 
+            INSERT INTO bill_tags (bill_id, tag_id)
+            SELECT b.id, %s
+            FROM bills b
             WHERE EXISTS (
                 SELECT 1 
-                FROM unnest(tags) tag 
-                WHERE tag ILIKE '%health%'
+                FROM unnest(b.tags) tag 
+                WHERE tag ILIKE '%%health%%'
             )
-        """)
-        health_bills = cur.fetchall()
-        
-        print(f"Found {len(health_bills)} bills with health-related tags")
-
-        # Add Healthcare tag to these bills
-        for bill in health_bills:
-            # Check if the bill already has this tag
-            cur.execute("""
-                SELECT 1 
-                FROM bill_tags 
-                WHERE bill_id = %s AND tag_id = %s
-            """, (bill['id'], healthcare_tag_id))
-            
-            if not cur.fetchone():
-                # Add the tag if it doesn't exist
-                cur.execute("""
-                    INSERT INTO bill_tags (bill_id, tag_id)
-                    VALUES (%s, %s)
-                """, (bill['id'], healthcare_tag_id))
-                print(f"Added Healthcare tag to bill {bill['bill_number']}")
-            else:
-                print(f"Bill {bill['bill_number']} already has Healthcare tag")
+            ON CONFLICT (bill_id, tag_id) DO NOTHING
+        """, (healthcare_tag_id,))
+        print(f"Added Healthcare tag to {cur.rowcount} bills")
 
         # Commit all changes
         conn.commit()
@@ -22,7 +22,7 @@ from .helpers import (
     get_sort_params,
     build_pagination_result,
     serialize_dates,
-    build_filter_clause,
+    build_predicate_clause,
     get_logger
 )
 
@@ -1,17 +1,41 @@
 import psycopg2
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
 import logging
+import threading
 from flask import current_app
 from contextlib import contextmanager
+from .exceptions import DatabaseError
+
+# Connections kept open for reuse across requests; created on first use.
+# ThreadedConnectionPool.getconn() raises instead of waiting once DB_POOL_MAX
+# connections are checked out, so the semaphore makes extra requests queue.
+_pool = None
+_pool_slots = None
+_pool_lock = threading.Lock()
+
+def _get_pool():
+    """Return the shared connection pool, creating it from the app config on first use"""
+    global _pool, _pool_slots
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                maxconn = current_app.config.get('DB_POOL_MAX', 10)
+                _pool_slots = threading.BoundedSemaphore(maxconn)
+                _pool = ThreadedConnectionPool(
+                    minconn=1,
+                    maxconn=maxconn,
+                    dsn=current_app.config['DB_CONNECTION_STRING']
+                )
+                logging.info("Created database connection pool")
+    return _pool
 
 def get_db_connection():
     """Create and return a database connection"""
-    connection_string = current_app.config['DB_CONNECTION_STRING']
-    logging.info(f"Connecting to database with connection string: {connection_string}")
+    # The connection string may carry credentials, so it is never logged
+    logging.debug("Connecting to database")
     try:
-        conn = psycopg2.connect(connection_string)
-        logging.info("Successfully connected to database")
-        return conn
+        return psycopg2.connect(current_app.config['DB_CONNECTION_STRING'])
     except Exception as e:
         logging.error(f"Failed to connect to database: {str(e)}")
         raise
@@ -19,7 +43,7 @@ def get_db_connection():
 @contextmanager
 def get_db_cursor(commit=False):
     """
-    Context manager that provides a database cursor and handles connections.
+    Context manager that provides a database cursor on a pooled connection.
     
     Args:
         commit (bool): Whether to commit the transaction before closing
@@ -32,9 +56,15 @@ def get_db_cursor(commit=False):
         with get_db_cursor(commit=True) as cur:
             cur.execute("INSERT INTO table VALUES (%s)", [value])
     """
+    pool = _get_pool()
+    if not _pool_slots.acquire(timeout=current_app.config.get('DB_POOL_TIMEOUT', 30)):
+        logging.error("Timed out waiting for a database connection")
+        raise DatabaseError("Database is busy, please retry", status_code=503)
+    
     conn = None
+    cursor = None
     try:
-        conn = get_db_connection()
+        conn = pool.getconn()
         cursor = conn.cursor(cursor_factory=RealDictCursor)
         yield cursor
         if commit:
@@ -45,10 +75,20 @@ def get_db_cursor(commit=False):
         logging.error(f"Database error: {str(e)}")
         raise
     finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            conn.close()
+        try:
+            if cursor:
+                cursor.close()
+            if conn:
+                # End any open read transaction so the connection goes back to the pool idle;
+                # broken connections are discarded rather than reused
+                if not conn.closed:
+                    try:
+                        conn.rollback()
+                    except psycopg2.Error:
+                        pass
+                pool.putconn(conn, close=bool(conn.closed))
+        finally:
+            _pool_slots.release()
 
 @contextmanager
 def transaction():
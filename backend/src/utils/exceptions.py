@@ -11,7 +11,9 @@ class AppError(Exception):
     
     def to_dict(self):
         """Convert exception to dictionary for JSON response"""
-        result = dict(self.payload or {})
+        if not self.payload:
+            return {'error': self.message}
+        result = dict(self.payload)
         result['error'] = self.message
         return result
 
@@ -1,16 +1,32 @@
+import sys
 import json
 import logging
+from functools import lru_cache
 from datetime import date, datetime
 from flask import request
 from typing import Dict, List, Any, Tuple, Optional, Union
+from .exceptions import ValidationError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Accepted sort directions
+SORT_DIRECTIONS = frozenset(('asc', 'desc'))
+
+# Shared fallback handler for loggers created before (or without) root logging config
+_LOG_HANDLER = logging.StreamHandler()
+_LOG_HANDLER.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
 
 def parse_json_field(value, default=None):
     """Safely parse a JSON field, returning default if parsing fails"""
     if value is None:
         return default
     try:
-        if isinstance(value, str):
-            return json.loads(value)
+        if isinstance(value, (str, bytes)):
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so one handler covers both
+            return orjson.loads(value) if orjson is not None else json.loads(value)
         return value  # Already parsed by psycopg2
     except (json.JSONDecodeError, TypeError):
         return default
@@ -27,28 +43,39 @@ def validate_pagination_params(page=None, per_page=None, max_per_page=100) -> Tu
     Returns:
         tuple: (page, per_page) with validated values
     """
-    try:
-        page = int(page) if page is not None else 1
-        if page < 1:
-            page = 1
-    except (ValueError, TypeError):
-        page = 1
-        
-    try:
-        per_page = int(per_page) if per_page is not None else 20
-        if per_page < 1:
-            per_page = 20
-        if per_page > max_per_page:
-            per_page = max_per_page
-    except (ValueError, TypeError):
-        per_page = 20
-        
+    page = _to_pos_int(page, 1)
+    per_page = _to_pos_int(per_page, 20, max_per_page)
     return page, per_page
 
+def _to_pos_int(value, default: int, maximum: Optional[int] = None) -> int:
+    """
+    Coerce a query parameter to a positive int, falling back to default when it is
+    missing, not a number or less than 1, and capping it at maximum if given
+    """
+    # Query args arrive as strings; plain digits skip the exception path entirely
+    if value is None:
+        number = default
+    elif isinstance(value, str) and value.isdecimal():
+        number = int(value)
+    elif isinstance(value, int):
+        number = value
+    else:
+        try:
+            number = int(value)
+        except (ValueError, TypeError):
+            number = default
+    
+    if number < 1:
+        number = default
+    return min(number, maximum) if maximum is not None else number
+
 def get_pagination_params(default_per_page=100, max_per_page=500) -> Dict[str, int]:
     """
     Extract and validate pagination parameters from request
     
+    An explicit 'offset' query parameter takes precedence over 'page'; page is then
+    the page containing that offset.
+    
     Returns:
         dict: Dictionary with validated 'page', 'per_page', and 'offset' values
     """
@@ -56,7 +83,14 @@ def get_pagination_params(default_per_page=100, max_per_page=500) -> Dict[str, i
     per_page = request.args.get('per_page', default_per_page)
     
     page, per_page = validate_pagination_params(page, per_page, max_per_page)
-    offset = (page - 1) * per_page
+    
+    # isdecimal() only accepts plain digits, so a supplied offset is never negative
+    raw_offset = request.args.get('offset')
+    if raw_offset is not None and raw_offset.isdecimal():
+        offset = int(raw_offset)
+        page = offset // per_page + 1
+    else:
+        offset = (page - 1) * per_page
     
     return {
         'page': page,
@@ -77,7 +111,7 @@ def validate_sort_params(
     Args:
         sort_key: Field to sort by
         sort_direction: Direction to sort ('asc' or 'desc')
-        allowed_keys: List of allowed sort keys
+        allowed_keys: Allowed sort keys; pass a frozenset to avoid converting on every call
         default_key: Default key to sort by if sort_key is invalid
         default_direction: Default direction if sort_direction is invalid
         
@@ -85,14 +119,21 @@ def validate_sort_params(
         tuple: (sort_key, sort_direction) with validated values
     """
     if not allowed_keys:
-        allowed_keys = [default_key]
+        allowed_keys = frozenset((default_key,))
+    elif not isinstance(allowed_keys, frozenset):
+        allowed_keys = frozenset(allowed_keys)
         
-    # Validate sort key
-    if sort_key not in allowed_keys:
+    # Validate sort key; whitelisted request strings are interned so later
+    # comparisons and cache-key hashing reuse the canonical object
+    if sort_key in allowed_keys:
+        sort_key = sys.intern(sort_key)
+    else:
         sort_key = default_key
         
     # Validate sort direction
-    if sort_direction not in ['asc', 'desc']:
+    if sort_direction in SORT_DIRECTIONS:
+        sort_direction = sys.intern(sort_direction)
+    else:
         sort_direction = default_direction
         
     return sort_key, sort_direction
@@ -133,7 +174,8 @@ def build_pagination_result(items, total_count, page, per_page) -> Dict[str, Any
     Returns:
         dict: Standardized pagination result
     """
-    total_pages = (total_count + per_page - 1) // per_page if per_page > 0 else 0
+    # Ceiling division; validate_pagination_params guarantees per_page >= 1 for API callers
+    total_pages = -(-total_count // per_page) if per_page > 0 else 0
     
     return {
         'items': items,
@@ -157,81 +199,99 @@ def serialize_dates(data, date_fields=None) -> Any:
     if not date_fields:
         return data
         
-    if isinstance(data, dict):
-        for field in date_fields:
-            if field in data and data[field]:
-                if isinstance(data[field], (date, datetime)):
-                    data[field] = data[field].isoformat()
-    elif isinstance(data, list):
-        for item in data:
-            serialize_dates(item, date_fields)
+    date_types = (date, datetime)
+    # Walk nested lists with an explicit stack; rows are usually RealDictRow, a dict subclass
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            for field in date_fields:
+                value = item.get(field)
+                if value and isinstance(value, date_types):
+                    item[field] = value.isoformat()
+        elif isinstance(item, list):
+            stack.extend(item)
             
     return data
 
-def build_filter_clause(filters: Dict[str, Any]) -> Tuple[str, List[Any]]:
+# SQL for each predicate operator accepted by build_predicate_clause
+PREDICATE_SQL = {
+    'eq': '{col} = %s',
+    'ne': '{col} <> %s',
+    'gt': '{col} > %s',
+    'gte': '{col} >= %s',
+    'lt': '{col} < %s',
+    'lte': '{col} <= %s',
+    'like': 'LOWER({col}) LIKE LOWER(%s)',
+    'in': '{col} = ANY(%s)',
+    'between': '{col} BETWEEN %s AND %s'
+}
+
+def build_predicate_clause(predicates: Dict[str, Dict[str, Any]],
+                           allowed_columns: frozenset) -> Tuple[str, List[Any]]:
     """
-    Build a SQL WHERE clause from a dictionary of filters
+    Build a SQL WHERE clause from explicit column predicates
+    
+    Operators are given explicitly rather than inferred from the value, and
+    columns are checked against a whitelist. Predicates whose value is None, an
+    empty string or an empty list are dropped, so absent filters simply disappear.
     
     Args:
-        filters: Dictionary mapping column names to filter values
-                Each value can be:
-                - A string (exact match or LIKE with % wildcards)
-                - A tuple ('operator', value) for custom operators
-                - A list [val1, val2, ...] for IN operator
+        predicates: Dictionary mapping column names to {operator: value}, with
+                    operators from PREDICATE_SQL ('in' takes a list)
+        allowed_columns: Columns that may be filtered on
                 
     Returns:
         tuple: (WHERE clause as string, list of parameter values)
         
+    Raises:
+        ValidationError: If a column or operator is not allowed
+        
     Example:
-        filters = {
-            'status': 'active',                     # status = 'active'
-            'name': '%john%',                       # name LIKE '%john%'
-            'age': ('>', 21),                       # age > 21
-            'state': ('IN', ['CA', 'NY', 'TX']),    # state IN ('CA', 'NY', 'TX')
-            'created_at': ('BETWEEN', ('2020-01-01', '2020-12-31'))
-        }
-    """
-    clauses = []
+        build_predicate_clause({
+            'status': {'eq': 'active'},                 # status = 'active'
+            'name': {'like': '%john%'},                 # LOWER(name) LIKE LOWER('%john%')
+            'state': {'in': ['CA', 'NY']},              # state = ANY(ARRAY['CA', 'NY'])
+            'age': {'gte': 21, 'lt': 65}                # age >= 21 AND age < 65
+        }, frozenset(('status', 'name', 'state', 'age')))
+    """
+    signature = []
     params = []
     
-    for col, value in filters.items():
-        if value is None or value == '':
-            continue
+    for col, predicate in predicates.items():
+        if col not in allowed_columns:
+            raise ValidationError(f"Filtering on '{col}' is not supported")
+        col = sys.intern(col)
             
-        if isinstance(value, tuple) and len(value) == 2:
-            operator, val = value
-            operator = operator.upper()
-            
-            if operator == 'IN' and isinstance(val, list):
-                if not val:  # Empty list
-                    continue
-                placeholders = ', '.join(['%s'] * len(val))
-                clauses.append(f"{col} IN ({placeholders})")
-                params.extend(val)
-            elif operator == 'BETWEEN' and isinstance(val, tuple) and len(val) == 2:
-                clauses.append(f"{col} BETWEEN %s AND %s")
-                params.extend(val)
-            else:
-                clauses.append(f"{col} {operator} %s")
-                params.append(val)
-        elif isinstance(value, list):
-            if not value:  # Empty list
+        for op, value in predicate.items():
+            if value is None or value == '' or (op == 'in' and not value):
                 continue
-            placeholders = ', '.join(['%s'] * len(value))
-            clauses.append(f"{col} IN ({placeholders})")
-            params.extend(value)
-        elif isinstance(value, str) and '%' in value:
-            clauses.append(f"LOWER({col}) LIKE LOWER(%s)")
-            params.append(value)
-        else:
-            clauses.append(f"{col} = %s")
-            params.append(value)
-    
-    if not clauses:
+                
+            if op == 'in':
+                # Bound as a single array, so the SQL text is the same for any list length
+                signature.append((col, op))
+                params.append(list(value))
+            elif op == 'between':
+                if len(value) != 2:
+                    raise ValidationError(f"'between' filter on '{col}' needs exactly two values")
+                signature.append((col, op))
+                params.extend(value)
+            elif op in PREDICATE_SQL:
+                signature.append((col, op))
+                params.append(value)
+            else:
+                raise ValidationError(f"Unsupported filter operator '{op}'")
+    
+    if not signature:
         return "", []
         
-    where_clause = " WHERE " + " AND ".join(clauses)
-    return where_clause, params
+    return _compile_predicates(tuple(signature)), params
+
+@lru_cache(maxsize=512)
+def _compile_predicates(signature: Tuple) -> str:
+    """Build the WHERE clause for a predicate signature of (column, operator) pairs"""
+    clauses = [PREDICATE_SQL[op].format(col=col) for col, op in signature]
+    return " WHERE " + " AND ".join(clauses)
 
 def get_logger(name):
     """
@@ -244,9 +304,8 @@ def get_logger(name):
         Logger: Configured logger instance
     """
     logger = logging.getLogger(name)
-    if not logger.handlers:
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+    # Once the root logger is configured, propagation handles output; adding a
+    # handler here as well would print every record twice
+    if not logger.hasHandlers():
+        logger.addHandler(_LOG_HANDLER)
     return logger
\ No newline at end of file
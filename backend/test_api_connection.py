@@ -6,6 +6,8 @@ Simple script to test the connection to the Congress.gov API.
 import os
 import sys
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 from dotenv import load_dotenv
 
@@ -22,6 +24,14 @@ if not API_KEY:
 BASE_API_URL = "https://api.congress.gov/v3"
 ENDPOINT = "bill"
 
+# Shared keep-alive session; retries transient failures and rate limiting with backoff
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+))
+
 def test_api_connection():
     """Test the connection to the Congress.gov API."""
     url = f"{BASE_API_URL}/{ENDPOINT}"
@@ -34,7 +44,7 @@ def test_api_connection():
     
     print(f"Making GET request to {url}")
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = SESSION.get(url, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
         print("API connection successful!")
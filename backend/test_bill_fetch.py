@@ -5,30 +5,49 @@ Simplified bill fetching script for testing.
 
 import os
 import sys
-import requests
-import json
 import argparse
 from datetime import datetime
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
-
-# Get API key from environment
-API_KEY = os.getenv('CONGRESSGOV_API_KEY')
-if not API_KEY:
-    print("Error: CONGRESSGOV_API_KEY environment variable not found")
-    sys.exit(1)
+# requests and dotenv are imported once arguments are valid, so --help and bad
+# dates exit without loading them
 
 # API configuration
 BASE_API_URL = "https://api.congress.gov/v3"
 ENDPOINT = "bill"
+PAGE_SIZE = 250  # Largest page the API returns
+FETCH_WORKERS = 4  # Pages requested at once when limit spans several pages
+
+_session = None
+
+def get_session():
+    """Shared keep-alive session; retries transient failures and rate limiting with backoff."""
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        _session = requests.Session()
+        _session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+        ))
+    return _session
 
 def fetch_bills(start_date=None, end_date=None, limit=10):
     """Fetch bills from Congress.gov API."""
+    import concurrent.futures
+    import requests
+    try:
+        from orjson import loads as json_loads
+    except ImportError:
+        from json import loads as json_loads
+    
+    session = get_session()
     url = f"{BASE_API_URL}/{ENDPOINT}"
     params = {
-        'api_key': API_KEY,
+        'api_key': os.getenv('CONGRESSGOV_API_KEY'),
         'format': 'json',
         'limit': limit,
         'offset': 0
@@ -40,14 +59,18 @@ def fetch_bills(start_date=None, end_date=None, limit=10):
     if end_date:
         params['toDateTime'] = f"{end_date}T23:59:59Z"
     
+    def fetch_page(offset):
+        page_params = dict(params, offset=offset, limit=min(PAGE_SIZE, limit - offset))
+        response = session.get(url, params=page_params, timeout=10)
+        response.raise_for_status()
+        return json_loads(response.content).get('bills', [])
+    
     print(f"Making GET request to {url} with params: {params}")
     try:
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        # Extract bills
-        bills = data.get('bills', [])
+        # Request every page at once over the shared session; map keeps page order
+        with concurrent.futures.ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            pages = executor.map(fetch_page, range(0, limit, PAGE_SIZE))
+            bills = [bill for page in pages for bill in page]
         print(f"Successfully fetched {len(bills)} bills")
         
         # Print bill details
@@ -77,6 +100,24 @@ def main():
     parser.add_argument('--limit', type=int, default=10, help='Maximum number of bills to fetch')
     args = parser.parse_args()
     
+    # Reject malformed dates before anything is loaded or requested
+    for option, value in (('--start-date', args.start_date), ('--end-date', args.end_date)):
+        if value:
+            try:
+                datetime.strptime(value, '%Y-%m-%d')
+            except ValueError:
+                parser.error(f"{option} must be in YYYY-MM-DD format, got '{value}'")
+    
+    from dotenv import load_dotenv
+    
+    # Load environment variables
+    load_dotenv()
+    
+    # Get API key from environment
+    if not os.getenv('CONGRESSGOV_API_KEY'):
+        print("Error: CONGRESSGOV_API_KEY environment variable not found")
+        sys.exit(1)
+    
     # Fetch bills
     fetch_bills(args.start_date, args.end_date, args.limit)
 
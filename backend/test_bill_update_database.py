@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Script to test that malformed bill records don't abort a bill_fetch_core batch.
+
+Runs update_database against an in-memory cursor, so no database is needed.
+"""
+
+import os
+import sys
+
+# Add the congressgov package and the bill_fetch scripts to the path
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'python')
+sys.path.append(SRC_DIR)
+sys.path.append(os.path.join(SRC_DIR, 'congressgov', 'bill_fetch'))
+
+try:
+    from congressgov.bill_fetch.bill_fetch_core import update_database
+except ImportError as e:
+    print(f"Error: Could not import bill_fetch_core module: {str(e)}")
+    sys.exit(1)
+
+class RecordingCursor:
+    """Minimal cursor: no bill exists yet, and every insert returns a new id."""
+
+    def __init__(self):
+        self.inserted = []
+        self._result = None
+
+    def execute(self, query, params=None):
+        if query.lstrip().startswith('INSERT INTO bills'):
+            self.inserted.append(params)
+            self._result = (len(self.inserted),)
+        else:
+            self._result = None
+
+    def fetchone(self):
+        return self._result
+
+def bill(number, **fields):
+    """A list-endpoint bill record with the given overrides."""
+    record = {
+        'type': 'HR',
+        'number': number,
+        'title': f'Test bill {number}',
+        'congress': 118,
+        'introducedDate': '2023-01-09',
+        'latestAction': {'text': 'Referred to the Committee on Ways and Means.', 'actionDate': '2023-01-09'}
+    }
+    record.update(fields)
+    return {'bill': record}
+
+def main():
+    bills = [
+        bill('1'),
+        bill('2', latestAction=None),  # API sends null for bills without actions
+        'not a bill record',           # Non-dict entry
+        {'bill': [1, 2]},              # Historical list form with non-dict entries
+        bill('3', policyArea=None)
+    ]
+
+    cursor = RecordingCursor()
+    # Call the undecorated function so no database connection is opened
+    stats = update_database.__wrapped__(cursor, bills)
+    inserted = [params[0] for params in cursor.inserted]
+
+    success = True
+    if inserted != ['HR1', 'HR2', 'HR3']:
+        print(f"Error: expected HR1, HR2 and HR3 to be written, got {inserted}")
+        success = False
+    if stats['inserted'] != 3 or stats['error'] != 2:
+        print(f"Error: expected 3 inserted and 2 errors, got {stats}")
+        success = False
+
+    if success:
+        print(f"Success: malformed records were counted as errors without aborting the batch ({stats})")
+
+    # Exit with appropriate status code
+    sys.exit(0 if success else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Script to test that the regex bio extraction matches the BeautifulSoup path.
+
+Usage:
+    python test_bio_extraction.py [saved_page.html ...]
+
+Without arguments, the sample page in test_data/ is checked. Pass pages saved from
+bioguide.congress.gov (driver.page_source) to check real markup.
+"""
+
+import os
+import sys
+from bs4 import BeautifulSoup
+
+# Add the congressgov package to the path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'python'))
+
+try:
+    from congressgov.members_fetch.member_bio import extract_bio_fast
+except ImportError as e:
+    print(f"Error: Could not import member_bio module: {str(e)}")
+    sys.exit(1)
+
+SAMPLE_PAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_data', 'bioguide_bio_sample.html')
+
+# A nested div would cut the lazy regex match short, so the fast path must defer
+NESTED_DIV_PAGE = """
+<div class="c-tabs-container__page c-tabs-container__page--active">
+  <div class="u-inline-paragraphs"><p>First paragraph.</p><div class="note">Inner note.</div><p>Last paragraph.</p></div>
+</div>
+"""
+
+def soup_bio_text(html_content):
+    """Bio text as the BeautifulSoup path in MemberBioProcessor.extract_bio_text produces it."""
+    soup = BeautifulSoup(html_content, 'html.parser')
+    bio_element = soup.select_one('.c-tabs-container__page--active .u-inline-paragraphs')
+    return bio_element.get_text(strip=True) if bio_element else None
+
+def check_page(name, html_content):
+    """Compare both extraction paths on one page."""
+    fast_text = extract_bio_fast(html_content)
+    soup_text = soup_bio_text(html_content)
+
+    if fast_text is None:
+        print(f"Skipped: {name} - fast path deferred to BeautifulSoup")
+        return True
+    if fast_text == soup_text:
+        print(f"Success: {name} - both paths produce the same {len(fast_text)} characters")
+        return True
+
+    print(f"Error: {name} - extraction paths differ")
+    print(f"  regex: {fast_text!r}")
+    print(f"  soup:  {soup_text!r}")
+    return False
+
+def main():
+    pages = sys.argv[1:] or [SAMPLE_PAGE]
+    success = True
+
+    for path in pages:
+        with open(path, 'r', encoding='utf-8') as f:
+            success &= check_page(os.path.basename(path), f.read())
+
+    # The fast path must not accept a container with a nested div
+    if extract_bio_fast(NESTED_DIV_PAGE) is not None:
+        print("Error: fast path accepted a biography with a nested div")
+        success = False
+    else:
+        print("Success: nested div deferred to BeautifulSoup")
+
+    # Exit with appropriate status code
+    sys.exit(0 if success else 1)
+
+if __name__ == "__main__":
+    main()
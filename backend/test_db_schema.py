@@ -20,21 +20,34 @@ except ImportError:
         print("Error: Could not import database module")
         sys.exit(1)
 
+# Columns each table is expected to have after the schema update
+EXPECTED_COLUMNS = {
+    'bills': ['last_updated']
+}
+
+def find_missing_columns(cur, table, columns):
+    """Return the expected columns absent from table, in a single catalog lookup."""
+    # pg_attribute is read directly; information_schema.columns is a view joining
+    # several catalogs. to_regclass yields NULL (so no rows) if the table is missing.
+    cur.execute("""
+        SELECT attname
+        FROM pg_attribute
+        WHERE attrelid = to_regclass(%s)
+        AND attname = ANY(%s)
+        AND attnum > 0
+        AND NOT attisdropped
+    """, (table, list(columns)))
+    found = {row[0] for row in cur.fetchall()}
+    return [column for column in columns if column not in found]
+
 def check_bills_table():
     """Check if the bills table has the last_updated column."""
     try:
         with get_db_connection() as conn:
             with conn.cursor() as cur:
-                # Check if the last_updated column exists
-                cur.execute("""
-                    SELECT column_name
-                    FROM information_schema.columns
-                    WHERE table_name = 'bills'
-                    AND column_name = 'last_updated'
-                """)
-                result = cur.fetchone()
+                missing = find_missing_columns(cur, 'bills', EXPECTED_COLUMNS['bills'])
                 
-                if result:
+                if not missing:
                     print("Success: The 'last_updated' column exists in the 'bills' table")
                     return True
                 else: